@@ -1,37 +1,77 @@
-"""Coinbase AgentKit - Framework for enabling AI agents to take actions onchain."""
-
-from .action_providers import (
-    Action,
-    ActionProvider,
-    basename_action_provider,
-    cdp_api_action_provider,
-    cdp_wallet_action_provider,
-    create_action,
-    erc20_action_provider,
-    morpho_action_provider,
-    pyth_action_provider,
-    superfluid_action_provider,
-    twitter_action_provider,
-    wallet_action_provider,
-    weth_action_provider,
-    wow_action_provider,
-)
-from .agentkit import AgentKit, AgentKitConfig
-from .wallet_providers import (
-    CdpWalletProvider,
-    CdpWalletProviderConfig,
-    EthAccountWalletProvider,
-    EthAccountWalletProviderConfig,
-    EvmWalletProvider,
-    WalletProvider,
-)
+"""Coinbase AgentKit - Framework for enabling AI agents to take actions onchain.
+
+Public names are imported on first access, so a bare import stays fast and does not load the
+CDP SDK, web3 or any action provider until they are used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .action_providers import (
+        Action,
+        ActionCachePolicy,
+        ActionProvider,
+        basename_action_provider,
+        cdp_api_action_provider,
+        cdp_wallet_action_provider,
+        create_action,
+        erc20_action_provider,
+        morpho_action_provider,
+        pyth_action_provider,
+        superfluid_action_provider,
+        twitter_action_provider,
+        wallet_action_provider,
+        weth_action_provider,
+        wow_action_provider,
+    )
+    from .agentkit import ActionCall, ActionCallResult, AgentKit, AgentKitConfig
+    from .wallet_providers import (
+        CdpWalletProvider,
+        CdpWalletProviderConfig,
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+        EvmWalletProvider,
+        WalletProvider,
+    )
 
 __version__ = "0.1.0"
 
+_LAZY_IMPORTS = {
+    "AgentKit": ".agentkit",
+    "AgentKitConfig": ".agentkit",
+    "ActionCall": ".agentkit",
+    "ActionCallResult": ".agentkit",
+    "Action": ".action_providers",
+    "ActionCachePolicy": ".action_providers",
+    "ActionProvider": ".action_providers",
+    "create_action": ".action_providers",
+    "basename_action_provider": ".action_providers",
+    "cdp_api_action_provider": ".action_providers",
+    "cdp_wallet_action_provider": ".action_providers",
+    "erc20_action_provider": ".action_providers",
+    "morpho_action_provider": ".action_providers",
+    "pyth_action_provider": ".action_providers",
+    "superfluid_action_provider": ".action_providers",
+    "twitter_action_provider": ".action_providers",
+    "wallet_action_provider": ".action_providers",
+    "weth_action_provider": ".action_providers",
+    "wow_action_provider": ".action_providers",
+    "WalletProvider": ".wallet_providers",
+    "CdpWalletProvider": ".wallet_providers",
+    "CdpWalletProviderConfig": ".wallet_providers",
+    "EvmWalletProvider": ".wallet_providers",
+    "EthAccountWalletProvider": ".wallet_providers",
+    "EthAccountWalletProviderConfig": ".wallet_providers",
+}
+
 __all__ = [
     "AgentKit",
     "AgentKitConfig",
+    "ActionCall",
+    "ActionCallResult",
     "Action",
+    "ActionCachePolicy",
     "ActionProvider",
     "create_action",
     "basename_action_provider",
@@ -52,3 +92,19 @@ __all__ = [
     "weth_action_provider",
     "wow_action_provider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name the first time it is accessed."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package's names, including those not imported yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -0,0 +1,5 @@
+"""ABI utilities for AgentKit."""
+
+from .contract_cache import CompiledFunction, encode_function_data, get_compiled_function
+
+__all__ = ["CompiledFunction", "encode_function_data", "get_compiled_function"]
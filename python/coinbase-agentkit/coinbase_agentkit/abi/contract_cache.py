@@ -0,0 +1,231 @@
+"""Process-wide cache of compiled contract functions."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from eth_abi.exceptions import DecodingError, EncodingError
+from eth_abi.grammar import ABIType, TupleType, parse
+from eth_utils import encode_hex, function_abi_to_4byte_selector, to_bytes, to_text
+from eth_utils.abi import get_abi_output_types, get_aligned_abi_inputs, get_normalized_abi_inputs
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, Web3TypeError
+from web3.types import HexStr
+from web3.utils.abi import get_abi_element
+
+# An unconnected instance, used only for its codec
+_web3 = Web3()
+
+MAX_FINGERPRINTS = 256
+
+_lock = threading.Lock()
+# Least recently used first, so ABIs built per call do not accumulate
+_fingerprints: OrderedDict[int, tuple[list[dict[str, Any]], str]] = OrderedDict()
+_functions: dict[tuple[str, str], "CompiledFunction"] = {}
+
+
+@dataclass(frozen=True)
+class CompiledFunction:
+    """A contract function with its selector and types resolved ahead of time."""
+
+    abi: dict[str, Any]
+    selector: HexStr
+    output_types: tuple[str, ...]
+
+    def encode(self, args: list[Any] | None = None) -> HexStr:
+        """Encode a call to this function, producing the same calldata as web3's encode_abi.
+
+        Args:
+            args (list[Any] | None): Arguments to pass to the function, defaults to empty list
+
+        Returns:
+            HexStr: The calldata, prefixed with the function selector
+
+        """
+        fn_inputs = get_normalized_abi_inputs(self.abi, *(args or []))
+        input_types, aligned_fn_inputs = get_aligned_abi_inputs(self.abi, fn_inputs)
+        normalized = [
+            _normalize_input(parse(input_type), value)
+            for input_type, value in zip(input_types, aligned_fn_inputs, strict=True)
+        ]
+        try:
+            encoded = _web3.codec.encode(input_types, normalized)
+        except EncodingError as e:
+            raise Web3TypeError(
+                "One or more arguments could not be encoded to the necessary ABI type. "
+                f"Expected types are: {', '.join(input_types)}"
+            ) from e
+        return HexStr(self.selector + encoded.hex())
+
+    def decode(self, return_data: bytes) -> Any:
+        """Decode the return data of a call to this function the same way web3's call does.
+
+        Args:
+            return_data (bytes): The raw return data
+
+        Returns:
+            Any: The decoded result, unwrapped if the function has a single output
+
+        Raises:
+            BadFunctionCallOutput: If the return data cannot be decoded
+
+        """
+        try:
+            decoded = _web3.codec.decode(self.output_types, return_data)
+        except DecodingError as e:
+            raise BadFunctionCallOutput(
+                f"Could not decode contract function call to {self.abi['name']} "
+                f"with return data: {return_data!s}, output_types: {self.output_types}"
+            ) from e
+
+        normalized = [
+            _normalize_output(parse(output_type), value)
+            for output_type, value in zip(self.output_types, decoded, strict=True)
+        ]
+        return normalized[0] if len(normalized) == 1 else normalized
+
+
+def _normalize_input(abi_type: ABIType, value: Any) -> Any:
+    """Convert an argument to the value the codec expects, the way web3 does before encoding.
+
+    Addresses are checksummed, hex strings passed for bytes are converted to bytes and bytes
+    passed for strings are decoded.
+
+    Args:
+        abi_type (ABIType): The parsed ABI type of the argument
+        value (Any): The argument
+
+    Returns:
+        Any: The normalized argument
+
+    """
+    if abi_type.is_array:
+        return [_normalize_input(abi_type.item_type, item) for item in value]
+    if isinstance(abi_type, TupleType):
+        return tuple(
+            _normalize_input(component, item)
+            for component, item in zip(abi_type.components, value, strict=True)
+        )
+    if abi_type.base == "address" and isinstance(value, str | bytes):
+        return Web3.to_checksum_address(value)
+    if abi_type.base == "bytes" and isinstance(value, str):
+        return to_bytes(hexstr=value)
+    if abi_type.base == "string" and isinstance(value, bytes):
+        return to_text(value)
+    return value
+
+
+def _normalize_output(abi_type: ABIType, value: Any) -> Any:
+    """Checksum the addresses in a decoded value, the way web3 returns them from a call.
+
+    Args:
+        abi_type (ABIType): The parsed ABI type of the value
+        value (Any): The decoded value
+
+    Returns:
+        Any: The value with checksummed addresses
+
+    """
+    if abi_type.is_array:
+        return [_normalize_output(abi_type.item_type, item) for item in value]
+    if isinstance(abi_type, TupleType):
+        return tuple(
+            _normalize_output(component, item)
+            for component, item in zip(abi_type.components, value, strict=True)
+        )
+    if abi_type.base == "address":
+        return Web3.to_checksum_address(value)
+    return value
+
+
+def abi_fingerprint(abi: list[dict[str, Any]]) -> str:
+    """Get a stable fingerprint of an ABI.
+
+    The fingerprints of the most recently used ABI objects are remembered, so ABIs are
+    expected not to be mutated after first use.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI
+
+    Returns:
+        str: The fingerprint of the ABI
+
+    """
+    with _lock:
+        entry = _fingerprints.get(id(abi))
+        if entry is not None and entry[0] is abi:
+            _fingerprints.move_to_end(id(abi))
+            return entry[1]
+
+    fingerprint = hashlib.sha256(json.dumps(abi, sort_keys=True).encode()).hexdigest()
+    with _lock:
+        # Keep a reference to the ABI so its id cannot be reused by another object
+        _fingerprints[id(abi)] = (abi, fingerprint)
+        _fingerprints.move_to_end(id(abi))
+        while len(_fingerprints) > MAX_FINGERPRINTS:
+            _fingerprints.popitem(last=False)
+    return fingerprint
+
+
+def _compile_function(fn_abi: dict[str, Any]) -> CompiledFunction:
+    return CompiledFunction(
+        abi=fn_abi,
+        selector=encode_hex(function_abi_to_4byte_selector(fn_abi)),
+        output_types=tuple(get_abi_output_types(fn_abi)),
+    )
+
+
+def get_compiled_function(
+    abi: list[dict[str, Any]], function_name: str, args: list[Any] | None = None
+) -> CompiledFunction:
+    """Get a compiled contract function, compiling and caching it on first use.
+
+    Overloaded functions are resolved against the given arguments on every call.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI
+        function_name (str): The name of the function
+        args (list[Any] | None): Arguments used to resolve overloaded functions
+
+    Returns:
+        CompiledFunction: The compiled function
+
+    """
+    key = (abi_fingerprint(abi), function_name)
+    compiled = _functions.get(key)
+    if compiled is not None:
+        return compiled
+
+    candidates = [
+        element
+        for element in abi
+        if element.get("type", "function") == "function" and element.get("name") == function_name
+    ]
+    if len(candidates) != 1:
+        fn_abi = get_abi_element(abi, function_name, *(args or []), abi_codec=_web3.codec)
+        return _compile_function(fn_abi)
+
+    compiled = _compile_function(candidates[0])
+    with _lock:
+        _functions[key] = compiled
+    return compiled
+
+
+def encode_function_data(
+    abi: list[dict[str, Any]], function_name: str, args: list[Any] | None = None
+) -> HexStr:
+    """Encode calldata for a contract function call.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI
+        function_name (str): The name of the function to call
+        args (list[Any] | None): Arguments to pass to the function, defaults to empty list
+
+    Returns:
+        HexStr: The calldata, prefixed with the function selector
+
+    """
+    return get_compiled_function(abi, function_name, args).encode(args)
@@ -1,27 +1,66 @@
-"""Action providers for AgentKit."""
+"""Action providers for AgentKit.
 
+Provider modules are imported on first access so that importing the package does not load
+every provider's dependencies and ABI constants.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .action_cache import ActionCachePolicy
 from .action_decorator import create_action
 from .action_provider import Action, ActionProvider
-from .basename.basename_action_provider import (
-    BasenameActionProvider,
-    basename_action_provider,
-)
-from .cdp.cdp_api_action_provider import CdpApiActionProvider, cdp_api_action_provider
-from .cdp.cdp_wallet_action_provider import CdpWalletActionProvider, cdp_wallet_action_provider
-from .erc20.erc20_action_provider import ERC20ActionProvider, erc20_action_provider
-from .morpho.morpho_action_provider import MorphoActionProvider, morpho_action_provider
-from .pyth.pyth_action_provider import PythActionProvider, pyth_action_provider
-from .superfluid.superfluid_action_provider import (
-    SuperfluidActionProvider,
-    superfluid_action_provider,
-)
-from .twitter.twitter_action_provider import TwitterActionProvider, twitter_action_provider
-from .wallet.wallet_action_provider import WalletActionProvider, wallet_action_provider
-from .weth.weth_action_provider import WethActionProvider, weth_action_provider
-from .wow.wow_action_provider import WowActionProvider, wow_action_provider
+
+if TYPE_CHECKING:
+    from .basename.basename_action_provider import (
+        BasenameActionProvider,
+        basename_action_provider,
+    )
+    from .cdp.cdp_api_action_provider import CdpApiActionProvider, cdp_api_action_provider
+    from .cdp.cdp_wallet_action_provider import (
+        CdpWalletActionProvider,
+        cdp_wallet_action_provider,
+    )
+    from .erc20.erc20_action_provider import ERC20ActionProvider, erc20_action_provider
+    from .morpho.morpho_action_provider import MorphoActionProvider, morpho_action_provider
+    from .pyth.pyth_action_provider import PythActionProvider, pyth_action_provider
+    from .superfluid.superfluid_action_provider import (
+        SuperfluidActionProvider,
+        superfluid_action_provider,
+    )
+    from .twitter.twitter_action_provider import TwitterActionProvider, twitter_action_provider
+    from .wallet.wallet_action_provider import WalletActionProvider, wallet_action_provider
+    from .weth.weth_action_provider import WethActionProvider, weth_action_provider
+    from .wow.wow_action_provider import WowActionProvider, wow_action_provider
+
+_LAZY_IMPORTS = {
+    "BasenameActionProvider": ".basename.basename_action_provider",
+    "basename_action_provider": ".basename.basename_action_provider",
+    "CdpApiActionProvider": ".cdp.cdp_api_action_provider",
+    "cdp_api_action_provider": ".cdp.cdp_api_action_provider",
+    "CdpWalletActionProvider": ".cdp.cdp_wallet_action_provider",
+    "cdp_wallet_action_provider": ".cdp.cdp_wallet_action_provider",
+    "ERC20ActionProvider": ".erc20.erc20_action_provider",
+    "erc20_action_provider": ".erc20.erc20_action_provider",
+    "MorphoActionProvider": ".morpho.morpho_action_provider",
+    "morpho_action_provider": ".morpho.morpho_action_provider",
+    "PythActionProvider": ".pyth.pyth_action_provider",
+    "pyth_action_provider": ".pyth.pyth_action_provider",
+    "SuperfluidActionProvider": ".superfluid.superfluid_action_provider",
+    "superfluid_action_provider": ".superfluid.superfluid_action_provider",
+    "TwitterActionProvider": ".twitter.twitter_action_provider",
+    "twitter_action_provider": ".twitter.twitter_action_provider",
+    "WalletActionProvider": ".wallet.wallet_action_provider",
+    "wallet_action_provider": ".wallet.wallet_action_provider",
+    "WethActionProvider": ".weth.weth_action_provider",
+    "weth_action_provider": ".weth.weth_action_provider",
+    "WowActionProvider": ".wow.wow_action_provider",
+    "wow_action_provider": ".wow.wow_action_provider",
+}
 
 __all__ = [
     "Action",
+    "ActionCachePolicy",
     "ActionProvider",
     "create_action",
     "BasenameActionProvider",
@@ -47,3 +86,19 @@ __all__ = [
     "WowActionProvider",
     "wow_action_provider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a provider module the first time one of its names is accessed."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package's names, including those not imported yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -0,0 +1,196 @@
+"""In-memory cache of read-only action results."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ActionCachePolicy(BaseModel):
+    """How long the result of a read-only action may be reused for identical arguments."""
+
+    ttl: float | None = Field(None, description="Seconds a result is reused for")
+    per_block: bool = Field(
+        False,
+        description="Reuse a result for one block time of the wallet's chain, for chain reads",
+    )
+
+
+class ActionResultCache:
+    """Serves repeated identical calls to read-only actions from memory.
+
+    Results are keyed by action name and arguments and expire after the action's TTL. Any
+    call to an action that is not read-only clears the cache, since it may have changed the
+    state the cached reads describe. Exceptions are not cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): The maximum number of results kept, least recently used first out
+
+        """
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        # Bumped on every clear, so reads that started before it are not stored after it
+        self._generation = 0
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def cached(self, name: str, ttl: float, invoke: Callable) -> Callable:
+        """Wrap an action's invoke function to reuse its results for ttl seconds.
+
+        Args:
+            name (str): The action's name
+            ttl (float): Seconds a result is reused for
+            invoke (Callable): The action's invoke function, taking the arguments dict
+
+        Returns:
+            Callable: The wrapped invoke function
+
+        """
+
+        @wraps(invoke)
+        def cached_invoke(args: dict[str, Any]) -> Any:
+            key = self._key(name, args)
+            hit, result, generation = self._get(key)
+            if hit:
+                return result
+
+            result = invoke(args)
+            self._put(key, ttl, result, generation)
+            return result
+
+        return cached_invoke
+
+    def cached_async(self, name: str, ttl: float, coroutine: Callable) -> Callable:
+        """Wrap an action's coroutine function to reuse its results for ttl seconds.
+
+        Args:
+            name (str): The action's name
+            ttl (float): Seconds a result is reused for
+            coroutine (Callable): The action's coroutine function, taking the arguments dict
+
+        Returns:
+            Callable: The wrapped coroutine function
+
+        """
+
+        @wraps(coroutine)
+        async def cached_coroutine(args: dict[str, Any]) -> Any:
+            key = self._key(name, args)
+            hit, result, generation = self._get(key)
+            if hit:
+                return result
+
+            result = await coroutine(args)
+            self._put(key, ttl, result, generation)
+            return result
+
+        return cached_coroutine
+
+    def invalidating(self, invoke: Callable) -> Callable:
+        """Wrap a mutating action's invoke function to clear the cache once it has run.
+
+        Args:
+            invoke (Callable): The action's invoke function
+
+        Returns:
+            Callable: The wrapped invoke function
+
+        """
+
+        @wraps(invoke)
+        def invalidating_invoke(args: dict[str, Any]) -> Any:
+            try:
+                return invoke(args)
+            finally:
+                # Cleared even on error, a failed action may still have sent a transaction
+                self.clear()
+
+        return invalidating_invoke
+
+    def invalidating_async(self, coroutine: Callable) -> Callable:
+        """Wrap a mutating action's coroutine function to clear the cache once it has run.
+
+        Args:
+            coroutine (Callable): The action's coroutine function
+
+        Returns:
+            Callable: The wrapped coroutine function
+
+        """
+
+        @wraps(coroutine)
+        async def invalidating_coroutine(args: dict[str, Any]) -> Any:
+            try:
+                return await coroutine(args)
+            finally:
+                self.clear()
+
+        return invalidating_coroutine
+
+    def _key(self, name: str, args: dict[str, Any]) -> tuple[str, str]:
+        """Build the cache key of a call.
+
+        Args:
+            name (str): The action's name
+            args (dict[str, Any]): The call's arguments
+
+        Returns:
+            tuple[str, str]: The key
+
+        """
+        return name, json.dumps(args, sort_keys=True, default=str)
+
+    def _get(self, key: tuple[str, str]) -> tuple[bool, Any, int]:
+        """Look up an unexpired result.
+
+        Args:
+            key (tuple[str, str]): The cache key
+
+        Returns:
+            tuple[bool, Any, int]: Whether a result was found, the result, and the current
+                generation to pass to _put
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._entries.pop(key, None)
+                return False, None, self._generation
+
+            self._entries.move_to_end(key)
+            return True, entry[1], self._generation
+
+    def _put(self, key: tuple[str, str], ttl: float, result: Any, generation: int) -> None:
+        """Store a result, unless the cache was cleared since the call started.
+
+        Args:
+            key (tuple[str, str]): The cache key
+            ttl (float): Seconds the result is reused for
+            result (Any): The result
+            generation (int): The generation returned by _get when the call started
+
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+
+            self._entries[key] = (time.monotonic() + ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
@@ -2,22 +2,20 @@
 
 import inspect
 from collections.abc import Callable
+from contextlib import nullcontext
 from functools import wraps
-from typing import Any, TypedDict
+from typing import Any
 
 from pydantic import BaseModel
 
 from ..analytics import RequiredEventData, send_analytics_event
+from ..wallet_providers.sender_scopes import sender_scope
+from ..wallet_providers.wallet_provider import WalletMetadata
+from .action_cache import ActionCachePolicy
+from .action_executor import run_coroutine_sync
 
-
-class WalletMetadata(TypedDict):
-    """Metadata for a wallet."""
-
-    wallet_provider: str
-    wallet_address: str
-    network_id: str
-    chain_id: str
-    protocol_family: str
+# WalletMetadata used to be defined here and is still importable from this module
+__all__ = ["ActionMetadata", "WalletMetadata", "create_action"]
 
 
 class ActionMetadata(BaseModel):
@@ -27,50 +25,104 @@ class ActionMetadata(BaseModel):
     description: str
     args_schema: type[BaseModel] | None
     invoke: Callable
+    ainvoke: Callable | None = None
     wallet_provider: bool = False
+    read_only: bool = False
+    cache: ActionCachePolicy | None = None
+
+
+def create_action(
+    name: str,
+    description: str,
+    schema: type[BaseModel] | None = None,
+    read_only: bool = False,
+    cache: ActionCachePolicy | None = None,
+):
+    """Decorate an action with a name, description, and schema.
+
+    Actions marked read_only do not change any state, so AgentKit.run_actions may run them
+    concurrently with each other and with other actions. A read-only action may also set a
+    cache policy, and AgentKit then reuses its result for identical arguments until it
+    expires or an action that is not read-only runs.
+
+    Actions that take a wallet provider run in their own sender scope, so every transaction
+    they send through a WalletPoolProvider comes from the same account.
 
+    The action may be a regular method or an async def method. A synchronous action can also
+    be given an async implementation, used by Action.ainvoke, with the async_impl decorator
+    the wrapped method exposes:
 
-def create_action(name: str, description: str, schema: type[BaseModel] | None = None):
-    """Decorate an action with a name, description, and schema."""
+        @create_action(name="fetch", description="...", schema=FetchSchema)
+        def fetch(self, args): ...
+
+        @fetch.async_impl
+        async def afetch(self, args): ...
+    """
+    if cache is not None and not read_only:
+        raise ValueError(f"Action {name} must be read_only to set a cache policy")
 
     def decorator(func: Callable) -> Callable:
         signature = inspect.signature(func)
         has_wallet_provider = "wallet_provider" in signature.parameters
+        action_scope = sender_scope if has_wallet_provider else nullcontext
 
         class_name = func.__qualname__.rsplit(".", 1)[0]
         method_name = func.__name__
         prefixed_name = f"{class_name}_{method_name}"
 
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            wallet_metadata = {}
-
-            if has_wallet_provider:
-                network = args[1].get_network()
-                wallet_metadata = WalletMetadata(
-                    wallet_provider=args[1].get_name(),
-                    wallet_address=args[1].get_address(),
-                    network_id=network.network_id or "",
-                    chain_id=network.chain_id or "",
-                    protocol_family=network.protocol_family,
+        def track_invocation(args: tuple[Any, ...]) -> None:
+            try:
+                wallet_metadata = args[1].get_wallet_metadata() if has_wallet_provider else {}
+
+                event_data = RequiredEventData(
+                    name="agent_action_invocation",
+                    action="invoke_action",
+                    component="agent_action",
+                    action_name=prefixed_name,
+                    class_name=class_name,
+                    method_name=method_name,
+                    **wallet_metadata,
                 )
 
-            event_data = RequiredEventData(
-                name="agent_action_invocation",
-                action="invoke_action",
-                component="agent_action",
-                action_name=prefixed_name,
-                class_name=class_name,
-                method_name=method_name,
-                **wallet_metadata,
-            )
-
-            try:
                 send_analytics_event(event_data)
             except Exception as e:
                 print(f"Warning: Failed to track action invocation: {e}")
 
-            return func(*args, **kwargs)
+        def track_async(async_func: Callable) -> Callable:
+            @wraps(async_func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with action_scope():
+                    track_invocation(args)
+                    return await async_func(*args, **kwargs)
+
+            return async_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            wrapper = track_async(func)
+            wrapper._action_metadata = ActionMetadata(
+                name=prefixed_name,
+                description=description,
+                args_schema=schema,
+                invoke=lambda *args, **kwargs: run_coroutine_sync(wrapper(*args, **kwargs)),
+                ainvoke=wrapper,
+                wallet_provider=has_wallet_provider,
+                read_only=read_only,
+                cache=cache,
+            )
+            return wrapper
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with action_scope():
+                track_invocation(args)
+                return func(*args, **kwargs)
+
+        def async_impl(async_func: Callable) -> Callable:
+            if not inspect.iscoroutinefunction(async_func):
+                raise TypeError(f"The async implementation of {prefixed_name} must be async def")
+
+            wrapper._action_metadata.ainvoke = track_async(async_func)
+            return async_func
 
         wrapper._action_metadata = ActionMetadata(
             name=prefixed_name,
@@ -78,14 +130,10 @@ def create_action(name: str, description: str, schema: type[BaseModel] | None =
             args_schema=schema,
             invoke=wrapper,
             wallet_provider=has_wallet_provider,
+            read_only=read_only,
+            cache=cache,
         )
-
-        def _add_to_actions(owner: Any) -> None:
-            if not hasattr(owner, "_actions"):
-                owner._actions = []
-            owner._actions.append(wrapper._action_metadata)
-
-        wrapper._add_to_actions = _add_to_actions
+        wrapper.async_impl = async_impl
 
         return wrapper
 
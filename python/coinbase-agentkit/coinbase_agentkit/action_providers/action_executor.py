@@ -0,0 +1,78 @@
+"""Shared thread pool for running synchronous actions from asyncio code."""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 32
+
+_executor: ThreadPoolExecutor | None = None
+_max_workers = DEFAULT_MAX_WORKERS
+_executor_lock = threading.Lock()
+
+
+def configure_action_executor(max_workers: int) -> None:
+    """Set the number of threads used to run synchronous actions.
+
+    Actions already running on the previous pool finish there.
+
+    Args:
+        max_workers (int): The maximum number of actions running on threads at once
+
+    Raises:
+        ValueError: If max_workers is less than 1
+
+    """
+    global _executor, _max_workers
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    with _executor_lock:
+        previous, _executor, _max_workers = _executor, None, max_workers
+
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_action_executor() -> ThreadPoolExecutor:
+    """Get the shared action thread pool, creating it on first use.
+
+    Returns:
+        ThreadPoolExecutor: The thread pool
+
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="agentkit-action"
+            )
+
+        return _executor
+
+
+def run_coroutine_sync(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Uses a new event loop on the calling thread, or on a pool thread if the calling thread is
+    already running an event loop.
+
+    Args:
+        coroutine (Coroutine[Any, Any, T]): The coroutine to run
+
+    Returns:
+        T: The coroutine's result
+
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    return get_action_executor().submit(asyncio.run, coroutine).result()
@@ -1,13 +1,17 @@
 """Base class for action providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..network import Network
 from ..wallet_providers import WalletProvider
+from .action_cache import ActionCachePolicy
+from .action_decorator import ActionMetadata
+from .action_executor import get_action_executor
 
 TWalletProvider = TypeVar("TWalletProvider", bound=WalletProvider)
 
@@ -18,25 +22,64 @@ class Action(BaseModel):
     name: str
     description: str
     args_schema: type[BaseModel] | None = None
+    wallet_provider: bool = False
+    read_only: bool = False
+    cache: ActionCachePolicy | None = None
     invoke: Callable = Field(..., exclude=True)
+    coroutine: Callable | None = Field(None, exclude=True)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    async def ainvoke(self, args: dict[str, Any]) -> Any:
+        """Invoke the action from asyncio code.
+
+        Actions with an async implementation are awaited on the running event loop, others
+        run on the shared action thread pool so the loop is not blocked.
+
+        Args:
+            args (dict[str, Any]): The action's arguments
+
+        Returns:
+            Any: The action's result
+
+        """
+        if self.coroutine is not None:
+            return await self.coroutine(args)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            get_action_executor(), self.invoke, args
+        )
+
 
 class ActionProvider(Generic[TWalletProvider], ABC):
     """Base class for all action providers."""
 
+    _actions: tuple[ActionMetadata, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Collect the actions declared with create_action on the class and its bases.
+
+        The table is built once per class and shared by every instance. Actions are ordered by
+        attribute name, and an attribute overridden in a subclass replaces the inherited one.
+        """
+        super().__init_subclass__(**kwargs)
+
+        members = {}
+        for klass in reversed(cls.__mro__):
+            members.update(vars(klass))
+
+        cls._actions = tuple(
+            members[attr_name]._action_metadata
+            for attr_name in sorted(members)
+            if hasattr(members[attr_name], "_action_metadata")
+        )
+
     def __init__(
         self, name: str, action_providers: list["ActionProvider[TWalletProvider]"]
     ) -> None:
         self.name = name
         self.action_providers = action_providers
 
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            if hasattr(method, "_add_to_actions"):
-                method._add_to_actions(self)
-
     def get_actions(self, wallet_provider: TWalletProvider) -> list[Action]:
         """Get all actions from this provider and its sub-providers."""
         actions: list[Action] = []
@@ -50,11 +93,23 @@ class ActionProvider(Generic[TWalletProvider], ABC):
                         name=action_metadata.name,
                         description=action_metadata.description,
                         args_schema=action_metadata.args_schema,
+                        wallet_provider=action_metadata.wallet_provider,
+                        read_only=action_metadata.read_only,
+                        cache=action_metadata.cache,
                         invoke=lambda args, m=action_metadata, p=provider: (
                             m.invoke(p, wallet_provider, args)
                             if m.wallet_provider
                             else m.invoke(p, args)
                         ),
+                        coroutine=(
+                            None
+                            if action_metadata.ainvoke is None
+                            else lambda args, m=action_metadata, p=provider: (
+                                m.ainvoke(p, wallet_provider, args)
+                                if m.wallet_provider
+                                else m.ainvoke(p, args)
+                            )
+                        ),
                     )
                 )
 
@@ -2,8 +2,10 @@
 
 from typing import Any
 
+from ens import ENS
 from web3 import Web3
 
+from ...abi import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
@@ -65,14 +67,12 @@ Basename fails, you should prompt to try again with a more unique name.
                 else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
             )
 
-            w3 = Web3()
-            resolver_contract = w3.eth.contract(abi=L2_RESOLVER_ABI)
-            registrar_contract = w3.eth.contract(abi=REGISTRAR_ABI)
+            name_hash = ENS.namehash(args["basename"])
 
-            name_hash = w3.ens.namehash(args["basename"])
-
-            address_data = resolver_contract.encode_abi("setAddr", args=[name_hash, address])
-            name_data = resolver_contract.encode_abi("setName", args=[name_hash, args["basename"]])
+            address_data = encode_function_data(L2_RESOLVER_ABI, "setAddr", [name_hash, address])
+            name_data = encode_function_data(
+                L2_RESOLVER_ABI, "setName", [name_hash, args["basename"]]
+            )
 
             register_request = {
                 "name": args["basename"].replace(suffix, ""),
@@ -83,7 +83,7 @@ Basename fails, you should prompt to try again with a more unique name.
                 "reverseRecord": True,
             }
 
-            data = registrar_contract.encode_abi("register", args=[register_request])
+            data = encode_function_data(REGISTRAR_ABI, "register", [register_request])
 
             tx_hash = wallet_provider.send_transaction(
                 {
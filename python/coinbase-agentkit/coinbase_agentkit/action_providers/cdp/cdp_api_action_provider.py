@@ -8,6 +8,7 @@ from cdp import Cdp, ExternalAddress
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ...wallet_providers.cdp_wallet_provider import CdpProviderConfig
+from ..action_cache import ActionCachePolicy
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .schemas import AddressReputationSchema, RequestFaucetFundsSchema
@@ -96,6 +97,8 @@ Important notes:
 - The wallet's default address and its network may be used if not provided
 """,
         schema=AddressReputationSchema,
+        read_only=True,
+        cache=ActionCachePolicy(ttl=300),
     )
     def address_reputation(self, args: dict[str, Any]) -> str:
         """Check the reputation of an Ethereum address.
@@ -2,10 +2,10 @@
 
 from typing import Any
 
-from web3 import Web3
-
+from ...abi import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
+from ..action_cache import ActionCachePolicy
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import ERC20_ABI
@@ -25,6 +25,8 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         This tool will get the balance of an ERC20 asset in the wallet. It takes the contract address as input.
         """,
         schema=GetBalanceSchema,
+        read_only=True,
+        cache=ActionCachePolicy(per_block=True),
     )
     def get_balance(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Get the balance of an ERC20 token for the wallet's address.
@@ -81,9 +83,8 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         try:
             validated_args = TransferSchema(**args)
 
-            contract = Web3().eth.contract(address=validated_args.contract_address, abi=ERC20_ABI)
-            data = contract.encode_abi(
-                "transfer", [validated_args.destination, int(validated_args.amount)]
+            data = encode_function_data(
+                ERC20_ABI, "transfer", [validated_args.destination, int(validated_args.amount)]
             )
 
             tx_hash = wallet_provider.send_transaction(
@@ -3,10 +3,11 @@
 from typing import Any
 
 from eth_typing import HexStr
-from web3 import Web3
 
+from ...abi import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
+from ..action_cache import ActionCachePolicy
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import ERC721_ABI
@@ -41,8 +42,7 @@ Do not use the contract address as the destination address. If you are unsure of
 
         """
         try:
-            contract = Web3().eth.contract(address=args["contract_address"], abi=ERC721_ABI)
-            data = contract.encode_abi("mint", args=[args["destination"], 1])
+            data = encode_function_data(ERC721_ABI, "mint", [args["destination"], 1])
 
             tx_hash = wallet_provider.send_transaction(
                 {
@@ -86,12 +86,12 @@ Important notes:
 
         """
         try:
-            contract = Web3().eth.contract(address=args["contract_address"], abi=ERC721_ABI)
             from_address = args.get("from_address") or wallet_provider.get_address()
 
-            data = contract.encode_abi(
+            data = encode_function_data(
+                ERC721_ABI,
                 "transferFrom",
-                args=[from_address, args["destination"], int(args["token_id"])],
+                [from_address, args["destination"], int(args["token_id"])],
             )
 
             tx_hash = wallet_provider.send_transaction(
@@ -123,6 +123,8 @@ It takes the following inputs:
 - address: (Optional) The address to check NFT balance for. If not provided, uses the wallet's address
 """,
         schema=GetBalanceSchema,
+        read_only=True,
+        cache=ActionCachePolicy(per_block=True),
     )
     def get_balance(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
         """Get the NFT balance for a given address and contract.
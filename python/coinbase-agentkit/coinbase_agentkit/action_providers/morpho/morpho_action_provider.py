@@ -5,6 +5,7 @@ from typing import Any
 
 from web3 import Web3
 
+from coinbase_agentkit.abi import encode_function_data
 from coinbase_agentkit.action_providers.action_decorator import create_action
 from coinbase_agentkit.action_providers.action_provider import ActionProvider
 from coinbase_agentkit.action_providers.morpho.constants import METAMORPHO_ABI
@@ -67,10 +68,8 @@ Important notes:
             except Exception as e:
                 return f"Error approving Morpho Vault as spender: {e!s}"
 
-            morpho_contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
-
-            encoded_data = morpho_contract.encode_abi(
-                "deposit", args=[atomic_assets, args["receiver"]]
+            encoded_data = encode_function_data(
+                METAMORPHO_ABI, "deposit", [atomic_assets, args["receiver"]]
             )
 
             params = {
@@ -114,9 +113,8 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
 
         atomic_assets = Web3.to_wei(assets, "ether")
 
-        contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
-        encoded_data = contract.encode_abi(
-            "withdraw", args=[atomic_assets, args["receiver"], args["receiver"]]
+        encoded_data = encode_function_data(
+            METAMORPHO_ABI, "withdraw", [atomic_assets, args["receiver"], args["receiver"]]
         )
 
         try:
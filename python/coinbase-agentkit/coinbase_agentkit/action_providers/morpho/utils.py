@@ -1,5 +1,4 @@
-from web3 import Web3
-
+from coinbase_agentkit.abi import encode_function_data
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
 ERC20_APPROVE_ABI = [
@@ -32,8 +31,7 @@ def approve(wallet: EvmWalletProvider, token_address: str, spender_address: str,
 
     """
     try:
-        contract = Web3().eth.contract(address=token_address, abi=ERC20_APPROVE_ABI)
-        encoded_data = contract.encode_abi("approve", args=[spender_address, amount])
+        encoded_data = encode_function_data(ERC20_APPROVE_ABI, "approve", [spender_address, amount])
 
         params = {
             "to": token_address,
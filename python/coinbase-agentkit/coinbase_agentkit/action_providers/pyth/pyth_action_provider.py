@@ -2,14 +2,20 @@
 
 from typing import Any
 
-import requests
 from pydantic import BaseModel, Field
 
+from ...http_sessions import get_async_http_session, get_http_session
 from ...network import Network
 from ...wallet_providers import WalletProvider
+from ..action_cache import ActionCachePolicy
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 
+PRICE_FEEDS_URL = (
+    "https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
+)
+LATEST_PRICE_URL = "https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
+
 
 class FetchPriceFeedIdSchema(BaseModel):
     """Input schema for fetching Pyth price feed ID."""
@@ -33,6 +39,8 @@ class PythActionProvider(ActionProvider[WalletProvider]):
         name="fetch_price_feed_id",
         description="Fetch the price feed ID for a given token symbol (e.g. BTC, ETH, etc.) from Pyth.",
         schema=FetchPriceFeedIdSchema,
+        read_only=True,
+        cache=ActionCachePolicy(ttl=3600),
     )
     def fetch_price_feed_id(self, args: dict[str, Any]) -> str:
         """Fetch the price feed ID for a given token symbol from Pyth.
@@ -45,21 +53,30 @@ class PythActionProvider(ActionProvider[WalletProvider]):
 
         """
         token_symbol = args["token_symbol"]
-        url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-        response = requests.get(url)
+        url = PRICE_FEEDS_URL.format(token_symbol=token_symbol)
+        response = get_http_session(url).get(url)
         response.raise_for_status()
-        data = response.json()
 
-        if not data:
-            raise ValueError(f"No price feed found for {token_symbol}")
+        return _find_price_feed_id(token_symbol, response.json())
+
+    @fetch_price_feed_id.async_impl
+    async def afetch_price_feed_id(self, args: dict[str, Any]) -> str:
+        """Fetch the price feed ID for a given token symbol from Pyth without blocking.
+
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
 
-        filtered_data = [
-            item for item in data if item["attributes"]["base"].lower() == token_symbol.lower()
-        ]
-        if not filtered_data:
-            raise ValueError(f"No price feed found for {token_symbol}")
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        token_symbol = args["token_symbol"]
+        url = PRICE_FEEDS_URL.format(token_symbol=token_symbol)
+        async with get_async_http_session(url).get(url) as response:
+            response.raise_for_status()
+            data = await response.json()
 
-        return filtered_data[0]["id"]
+        return _find_price_feed_id(token_symbol, data)
 
     @create_action(
         name="get_price",
@@ -72,6 +89,7 @@ Important notes:
 - If you are asked to fetch the price from Pyth for a ticker symbol such as BTC, you must first use the fetch_price_feed_id action.
 """,
         schema=FetchPriceSchema,
+        read_only=True,
     )
     def fetch_price(self, args: dict[str, Any]) -> str:
         """Fetch price from Pyth for the given price feed ID.
@@ -85,29 +103,33 @@ Important notes:
         """
         try:
             price_feed_id = args["price_feed_id"]
-            url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
-            response = requests.get(url)
+            url = LATEST_PRICE_URL.format(price_feed_id=price_feed_id)
+            response = get_http_session(url).get(url)
             response.raise_for_status()
-            data = response.json()
-            parsed_data = data["parsed"]
 
-            if not parsed_data:
-                raise ValueError(f"No price data found for {price_feed_id}")
+            return _format_price(price_feed_id, response.json())
+        except Exception as e:
+            return f"Error fetching price from Pyth: {e!s}"
 
-            price_info = parsed_data[0]["price"]
-            price = int(price_info["price"])
-            exponent = price_info["expo"]
+    @fetch_price.async_impl
+    async def afetch_price(self, args: dict[str, Any]) -> str:
+        """Fetch price from Pyth for the given price feed ID without blocking.
 
-            if exponent < 0:
-                adjusted_price = price * 100
-                divisor = 10**-exponent
-                scaled_price = adjusted_price // divisor
-                price_str = f"{scaled_price // 100}.{scaled_price % 100:02}"
-                return price_str if not price_str.startswith(".") else f"0{price_str}"
+        Args:
+            args (dict[str, Any]): Input arguments for the action.
 
-            scaled_price = price // (10**exponent)
+        Returns:
+            str: A message containing the action response or error details.
 
-            return str(scaled_price)
+        """
+        try:
+            price_feed_id = args["price_feed_id"]
+            url = LATEST_PRICE_URL.format(price_feed_id=price_feed_id)
+            async with get_async_http_session(url).get(url) as response:
+                response.raise_for_status()
+                data = await response.json()
+
+            return _format_price(price_feed_id, data)
         except Exception as e:
             return f"Error fetching price from Pyth: {e!s}"
 
@@ -116,6 +138,67 @@ Important notes:
         return True
 
 
+def _find_price_feed_id(token_symbol: str, data: list[dict[str, Any]]) -> str:
+    """Find the price feed ID for a token symbol in a price feeds response.
+
+    Args:
+        token_symbol (str): The token symbol
+        data (list[dict[str, Any]]): The price feeds returned by Pyth
+
+    Returns:
+        str: The price feed ID
+
+    Raises:
+        ValueError: If no price feed matches the symbol
+
+    """
+    if not data:
+        raise ValueError(f"No price feed found for {token_symbol}")
+
+    filtered_data = [
+        item for item in data if item["attributes"]["base"].lower() == token_symbol.lower()
+    ]
+    if not filtered_data:
+        raise ValueError(f"No price feed found for {token_symbol}")
+
+    return filtered_data[0]["id"]
+
+
+def _format_price(price_feed_id: str, data: dict[str, Any]) -> str:
+    """Format the price in a latest price response as a decimal string.
+
+    Args:
+        price_feed_id (str): The price feed ID
+        data (dict[str, Any]): The latest price update returned by Pyth
+
+    Returns:
+        str: The price
+
+    Raises:
+        ValueError: If the response has no price data
+
+    """
+    parsed_data = data["parsed"]
+
+    if not parsed_data:
+        raise ValueError(f"No price data found for {price_feed_id}")
+
+    price_info = parsed_data[0]["price"]
+    price = int(price_info["price"])
+    exponent = price_info["expo"]
+
+    if exponent < 0:
+        adjusted_price = price * 100
+        divisor = 10**-exponent
+        scaled_price = adjusted_price // divisor
+        price_str = f"{scaled_price // 100}.{scaled_price % 100:02}"
+        return price_str if not price_str.startswith(".") else f"0{price_str}"
+
+    scaled_price = price // (10**exponent)
+
+    return str(scaled_price)
+
+
 def pyth_action_provider() -> PythActionProvider:
     """Create a new Pyth action provider.
 
@@ -74,6 +74,7 @@ A successful response will return a message with the api response as a json payl
 A failure response will return a message with a Twitter API request error:
     Error retrieving authenticated user account: 429 Too Many Requests""",
         schema=AccountDetailsSchema,
+        read_only=True,
     )
     def account_details(self, args: dict[str, Any]) -> str:
         """Get the authenticated Twitter user account details.
@@ -109,6 +110,7 @@ A successful response will return a message with the API response as a JSON payl
 A failure response will return a message with the Twitter API request error:
     Error retrieving user mentions: 429 Too Many Requests""",
         schema=AccountMentionsSchema,
+        read_only=True,
     )
     def account_mentions(self, args: dict[str, Any]) -> str:
         """Get mentions for a specified Twitter user.
@@ -4,6 +4,7 @@ from typing import Any
 
 from ...network import Network
 from ...wallet_providers.wallet_provider import WalletProvider
+from ..action_cache import ActionCachePolicy
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .schemas import GetBalanceSchema, GetWalletDetailsSchema, NativeTransferSchema
@@ -25,6 +26,8 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
     - Wallet provider name
     """,
         schema=GetWalletDetailsSchema,
+        read_only=True,
+        cache=ActionCachePolicy(per_block=True),
     )
     def get_wallet_details(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
         """Get details about the connected wallet.
@@ -58,6 +61,8 @@ class WalletActionProvider(ActionProvider[WalletProvider]):
         name="get_balance",
         description="This tool will get the native currency balance of the connected wallet.",
         schema=GetBalanceSchema,
+        read_only=True,
+        cache=ActionCachePolicy(per_block=True),
     )
     def get_balance(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
         """Get the native currency balance for the connected wallet.
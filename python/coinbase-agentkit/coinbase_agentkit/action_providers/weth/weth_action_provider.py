@@ -1,7 +1,6 @@
 from typing import Any
 
-from web3 import Web3
-
+from ...abi import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
@@ -49,8 +48,7 @@ Important notes:
         try:
             validated_args = WrapEthSchema(**args)
 
-            contract = Web3().eth.contract(address=WETH_ADDRESS, abi=WETH_ABI)
-            data = contract.encode_abi("deposit", args=[])
+            data = encode_function_data(WETH_ABI, "deposit", [])
 
             tx_hash = wallet_provider.send_transaction(
                 {"to": WETH_ADDRESS, "data": data, "value": validated_args.amount_to_wrap}
@@ -108,49 +108,28 @@ def get_pool_info(wallet_provider: EvmWalletProvider, pool_address: str) -> Pool
 
     """
     try:
-        token0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token0",
-            args=[],
-        )
-        token1 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token1",
-            args=[],
-        )
-        fee = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="fee",
-            args=[],
-        )
-        liquidity = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="liquidity",
-            args=[],
-        )
-        slot0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="slot0",
-            args=[],
-        )
-
-        balance0 = wallet_provider.read_contract(
-            contract_address=token0,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
+        token0, token1, fee, liquidity, slot0 = wallet_provider.batch_read_contract(
+            [
+                {
+                    "contract_address": pool_address,
+                    "abi": UNISWAP_V3_ABI,
+                    "function_name": function_name,
+                    "args": [],
+                }
+                for function_name in ("token0", "token1", "fee", "liquidity", "slot0")
+            ]
         )
 
-        balance1 = wallet_provider.read_contract(
-            contract_address=token1,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
+        balance0, balance1 = wallet_provider.batch_read_contract(
+            [
+                {
+                    "contract_address": token,
+                    "abi": WOW_ABI,
+                    "function_name": "balanceOf",
+                    "args": [pool_address],
+                }
+                for token in (token0, token1)
+            ]
         )
 
         return PoolInfo(
@@ -1,9 +1,37 @@
 """AgentKit - The framework for enabling AI agents to take actions onchain."""
 
-from pydantic import BaseModel, ConfigDict
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
-from .action_providers import Action, ActionProvider, wallet_action_provider
-from .wallet_providers import CdpWalletProvider, CdpWalletProviderConfig, WalletProvider
+from pydantic import BaseModel, ConfigDict, Field
+
+from .action_providers import Action, ActionProvider
+from .action_providers.action_cache import ActionResultCache
+from .network import NETWORK_ID_TO_CHAIN, Network
+from .wallet_providers import WalletProvider
+
+DEFAULT_MAX_CONCURRENT_ACTIONS = 8
+
+
+class ActionCall(BaseModel):
+    """A request to invoke an action as part of AgentKit.run_actions."""
+
+    name: str = Field(..., description="The name of the action")
+    args: dict[str, Any] = Field(default_factory=dict, description="The action's arguments")
+    depends_on: list[int] = Field(
+        default_factory=list,
+        description="Indexes of earlier calls in the same batch that must finish first",
+    )
+
+
+class ActionCallResult(BaseModel):
+    """The outcome of one call made by AgentKit.run_actions."""
+
+    name: str
+    result: Any = None
+    error: str | None = None
 
 
 class AgentKitConfig(BaseModel):
@@ -13,6 +41,7 @@ class AgentKitConfig(BaseModel):
     cdp_api_key_private_key: str | None = None
     wallet_provider: WalletProvider | None = None
     action_providers: list[ActionProvider] | None = None
+    cache_action_results: bool = True
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -32,6 +61,10 @@ class AgentKit:
                                           a default CDP wallet provider will be used.
 
         """
+        # Imported here so the CDP SDK is only loaded when the default wallet provider is used
+        from .action_providers import wallet_action_provider
+        from .wallet_providers import CdpWalletProvider, CdpWalletProviderConfig
+
         if not config:
             config = AgentKitConfig()
 
@@ -43,22 +76,311 @@ class AgentKit:
         )
         self.action_providers = config.action_providers or [wallet_action_provider()]
 
+        self._actions_lock = threading.Lock()
+        self._actions_key: tuple[Any, ...] | None = None
+        self._actions: list[Action] = []
+        self._actions_by_name: dict[str, Action] = {}
+        self._action_cache = ActionResultCache() if config.cache_action_results else None
+
     def get_actions(self) -> list[Action]:
         """Get all available actions for the current wallet and network.
 
+        Actions are built once and reused until the wallet provider, the action providers or
+        the wallet's network change.
+
         Returns:
             list[Action]: List of available actions from all providers
 
         Raises:
             ValueError: If no wallet provider is configured
 
+        """
+        return list(self._get_registry()[0])
+
+    def get_action(self, name: str) -> Action:
+        """Get an available action by name.
+
+        Args:
+            name (str): The name of the action
+
+        Returns:
+            Action: The action with the given name
+
+        Raises:
+            ValueError: If no wallet provider is configured or the action is not available
+
+        """
+        action = self._get_registry()[1].get(name)
+        if action is None:
+            raise ValueError(f"Action {name} not found")
+
+        return action
+
+    def _get_registry(self) -> tuple[list[Action], dict[str, Action]]:
+        """Get the actions for the current wallet and network, rebuilding them if stale.
+
+        Returns:
+            tuple[list[Action], dict[str, Action]]: The actions, and the same actions keyed by name
+
+        Raises:
+            ValueError: If no wallet provider is configured
+
         """
         if not self.wallet_provider:
             raise ValueError("No wallet provider configured")
 
-        actions: list[Action] = []
-        for provider in self.action_providers:
-            if provider.supports_network(self.wallet_provider.get_network()):
-                actions.extend(provider.get_actions(self.wallet_provider))
+        network = self.wallet_provider.get_network()
+        # Providers compare by identity, and holding them keeps their ids from being reused
+        key = (
+            self.wallet_provider,
+            tuple(self.action_providers),
+            network.protocol_family,
+            network.network_id,
+            network.chain_id,
+        )
+
+        with self._actions_lock:
+            if key != self._actions_key:
+                actions: list[Action] = []
+                for provider in self.action_providers:
+                    if provider.supports_network(network):
+                        actions.extend(provider.get_actions(self.wallet_provider))
+
+                if self._action_cache is not None:
+                    # Cached results describe the previous wallet or network
+                    self._action_cache.clear()
+                    actions = [self._with_result_cache(action, network) for action in actions]
+
+                self._actions = actions
+                self._actions_by_name = {action.name: action for action in actions}
+                self._actions_key = key
+
+            return self._actions, self._actions_by_name
+
+    def _with_result_cache(self, action: Action, network: Network) -> Action:
+        """Route an action through the result cache.
+
+        Read-only actions with a cache policy reuse their results, actions that are not
+        read-only clear the cache when they run, and other actions are returned unchanged.
+
+        Args:
+            action (Action): The action
+            network (Network): The wallet's network, for per-block policies
+
+        Returns:
+            Action: The action, or a copy that uses the cache
+
+        """
+        cache = self._action_cache
+        if not action.read_only:
+            return action.model_copy(
+                update={
+                    "invoke": cache.invalidating(action.invoke),
+                    "coroutine": action.coroutine and cache.invalidating_async(action.coroutine),
+                }
+            )
+
+        if action.cache is None:
+            return action
+
+        ttl = action.cache.ttl
+        if action.cache.per_block:
+            chain = NETWORK_ID_TO_CHAIN.get(network.network_id or "")
+            ttl = chain.block_time if chain is not None else None
+        if not ttl:
+            return action
+
+        return action.model_copy(
+            update={
+                "invoke": cache.cached(action.name, ttl, action.invoke),
+                "coroutine": action.coroutine
+                and cache.cached_async(action.name, ttl, action.coroutine),
+            }
+        )
+
+    def run_actions(
+        self,
+        calls: list[ActionCall | tuple[str, dict[str, Any]]],
+        max_workers: int = DEFAULT_MAX_CONCURRENT_ACTIONS,
+    ) -> list[ActionCallResult]:
+        """Invoke several actions, running those that do not depend on each other concurrently.
+
+        Wallet actions that are not read-only may change the wallet's state, so they run one
+        at a time in the order given, each after the read-only wallet actions listed before
+        it. Read-only wallet actions run concurrently with each other, once the last wallet
+        action listed before them that is not read-only has finished, so they see its
+        changes. Actions that do not take the wallet provider only wait for the calls they
+        explicitly depend on. A call is skipped if a call it explicitly depends on failed, or
+        if it is a wallet action that is not read-only and the previous one failed. An error
+        raised by an action is recorded in its result rather than raised.
+
+        Args:
+            calls (list[ActionCall | tuple[str, dict[str, Any]]]): The calls to make, as
+                ActionCall objects or (action name, args) pairs
+            max_workers (int): The maximum number of actions running at once
+
+        Returns:
+            list[ActionCallResult]: The result of each call, in the order of the calls
+
+        Raises:
+            ValueError: If an action is not available or a dependency is not an earlier call
+
+        """
+        actions, dependencies, required = self._plan_action_calls(calls)
+        if not actions:
+            return []
+
+        results: list[ActionCallResult | None] = [None] * len(actions)
+        waiting = [len(call_dependencies) for call_dependencies in dependencies]
+        dependents: list[list[int]] = [[] for _ in actions]
+        for index, call_dependencies in enumerate(dependencies):
+            for dependency in call_dependencies:
+                dependents[dependency].append(index)
+
+        lock = threading.Lock()
+        all_finished = threading.Event()
+        remaining = len(actions)
+
+        def run(index: int) -> None:
+            action, args = actions[index]
+            failed = [j for j in required[index] if results[j].error is not None]
+            if failed:
+                results[index] = ActionCallResult(
+                    name=action.name, error=f"Skipped because call {failed[0]} failed"
+                )
+                return
+
+            try:
+                results[index] = ActionCallResult(name=action.name, result=action.invoke(args))
+            except Exception as e:
+                results[index] = ActionCallResult(name=action.name, error=str(e))
+
+        def finished(index: int) -> None:
+            nonlocal remaining
+            with lock:
+                ready = []
+                for dependent in dependents[index]:
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        ready.append(dependent)
+                remaining -= 1
+                if remaining == 0:
+                    all_finished.set()
+
+            for dependent in ready:
+                submit(dependent)
+
+        def submit(index: int) -> None:
+            future: Future = executor.submit(run, index)
+            future.add_done_callback(lambda _, index=index: finished(index))
+
+        # Calls are submitted once every call they depend on has finished
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for index in range(len(actions)):
+                if not dependencies[index]:
+                    submit(index)
+            all_finished.wait()
+
+        return results
+
+    async def arun_actions(
+        self,
+        calls: list[ActionCall | tuple[str, dict[str, Any]]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_ACTIONS,
+    ) -> list[ActionCallResult]:
+        """Invoke several actions from asyncio code, like run_actions, using Action.ainvoke.
+
+        Args:
+            calls (list[ActionCall | tuple[str, dict[str, Any]]]): The calls to make, as
+                ActionCall objects or (action name, args) pairs
+            max_concurrency (int): The maximum number of actions running at once
+
+        Returns:
+            list[ActionCallResult]: The result of each call, in the order of the calls
+
+        Raises:
+            ValueError: If an action is not available or a dependency is not an earlier call
+
+        """
+        actions, dependencies, required = self._plan_action_calls(calls)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks: list[asyncio.Task] = []
+
+        async def run(index: int) -> ActionCallResult:
+            action, args = actions[index]
+            for dependency in dependencies[index]:
+                result = await tasks[dependency]
+                if dependency in required[index] and result.error is not None:
+                    return ActionCallResult(
+                        name=action.name, error=f"Skipped because call {dependency} failed"
+                    )
+
+            async with semaphore:
+                try:
+                    return ActionCallResult(name=action.name, result=await action.ainvoke(args))
+                except Exception as e:
+                    return ActionCallResult(name=action.name, error=str(e))
+
+        for index in range(len(actions)):
+            tasks.append(asyncio.ensure_future(run(index)))
+
+        return list(await asyncio.gather(*tasks))
+
+    def _plan_action_calls(
+        self, calls: list[ActionCall | tuple[str, dict[str, Any]]]
+    ) -> tuple[list[tuple[Action, dict[str, Any]]], list[list[int]], list[set[int]]]:
+        """Resolve the actions of a batch of calls and the calls each one must wait for.
+
+        Args:
+            calls (list[ActionCall | tuple[str, dict[str, Any]]]): The calls to make
+
+        Returns:
+            tuple[list[tuple[Action, dict[str, Any]]], list[list[int]], list[set[int]]]: Each
+                call's action and arguments, the indexes of the calls it must wait for, and
+                the indexes of those that must also have succeeded for it to run
+
+        Raises:
+            ValueError: If an action is not available or a dependency is not an earlier call
+
+        """
+        actions: list[tuple[Action, dict[str, Any]]] = []
+        dependencies: list[list[int]] = []
+        required: list[set[int]] = []
+        previous_mutating: int | None = None
+        reads_since_mutating: list[int] = []
+
+        for index, call in enumerate(calls):
+            if not isinstance(call, ActionCall):
+                name, args = call
+                call = ActionCall(name=name, args=args)
+
+            for dependency in call.depends_on:
+                if not 0 <= dependency < index:
+                    raise ValueError(
+                        f"Call {index} can only depend on earlier calls, got {dependency}"
+                    )
+
+            action = self.get_action(call.name)
+            call_required = set(call.depends_on)
+            call_dependencies = set(call_required)
+            # Only actions that take the wallet provider are ordered around its state changes
+            if action.wallet_provider and previous_mutating is not None:
+                # Every wallet call sees the changes of the state-changing action listed before it
+                call_dependencies.add(previous_mutating)
+
+            if action.wallet_provider and action.read_only:
+                reads_since_mutating.append(index)
+            elif action.wallet_provider:
+                # State-changing actions also keep their relative order, run after the reads
+                # listed before them and are skipped if the previous one failed
+                if previous_mutating is not None:
+                    call_required.add(previous_mutating)
+                call_dependencies.update(reads_since_mutating)
+                reads_since_mutating = []
+                previous_mutating = index
+
+            actions.append((action, call.args))
+            dependencies.append(sorted(call_dependencies))
+            required.append(call_required)
 
-        return actions
+        return actions, dependencies, required
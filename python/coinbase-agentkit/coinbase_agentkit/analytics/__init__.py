@@ -1,5 +1,11 @@
 """Analytics module for tracking metrics in AgentKit."""
 
+from .exporter import AnalyticsExporter, get_analytics_exporter
 from .send_analytics_event import RequiredEventData, send_analytics_event
 
-__all__ = ["RequiredEventData", "send_analytics_event"]
+__all__ = [
+    "AnalyticsExporter",
+    "RequiredEventData",
+    "get_analytics_exporter",
+    "send_analytics_event",
+]
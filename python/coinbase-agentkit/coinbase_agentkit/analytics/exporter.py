@@ -0,0 +1,183 @@
+"""Background exporter for analytics events."""
+
+import atexit
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from typing import Any
+
+import requests
+
+from ..http_sessions import get_http_session
+
+ANALYTICS_ENDPOINT = "https://cca-lite.coinbase.com/amp"
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_MAX_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL = 5.0
+DEFAULT_REQUEST_TIMEOUT = 5.0
+DEFAULT_SHUTDOWN_TIMEOUT = 2.0
+
+
+def build_analytics_payload(events: list[dict[str, Any]]) -> dict[str, str]:
+    """Build the request body for a batch of analytics events.
+
+    Args:
+        events (list[dict[str, Any]]): The events to send
+
+    Returns:
+        dict[str, str]: The request body with the serialized events and their checksum
+
+    """
+    stringified_event_data = json.dumps(events)
+    upload_time = str(int(time.time() * 1000))
+
+    checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
+
+    return {
+        "e": stringified_event_data,
+        "checksum": checksum,
+    }
+
+
+class AnalyticsExporter:
+    """Sends analytics events from a background thread so callers never wait on the network.
+
+    Events are held in a bounded queue that drops the oldest event when full, and are sent in
+    batches once max_batch_size events are queued or flush_interval seconds have passed. The
+    worker thread is started on the first event, and remaining events are flushed at exit.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = ANALYTICS_ENDPOINT,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        session: requests.Session | None = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            endpoint (str): The URL events are posted to
+            max_queue_size (int): The maximum number of events held before the oldest are dropped
+            max_batch_size (int): The maximum number of events sent in one request
+            flush_interval (float): The maximum time in seconds an event waits before being sent
+            timeout (float): The timeout in seconds for each request
+            session (requests.Session | None): The HTTP session to send with, defaults to the shared session for the endpoint's host
+
+        """
+        self._endpoint = endpoint
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._timeout = timeout
+        self._session = session or get_http_session(endpoint)
+
+        self._queue: deque[dict[str, Any]] = deque(maxlen=max_queue_size)
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._stopping = False
+        self.dropped_events = 0
+
+    def enqueue(self, event: dict[str, Any]) -> None:
+        """Queue an event to be sent in the background.
+
+        Args:
+            event (dict[str, Any]): The event to send
+
+        """
+        with self._condition:
+            if self._stopping:
+                return
+
+            if len(self._queue) == self._queue.maxlen:
+                self.dropped_events += 1
+            self._queue.append(event)
+
+            if self._worker is None:
+                self._start()
+            elif len(self._queue) >= self._max_batch_size:
+                self._condition.notify()
+
+    def shutdown(self, timeout: float = DEFAULT_SHUTDOWN_TIMEOUT) -> None:
+        """Stop the worker thread after it has flushed the queued events.
+
+        Args:
+            timeout (float): The maximum time in seconds to wait for the flush
+
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            worker = self._worker
+
+        if worker is not None:
+            worker.join(timeout)
+
+    def _start(self) -> None:
+        """Start the worker thread. Must be called with the condition held."""
+        self._worker = threading.Thread(
+            target=self._run, name="agentkit-analytics-exporter", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.shutdown)
+
+    def _run(self) -> None:
+        """Send batches until the exporter is shut down and the queue is drained."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or len(self._queue) >= self._max_batch_size,
+                    timeout=self._flush_interval,
+                )
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(len(self._queue), self._max_batch_size))
+                ]
+                done = self._stopping and not self._queue
+
+            if batch:
+                self._send(batch)
+            if done:
+                return
+
+    def _send(self, events: list[dict[str, Any]]) -> None:
+        """Send a batch of events, discarding it if the request fails.
+
+        Args:
+            events (list[dict[str, Any]]): The events to send
+
+        """
+        try:
+            response = self._session.post(
+                self._endpoint,
+                json=build_analytics_payload(events),
+                headers={"Content-Type": "application/json"},
+                timeout=self._timeout,
+            )
+            response.raise_for_status()
+        except Exception:
+            # Telemetry is best effort, a failed batch must not stop the worker
+            pass
+
+
+_exporter: AnalyticsExporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def get_analytics_exporter() -> AnalyticsExporter:
+    """Get the process-wide analytics exporter, creating it on first use.
+
+    Returns:
+        AnalyticsExporter: The analytics exporter
+
+    """
+    global _exporter
+
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = AnalyticsExporter()
+
+        return _exporter
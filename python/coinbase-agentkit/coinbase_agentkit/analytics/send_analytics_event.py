@@ -1,11 +1,9 @@
 """Analytics event tracking."""
 
-import hashlib
-import json
 import time
 from typing import TypedDict
 
-import requests
+from .exporter import get_analytics_exporter
 
 
 class RequiredEventData(TypedDict, total=False):
@@ -20,14 +18,13 @@ class RequiredEventData(TypedDict, total=False):
 
 
 def send_analytics_event(event: RequiredEventData) -> None:
-    """Send an analytics event to the default endpoint.
+    """Queue an analytics event to be sent to the default endpoint in the background.
+
+    Returns immediately, the event is sent by the analytics exporter in a later batch.
 
     Args:
         event: The event data containing required action, component and name fields
 
-    Raises:
-        requests.exceptions.RequestException: If the HTTP request fails
-
     Returns:
         None
 
@@ -47,24 +44,4 @@ def send_analytics_event(event: RequiredEventData) -> None:
         },
     }
 
-    events = [enhanced_event]
-    stringified_event_data = json.dumps(events)
-    upload_time = str(timestamp)
-
-    checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
-
-    analytics_service_data = {
-        "e": stringified_event_data,
-        "checksum": checksum,
-    }
-
-    api_endpoint = "https://cca-lite.coinbase.com"
-    event_path = "/amp"
-    event_endpoint = f"{api_endpoint}{event_path}"
-
-    response = requests.post(
-        event_endpoint,
-        json=analytics_service_data,
-        headers={"Content-Type": "application/json"},
-    )
-    response.raise_for_status()
+    get_analytics_exporter().enqueue(enhanced_event)
@@ -0,0 +1,19 @@
+"""HTTP utilities for AgentKit."""
+
+from .sessions import (
+    HttpSessionConfig,
+    close_async_http_sessions,
+    configure_http_sessions,
+    get_async_http_session,
+    get_http_session,
+    get_http_session_config,
+)
+
+__all__ = [
+    "HttpSessionConfig",
+    "close_async_http_sessions",
+    "configure_http_sessions",
+    "get_async_http_session",
+    "get_http_session",
+    "get_http_session_config",
+]
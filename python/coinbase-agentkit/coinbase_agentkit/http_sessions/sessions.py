@@ -0,0 +1,193 @@
+"""Process-wide pooled HTTP sessions, shared per host."""
+
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import requests
+from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class HttpSessionConfig(BaseModel):
+    """Configuration for shared HTTP sessions."""
+
+    pool_maxsize: int = Field(32, description="Connections kept open per host")
+    keep_alive: bool = Field(True, description="Whether connections are reused between requests")
+    timeout: float = Field(30.0, description="Timeout in seconds for requests that do not set one")
+    max_retries: int = Field(0, description="Retries for requests that fail to connect")
+
+
+class _PooledSession(requests.Session):
+    """A session that applies a default timeout to every request."""
+
+    def __init__(self, config: HttpSessionConfig):
+        super().__init__()
+        self.timeout = config.timeout
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=config.pool_maxsize,
+            max_retries=config.max_retries,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        if not config.keep_alive:
+            self.headers["Connection"] = "close"
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_config = HttpSessionConfig()
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+# aiohttp sessions are bound to the event loop they were created on
+_async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, aiohttp.ClientSession]]" = weakref.WeakKeyDictionary()
+
+
+def configure_http_sessions(config: HttpSessionConfig) -> None:
+    """Set the configuration of shared HTTP sessions.
+
+    The previous sessions are closed, releasing their open connections. Providers holding one
+    of them keep its settings, so this should be called before wallet providers are created.
+
+    Args:
+        config (HttpSessionConfig): The session configuration
+
+    """
+    global _config
+
+    with _sessions_lock:
+        _config = config
+        sessions = list(_sessions.values())
+        async_sessions = [
+            (loop, session)
+            for loop, loop_sessions in _async_sessions.items()
+            for session in loop_sessions.values()
+        ]
+        _sessions.clear()
+        _async_sessions.clear()
+
+    for session in sessions:
+        session.close()
+
+    for loop, session in async_sessions:
+        _close_async_session(loop, session)
+
+
+def _close_async_session(loop: asyncio.AbstractEventLoop, session: "aiohttp.ClientSession") -> None:
+    """Close an aiohttp session on the event loop it belongs to.
+
+    Args:
+        loop (asyncio.AbstractEventLoop): The event loop the session was created on
+        session (aiohttp.ClientSession): The session to close
+
+    """
+    if session.closed or loop.is_closed():
+        return
+
+    if loop.is_running():
+        # Also safe from a coroutine on the loop itself, the close runs once it yields
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+    else:
+        loop.run_until_complete(session.close())
+
+
+def get_http_session_config() -> HttpSessionConfig:
+    """Get the configuration of shared HTTP sessions.
+
+    Returns:
+        HttpSessionConfig: The session configuration
+
+    """
+    return _config
+
+
+def get_http_session(url: str) -> requests.Session:
+    """Get the shared HTTP session for a URL's host, creating it on first use.
+
+    Every caller talking to the same scheme, host and port shares one connection pool, so
+    repeated requests reuse open connections instead of paying a new TCP and TLS handshake.
+
+    Args:
+        url (str): A URL on the host
+
+    Returns:
+        requests.Session: The shared session for the host
+
+    """
+    key = _host_key(url)
+
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = _PooledSession(_config)
+
+        return _sessions[key]
+
+
+def _host_key(url: str) -> str:
+    """Get the key identifying a URL's scheme, host and port.
+
+    Args:
+        url (str): The URL
+
+    Returns:
+        str: The key
+
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def get_async_http_session(url: str) -> "aiohttp.ClientSession":
+    """Get the shared aiohttp session for a URL's host on the running event loop.
+
+    The asyncio counterpart of get_http_session, with the same pool size, keep-alive and
+    timeout settings. Must be called from a coroutine.
+
+    Args:
+        url (str): A URL on the host
+
+    Returns:
+        aiohttp.ClientSession: The shared session for the host and event loop
+
+    """
+    # aiohttp is installed with web3, which uses it for its async providers
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    key = _host_key(url)
+
+    with _sessions_lock:
+        sessions = _async_sessions.setdefault(loop, {})
+        session = sessions.get(key)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=_config.pool_maxsize, force_close=not _config.keep_alive
+                ),
+                timeout=aiohttp.ClientTimeout(total=_config.timeout),
+            )
+            sessions[key] = session
+
+        return session
+
+
+async def close_async_http_sessions() -> None:
+    """Close the shared aiohttp sessions of the running event loop.
+
+    Call before the event loop is closed to release its connections.
+    """
+    with _sessions_lock:
+        sessions = _async_sessions.pop(asyncio.get_running_loop(), {})
+
+    for session in sessions.values():
+        await session.close()
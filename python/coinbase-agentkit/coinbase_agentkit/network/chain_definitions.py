@@ -13,6 +13,7 @@ class RpcUrls(BaseModel):
     """Represents the RPC URLs for a blockchain network."""
 
     http: list[str]
+    web_socket: list[str] | None = None
 
 
 class BlockExplorer(BaseModel):
@@ -41,6 +42,8 @@ class Chain(BaseModel):
     block_explorers: dict[str, BlockExplorer]
     contracts: dict[str, Contract]
     testnet: bool | None = False
+    # Average number of seconds between blocks
+    block_time: float | None = None
 
 
 # Convert existing dictionaries to Chain instances
@@ -48,6 +51,7 @@ mainnet = Chain(
     id="1",
     name="Ethereum",
     native_currency={"name": "Ether", "symbol": "ETH", "decimals": 18},
+    block_time=12,
     rpc_urls={
         "default": {
             "http": ["https://eth.merkle.io"],
@@ -79,6 +83,7 @@ sepolia = Chain(
     id="11155111",
     name="Sepolia",
     native_currency={"name": "Sepolia Ether", "symbol": "ETH", "decimals": 18},
+    block_time=12,
     rpc_urls={
         "default": {
             "http": ["https://sepolia.drpc.org"],
@@ -110,6 +115,7 @@ base_sepolia = Chain(
     network="base-sepolia",
     name="Base Sepolia",
     native_currency={"name": "Sepolia Ether", "symbol": "ETH", "decimals": 18},
+    block_time=2,
     rpc_urls={
         "default": {
             "http": ["https://sepolia.base.org"],
@@ -153,6 +159,7 @@ arbitrum_sepolia = Chain(
         "symbol": "ETH",
         "decimals": 18,
     },
+    block_time=0.25,
     rpc_urls={
         "default": {
             "http": ["https://sepolia-rollup.arbitrum.io/rpc"],
@@ -178,6 +185,7 @@ optimism_sepolia = Chain(
     id="11155420",
     name="OP Sepolia",
     native_currency={"name": "Sepolia Ether", "symbol": "ETH", "decimals": 18},
+    block_time=2,
     rpc_urls={
         "default": {
             "http": ["https://sepolia.optimism.io"],
@@ -215,6 +223,7 @@ base = Chain(
     id="8453",
     name="Base",
     native_currency={"name": "Ether", "symbol": "ETH", "decimals": 18},
+    block_time=2,
     rpc_urls={
         "default": {
             "http": ["https://mainnet.base.org"],
@@ -253,6 +262,7 @@ arbitrum = Chain(
     id="42161",
     name="Arbitrum One",
     native_currency={"name": "Ether", "symbol": "ETH", "decimals": 18},
+    block_time=0.25,
     rpc_urls={
         "default": {
             "http": ["https://arb1.arbitrum.io/rpc"],
@@ -277,6 +287,7 @@ optimism = Chain(
     id="10",
     name="OP Mainnet",
     native_currency={"name": "Ether", "symbol": "ETH", "decimals": 18},
+    block_time=2,
     rpc_urls={
         "default": {
             "http": ["https://mainnet.optimism.io"],
@@ -313,6 +324,7 @@ polygon_mumbai = Chain(
     id="80001",
     name="Polygon Mumbai",
     native_currency={"name": "MATIC", "symbol": "MATIC", "decimals": 18},
+    block_time=2,
     rpc_urls={
         "default": {
             "http": ["https://rpc.ankr.com/polygon_mumbai"],
@@ -338,6 +350,7 @@ polygon = Chain(
     id="137",
     name="Polygon",
     native_currency={"name": "POL", "symbol": "POL", "decimals": 18},
+    block_time=2,
     rpc_urls={
         "default": {
             "http": ["https://polygon-rpc.com"],
@@ -1,16 +1,83 @@
-"""Wallet providers for AgentKit."""
+"""Wallet providers for AgentKit.
 
-from .cdp_wallet_provider import CdpProviderConfig, CdpWalletProvider, CdpWalletProviderConfig
-from .eth_account_wallet_provider import EthAccountWalletProvider, EthAccountWalletProviderConfig
-from .evm_wallet_provider import EvmWalletProvider
-from .wallet_provider import WalletProvider
+Provider modules are imported on first access so that importing the package does not load
+the CDP SDK or web3 until a provider that needs them is used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .wallet_provider import WalletMetadata, WalletProvider, WalletProviderBase
+
+if TYPE_CHECKING:
+    from .async_cdp_wallet_provider import AsyncCdpWalletProvider
+    from .async_eth_account_wallet_provider import AsyncEthAccountWalletProvider
+    from .async_evm_wallet_provider import AsyncEvmWalletProvider
+    from .cdp_operation import CdpOperationHandle
+    from .cdp_wallet_provider import (
+        CdpProviderConfig,
+        CdpWalletProvider,
+        CdpWalletProviderConfig,
+    )
+    from .eth_account_wallet_provider import (
+        EthAccountWalletProvider,
+        EthAccountWalletProviderConfig,
+    )
+    from .evm_wallet_provider import EvmWalletProvider
+    from .multicall import ReadContractCall
+    from .rpc_batch import BroadcastError
+    from .sender_scopes import sender_scope
+    from .wallet_pool_provider import WalletPoolProvider
+
+_LAZY_IMPORTS = {
+    "EvmWalletProvider": ".evm_wallet_provider",
+    "CdpOperationHandle": ".cdp_operation",
+    "CdpProviderConfig": ".cdp_wallet_provider",
+    "CdpWalletProvider": ".cdp_wallet_provider",
+    "CdpWalletProviderConfig": ".cdp_wallet_provider",
+    "EthAccountWalletProvider": ".eth_account_wallet_provider",
+    "EthAccountWalletProviderConfig": ".eth_account_wallet_provider",
+    "ReadContractCall": ".multicall",
+    "BroadcastError": ".rpc_batch",
+    "sender_scope": ".sender_scopes",
+    "WalletPoolProvider": ".wallet_pool_provider",
+    "AsyncEvmWalletProvider": ".async_evm_wallet_provider",
+    "AsyncCdpWalletProvider": ".async_cdp_wallet_provider",
+    "AsyncEthAccountWalletProvider": ".async_eth_account_wallet_provider",
+}
 
 __all__ = [
     "WalletProvider",
+    "WalletProviderBase",
+    "WalletMetadata",
     "EvmWalletProvider",
+    "CdpOperationHandle",
     "CdpProviderConfig",
     "CdpWalletProvider",
     "CdpWalletProviderConfig",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
+    "ReadContractCall",
+    "BroadcastError",
+    "sender_scope",
+    "WalletPoolProvider",
+    "AsyncEvmWalletProvider",
+    "AsyncCdpWalletProvider",
+    "AsyncEthAccountWalletProvider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a provider module the first time one of its names is accessed."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package's names, including those not imported yet."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -0,0 +1,379 @@
+"""Asyncio wrapper around the CDP wallet provider."""
+
+import asyncio
+from decimal import Decimal
+from typing import Any
+
+from cdp import WalletData
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from ..network import Network
+from .async_evm_wallet_provider import AsyncEvmWalletProvider
+from .cdp_operation import DEFAULT_OPERATION_TIMEOUT, CdpOperationHandle
+from .cdp_wallet_provider import CdpWalletProvider, CdpWalletProviderConfig
+
+
+class AsyncCdpWalletProvider(AsyncEvmWalletProvider):
+    """A wallet provider that exposes CdpWalletProvider to asyncio code.
+
+    The CDP SDK is synchronous, so each blocking call runs in the default executor and the
+    event loop stays free while it waits on the network.
+    """
+
+    def __init__(self, wallet_provider: CdpWalletProvider):
+        """Initialize the wallet provider.
+
+        Use AsyncCdpWalletProvider.create to build the underlying CdpWalletProvider without
+        blocking the event loop.
+
+        Args:
+            wallet_provider (CdpWalletProvider): The CDP wallet provider to wrap
+
+        """
+        self._wallet_provider = wallet_provider
+
+    @classmethod
+    async def create(
+        cls, config: CdpWalletProviderConfig | None = None
+    ) -> "AsyncCdpWalletProvider":
+        """Create a CDP wallet provider off the event loop, wait for its wallet and wrap it.
+
+        The wallet has loaded when this returns, so get_address and the other synchronous
+        accessors never block the event loop.
+
+        Args:
+            config (CdpWalletProviderConfig | None): Configuration options for the CDP provider. If not provided,
+                   will attempt to configure from environment variables.
+
+        Returns:
+            AsyncCdpWalletProvider: The wrapped wallet provider
+
+        Raises:
+            ValueError: If required configuration is missing or initialization fails
+
+        """
+        instance = cls(await asyncio.to_thread(CdpWalletProvider, config))
+        await instance.load_wallet()
+        return instance
+
+    @property
+    def wallet_provider(self) -> CdpWalletProvider:
+        """Get the wrapped synchronous wallet provider.
+
+        Returns:
+            CdpWalletProvider: The wrapped wallet provider
+
+        """
+        return self._wallet_provider
+
+    async def load_wallet(self) -> None:
+        """Wait for the wrapped provider's CDP wallet to load, starting the load if needed.
+
+        Raises:
+            Exception: If the wallet failed to load
+
+        """
+        await asyncio.wrap_future(self._wallet_provider.load_wallet())
+
+    def track_initialization(self) -> None:
+        """Skip tracking, the wrapped wallet provider has already tracked its initialization."""
+        pass
+
+    def get_address(self) -> str:
+        """Get the wallet address.
+
+        Returns:
+            str: The wallet's address as a hex string
+
+        """
+        return self._wallet_provider.get_address()
+
+    def get_network(self) -> Network:
+        """Get the current network.
+
+        Returns:
+            Network: Network object containing protocol family, network ID, and chain ID
+
+        """
+        return self._wallet_provider.get_network()
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider.
+
+        Returns:
+            str: The string 'cdp_wallet_provider_async'
+
+        """
+        return "cdp_wallet_provider_async"
+
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency.
+
+        Returns:
+            Decimal: The wallet's balance in wei as a Decimal
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.get_balance)
+
+    async def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message using the wallet's private key.
+
+        Args:
+            message (str | bytes): The message to sign, either as a string or bytes
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.sign_message, message)
+
+    async def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard.
+
+        Args:
+            typed_data (dict[str, Any]): The typed data to sign following EIP-712 format
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.sign_typed_data, typed_data)
+
+    async def sign_transaction(self, transaction: TxParams) -> HexStr:
+        """Sign an EVM transaction.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction signature as a hex string
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.sign_transaction, transaction)
+
+    async def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a signed transaction to the network.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.send_transaction, transaction)
+
+    async def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions at once and return their hashes in order.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
+
+        Returns:
+            list[HexStr]: The transaction hashes as hex strings
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.send_transactions, transactions)
+
+    async def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float | None): Time between polling attempts in seconds. If set, this
+                transaction is polled on its own instead of through the receipt watcher
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        """
+        return await asyncio.to_thread(
+            self._wallet_provider.wait_for_transaction_receipt,
+            tx_hash,
+            timeout=timeout,
+            poll_latency=poll_latency,
+        )
+
+    async def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        return await asyncio.to_thread(
+            self._wallet_provider.read_contract,
+            contract_address=contract_address,
+            abi=abi,
+            function_name=function_name,
+            args=args,
+            block_identifier=block_identifier,
+        )
+
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        Raises:
+            Exception: If transfer fails or wallet is not initialized
+
+        """
+        handle = await self.start_native_transfer(to, value)
+
+        try:
+            return await handle
+        except Exception as e:
+            raise Exception(f"Failed to transfer native tokens: {e!s}") from e
+
+    async def start_native_transfer(
+        self, to: str, value: Decimal, timeout: float = DEFAULT_OPERATION_TIMEOUT
+    ) -> CdpOperationHandle[str]:
+        """Start a transfer of the native asset and return once it has been broadcast.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+            timeout (float): Seconds to wait for confirmation before the handle fails
+
+        Returns:
+            CdpOperationHandle[str]: A handle that resolves to the transaction hash
+
+        """
+        return await asyncio.to_thread(
+            self._wallet_provider.start_native_transfer, to, value, timeout
+        )
+
+    async def export_wallet(self) -> WalletData:
+        """Export the wallet data for persistence.
+
+        Returns:
+            WalletData: The wallet data object containing all necessary information
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.export_wallet)
+
+    async def deploy_contract(
+        self,
+        solidity_version: str,
+        solidity_input_json: str,
+        contract_name: str,
+        constructor_args: dict[str, Any],
+    ) -> Any:
+        """Deploy a smart contract.
+
+        Args:
+            solidity_version (str): The version of the Solidity compiler to use
+            solidity_input_json (str): The JSON input for the Solidity compiler
+            contract_name (str): The name of the contract to deploy
+            constructor_args (dict[str, Any]): Key-value map of constructor arguments
+
+        Returns:
+            Any: The deployed contract instance
+
+        """
+        return await asyncio.to_thread(
+            self._wallet_provider.deploy_contract,
+            solidity_version=solidity_version,
+            solidity_input_json=solidity_input_json,
+            contract_name=contract_name,
+            constructor_args=constructor_args,
+        )
+
+    async def deploy_nft(self, name: str, symbol: str, base_uri: str) -> Any:
+        """Deploy a new NFT (ERC-721) smart contract.
+
+        Args:
+            name (str): The name of the NFT collection
+            symbol (str): The token symbol for the collection
+            base_uri (str): The base URI for token metadata
+
+        Returns:
+            Any: The deployed NFT contract instance
+
+        """
+        return await asyncio.to_thread(self._wallet_provider.deploy_nft, name, symbol, base_uri)
+
+    async def deploy_token(self, name: str, symbol: str, total_supply: str) -> Any:
+        """Deploy an ERC20 token contract.
+
+        Args:
+            name (str): The name of the token
+            symbol (str): The symbol of the token
+            total_supply (str): The total supply of the token
+
+        Returns:
+            Any: The deployed token contract instance
+
+        """
+        return await asyncio.to_thread(
+            self._wallet_provider.deploy_token, name, symbol, total_supply
+        )
+
+    async def trade(self, amount: str, from_asset_id: str, to_asset_id: str) -> str:
+        """Trade a specified amount of one asset for another.
+
+        Args:
+            amount (str): The amount of the from asset to trade, e.g. `15`, `0.000001`.
+            from_asset_id (str): The from asset ID to trade (e.g., "eth", "usdc", or a valid contract address).
+            to_asset_id (str): The to asset ID to trade (e.g., "eth", "usdc", or a valid contract address).
+
+        Returns:
+            str: A message containing the trade details and transaction information
+
+        Raises:
+            Exception: If trade fails or wallet is not initialized
+
+        """
+        handle = await self.start_trade(amount, from_asset_id, to_asset_id)
+
+        try:
+            return await handle
+        except Exception as e:
+            raise Exception(f"Error trading assets: {e!s}") from e
+
+    async def start_trade(
+        self,
+        amount: str,
+        from_asset_id: str,
+        to_asset_id: str,
+        timeout: float = DEFAULT_OPERATION_TIMEOUT,
+    ) -> CdpOperationHandle[str]:
+        """Start a trade of one asset for another and return once it has been broadcast.
+
+        Args:
+            amount (str): The amount of the from asset to trade, e.g. `15`, `0.000001`.
+            from_asset_id (str): The from asset ID to trade (e.g., "eth", "usdc", or a valid contract address).
+            to_asset_id (str): The to asset ID to trade (e.g., "eth", "usdc", or a valid contract address).
+            timeout (float): Seconds to wait for confirmation before the handle fails
+
+        Returns:
+            CdpOperationHandle[str]: A handle that resolves to a message containing the trade
+                details and transaction information
+
+        """
+        return await asyncio.to_thread(
+            self._wallet_provider.start_trade, amount, from_asset_id, to_asset_id, timeout
+        )
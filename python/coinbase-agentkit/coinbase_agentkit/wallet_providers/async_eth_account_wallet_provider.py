@@ -0,0 +1,338 @@
+"""Asyncio eth account wallet provider."""
+
+from collections.abc import Awaitable, Hashable
+from decimal import Decimal
+from typing import Any
+
+from eth_account.datastructures import SignedTransaction
+from eth_account.messages import encode_defunct
+from web3 import AsyncWeb3, Web3
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from ..abi import get_compiled_function
+from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
+from .async_evm_wallet_provider import AsyncEvmWalletProvider
+from .eth_account_wallet_provider import EthAccountWalletProviderConfig
+from .fee_oracle import get_async_fee_oracle
+from .nonce_manager import AsyncNonceManager, is_already_known
+from .single_flight import AsyncSingleFlight
+
+
+class AsyncEthAccountWalletProvider(AsyncEvmWalletProvider):
+    """A wallet provider that uses eth-account and AsyncWeb3 for EVM chain interactions."""
+
+    def __init__(self, config: EthAccountWalletProviderConfig):
+        """Initialize the wallet provider with an eth-account.
+
+        Args:
+            config (EthAccountWalletProviderConfig): Configuration options including account and network ID.
+
+        """
+        self.config = config
+        self.account = config.account
+
+        chain = NETWORK_ID_TO_CHAIN[CHAIN_ID_TO_NETWORK_ID[config.chain_id]]
+        rpc_urls = (config.rpc and config.rpc.rpc_urls) or chain.rpc_urls["default"].http
+        # The endpoint pool is synchronous, so the async provider uses the first endpoint
+        rpc_url = rpc_urls[0]
+
+        self.web3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+
+        self._network = Network(
+            protocol_family="evm",
+            chain_id=self.config.chain_id,
+            network_id=CHAIN_ID_TO_NETWORK_ID[self.config.chain_id],
+        )
+
+        self._gas_limit_multiplier = (
+            max(config.gas.gas_limit_multiplier, 1)
+            if config and config.gas and config.gas.gas_limit_multiplier is not None
+            else 1.2
+        )
+
+        self._fee_per_gas_multiplier = (
+            max(config.gas.fee_per_gas_multiplier, 1)
+            if config and config.gas and config.gas.fee_per_gas_multiplier is not None
+            else 1
+        )
+
+        self._nonce_manager = AsyncNonceManager(
+            lambda: self.web3.eth.get_transaction_count(self.account.address, "pending")
+        )
+        self._read_flight = AsyncSingleFlight()
+        self._read_cache = (
+            config.read_cache.create_cache(chain.block_time) if config.read_cache else None
+        )
+
+    def _wallet_metadata_key(self) -> Hashable:
+        """Get the account address and chain, so the metadata follows a replaced account.
+
+        Returns:
+            Hashable: The address and chain ID
+
+        """
+        return (self.account.address, self._network.chain_id)
+
+    def get_address(self) -> str:
+        """Get the wallet address.
+
+        Returns:
+            str: The wallet's address as a hex string.
+
+        """
+        return self.account.address
+
+    def get_network(self) -> Network:
+        """Get the current network.
+
+        Returns:
+            Network: Network object containing protocol family, network ID, and chain ID.
+
+        """
+        return self._network
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider.
+
+        Returns:
+            str: The string 'eth-account-async'
+
+        """
+        return "eth-account-async"
+
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency.
+
+        Returns:
+            Decimal: The wallet's balance in wei as a Decimal
+
+        """
+        address = self.account.address
+        if self._read_cache is None:
+            balance_wei = await self.web3.eth.get_balance(address)
+        else:
+            balance_wei = await self._read_cache.aread(
+                "getBalance",
+                address,
+                "latest",
+                lambda: self.web3.eth.get_balance(address),
+                lambda: self.web3.eth.block_number,
+            )
+        return Decimal(str(balance_wei))
+
+    async def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message using the wallet's private key.
+
+        Args:
+            message (str | bytes): The message to sign, either as a string or bytes
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        if isinstance(message, str):
+            message = message.encode()
+        message_obj = encode_defunct(message)
+        signed = self.account.sign_message(message_obj)
+        return HexStr(signed.signature.hex())
+
+    async def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard.
+
+        Args:
+            typed_data (dict[str, Any]): The typed data to sign following EIP-712 format
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        signed = self.account.sign_typed_data(full_message=typed_data)
+        return HexStr(signed.signature.hex())
+
+    async def sign_transaction(self, transaction: TxParams) -> SignedTransaction:
+        """Sign an EVM transaction.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data.
+
+        Returns:
+            SignedTransaction: The signed transaction object
+
+        """
+        transaction = {
+            "chainId": int(self._network.chain_id),
+            "from": self.account.address,
+            **transaction,
+        }
+
+        return self.account.sign_transaction(transaction)
+
+    async def estimate_fees(self) -> tuple[int, int]:
+        """Estimate gas fees for a transaction, applying the configured fee multipliers.
+
+        Returns:
+            tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
+
+        """
+        fee_estimate = await get_async_fee_oracle(
+            self._network.chain_id, self.web3
+        ).get_fee_estimate()
+
+        # Multiply the configured fee multiplier to give some buffer
+        base_fee_per_gas = int(fee_estimate.base_fee_per_gas * self._fee_per_gas_multiplier)
+        max_priority_fee_per_gas = int(
+            fee_estimate.max_priority_fee_per_gas() * self._fee_per_gas_multiplier
+        )
+        max_fee_per_gas = base_fee_per_gas + max_priority_fee_per_gas
+
+        return (max_priority_fee_per_gas, max_fee_per_gas)
+
+    async def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Sign a transaction locally and send it to the network.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data, left
+                unchanged
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        Raises:
+            Exception: If transaction preparation or sending fails
+
+        """
+        transaction = {
+            **transaction,
+            "from": self.account.address,
+            "chainId": int(self._network.chain_id),
+        }
+
+        max_priority_fee_per_gas, max_fee_per_gas = await self.estimate_fees()
+        transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+        transaction["maxFeePerGas"] = max_fee_per_gas
+
+        gas = int(await self.web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
+        transaction["gas"] = gas
+
+        async def send_with_nonce(nonce: int) -> HexStr:
+            signed = await self.sign_transaction({**transaction, "nonce": nonce})
+            try:
+                return Web3.to_hex(await self.web3.eth.send_raw_transaction(signed.raw_transaction))
+            except Exception as e:
+                if not is_already_known(e):
+                    raise
+
+            # An earlier broadcast of this exact transaction reached the node
+            await self._nonce_manager.resync()
+            return Web3.to_hex(signed.hash)
+
+        return await self._nonce_manager.send(send_with_nonce)
+
+    async def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float | None): Time between polling attempts in seconds, defaults to
+                web3's polling interval
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        Raises:
+            TimeoutError: If transaction is not mined within timeout period
+
+        """
+        if poll_latency is not None:
+            receipt = await self.web3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=timeout, poll_latency=poll_latency
+            )
+        else:
+            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+
+        # Reads made after the wait see the state the transaction produced
+        if self._read_cache is not None:
+            self._read_cache.observe_head(receipt["blockNumber"])
+        return receipt
+
+    async def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        contract_address = Web3.to_checksum_address(contract_address)
+        function = get_compiled_function(abi, function_name, args)
+        data = function.encode(args)
+        key = (contract_address.lower(), data)
+
+        def call() -> Awaitable[bytes]:
+            # Identical reads already in flight share one eth_call
+            return self._read_flight.do(
+                (*key, block_identifier),
+                lambda: self.web3.eth.call(
+                    {"to": contract_address, "data": data}, block_identifier=block_identifier
+                ),
+            )
+
+        if self._read_cache is None:
+            return_data = await call()
+        else:
+            return_data = await self._read_cache.aread(
+                function_name, key, block_identifier, call, lambda: self.web3.eth.block_number
+            )
+        return function.decode(return_data)
+
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        Raises:
+            Exception: If transfer fails
+
+        """
+        try:
+            value_wei = Web3.to_wei(value, "ether")
+
+            transfer_result = await self.send_transaction(
+                {
+                    "to": Web3.to_checksum_address(to),
+                    "value": value_wei,
+                }
+            )
+
+            receipt = await self.wait_for_transaction_receipt(transfer_result)
+            if not receipt:
+                raise Exception("Transaction failed")
+
+            tx_hash = receipt["transactionHash"]
+            if not tx_hash:
+                raise Exception("Transaction hash not found")
+
+            return tx_hash.hex()
+        except Exception as e:
+            raise Exception(f"Failed to transfer native tokens: {e!s}") from e
@@ -0,0 +1,81 @@
+"""Base class for asyncio EVM-compatible wallet providers."""
+
+from abc import abstractmethod
+from decimal import Decimal
+from typing import Any
+
+from eth_account.datastructures import SignedTransaction
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from .wallet_provider import WalletProviderBase
+
+
+class AsyncEvmWalletProvider(WalletProviderBase):
+    """Abstract base class for EVM wallet providers driven from an asyncio event loop.
+
+    Mirrors EvmWalletProvider, with every method that performs network I/O as a coroutine so
+    a single event loop can drive many wallets at once.
+    """
+
+    @abstractmethod
+    async def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency."""
+        pass
+
+    @abstractmethod
+    async def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message using the wallet's private key."""
+        pass
+
+    @abstractmethod
+    async def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 standard."""
+        pass
+
+    @abstractmethod
+    async def sign_transaction(self, transaction: TxParams) -> SignedTransaction | HexStr:
+        """Sign an EVM transaction."""
+        pass
+
+    @abstractmethod
+    async def send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a signed transaction to the network."""
+        pass
+
+    async def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions and return their hashes in order.
+
+        The default sends one after another.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
+
+        Returns:
+            list[HexStr]: The transaction hashes as hex strings
+
+        """
+        return [await self.send_transaction(transaction) for transaction in transactions]
+
+    @abstractmethod
+    async def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt."""
+        pass
+
+    @abstractmethod
+    async def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract."""
+        pass
+
+    @abstractmethod
+    async def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network."""
+        pass
@@ -0,0 +1,292 @@
+"""Non-blocking handles for CDP transfers and trades."""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+# Matches the default timeout of the CDP SDK's Transfer.wait and Trade.wait
+DEFAULT_OPERATION_TIMEOUT = 20.0
+POLL_INTERVAL = 0.5
+MAX_PARALLEL_RELOADS = 8
+
+
+class CdpOperationHandle(Generic[T]):
+    """A CDP transfer or trade that has been broadcast and is confirming in the background.
+
+    The handle can be polled for its status, waited on with result, awaited from asyncio
+    code, or collected together with other handles through wait_all. The shared CDP operation
+    watcher resolves it once the operation reaches a terminal state.
+    """
+
+    def __init__(
+        self,
+        operation: Any,
+        is_terminal: Callable[[Any], bool],
+        resolve: Callable[[Any], T],
+        description: str,
+    ):
+        """Initialize the handle.
+
+        Args:
+            operation (Any): The CDP SDK Transfer or Trade
+            is_terminal (Callable[[Any], bool]): Whether the operation has completed or failed
+            resolve (Callable[[Any], T]): Builds the result of a completed operation
+            description (str): A short description used in error messages, e.g. 'Transfer'
+
+        """
+        self._operation = operation
+        self._is_terminal = is_terminal
+        self._resolve = resolve
+        self._description = description
+        self._future: Future[T] = Future()
+
+    @property
+    def operation(self) -> Any:
+        """Get the underlying CDP SDK object.
+
+        Returns:
+            Any: The Transfer or Trade
+
+        """
+        return self._operation
+
+    @property
+    def status(self) -> str:
+        """Get the last known status of the operation without querying CDP.
+
+        Returns:
+            str: The status, e.g. 'broadcast', 'complete' or 'failed'
+
+        """
+        return str(self._operation.status)
+
+    def poll(self) -> str:
+        """Reload the operation from CDP and return its status.
+
+        Returns:
+            str: The current status
+
+        """
+        if not self.done():
+            self._operation.reload()
+            self._check()
+        return self.status
+
+    def done(self) -> bool:
+        """Check whether the operation has been resolved.
+
+        Returns:
+            bool: True if the operation completed, failed or timed out
+
+        """
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> T:
+        """Wait for the operation to complete and return its result.
+
+        Args:
+            timeout (float | None): Maximum time to wait in seconds, waits until the operation
+                is resolved if not provided
+
+        Returns:
+            T: The result of the operation
+
+        Raises:
+            TimeoutError: If the operation is not resolved within the timeout
+            Exception: If the operation failed
+
+        """
+        return self._future.result(timeout)
+
+    def __await__(self) -> Generator[Any, None, T]:
+        """Wait for the operation from asyncio code without blocking the event loop.
+
+        Returns:
+            Generator[Any, None, T]: The awaitable result of the operation
+
+        """
+        return asyncio.wrap_future(self._future).__await__()
+
+    @staticmethod
+    def wait_all(
+        handles: Iterable["CdpOperationHandle[T]"],
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[T | Exception]:
+        """Wait for several operations and return their results in order.
+
+        Args:
+            handles (Iterable[CdpOperationHandle[T]]): The operations to wait for
+            timeout (float | None): Maximum time to wait in seconds for all operations together
+            return_exceptions (bool): Whether failed operations return their error instead of
+                raising it
+
+        Returns:
+            list[T | Exception]: The results, in the order of the handles
+
+        Raises:
+            Exception: The first failure, unless return_exceptions is set
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        results: list[T | Exception] = []
+        for handle in handles:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                results.append(handle.result(remaining))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+
+        return results
+
+    def _check(self) -> bool:
+        """Resolve the handle if the operation has reached a terminal state.
+
+        Returns:
+            bool: True if the handle is resolved
+
+        """
+        if self.done():
+            return True
+        if not self._is_terminal(self._operation):
+            return False
+
+        with contextlib.suppress(Exception):
+            if self.status != "complete":
+                self._future.set_exception(
+                    Exception(f"{self._description} failed with status {self.status}")
+                )
+            else:
+                try:
+                    self._future.set_result(self._resolve(self._operation))
+                except Exception as e:
+                    self._future.set_exception(e)
+        return True
+
+    def _expire(self, timeout: float) -> None:
+        """Fail the handle because the operation did not finish in time.
+
+        Args:
+            timeout (float): The timeout that was exceeded, in seconds
+
+        """
+        # The future may have been resolved by a concurrent poll
+        with contextlib.suppress(Exception):
+            self._future.set_exception(
+                TimeoutError(
+                    f"Timed out waiting for {self._description} to land onchain after {timeout} seconds"
+                )
+            )
+
+
+class CdpOperationWatcher:
+    """Resolves CDP operation handles from a single background thread.
+
+    Every poll reloads all pending operations in parallel. The thread exits when nothing is
+    pending.
+    """
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        """Initialize the watcher.
+
+        Args:
+            poll_interval (float): Seconds between polls
+
+        """
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._pending: dict[CdpOperationHandle, tuple[float, float]] = {}
+        self._worker: threading.Thread | None = None
+
+    def watch(
+        self, handle: CdpOperationHandle[T], timeout: float = DEFAULT_OPERATION_TIMEOUT
+    ) -> CdpOperationHandle[T]:
+        """Watch a handle until its operation reaches a terminal state or times out.
+
+        Args:
+            handle (CdpOperationHandle[T]): The handle to resolve
+            timeout (float): Seconds after which the handle fails with a TimeoutError
+
+        Returns:
+            CdpOperationHandle[T]: The same handle
+
+        """
+        if handle._check():
+            return handle
+
+        with self._lock:
+            self._pending[handle] = (time.monotonic() + timeout, timeout)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="agentkit-cdp-operation-watcher", daemon=True
+                )
+                self._worker.start()
+
+        return handle
+
+    def _run(self) -> None:
+        """Poll pending operations until nothing is pending."""
+        with ThreadPoolExecutor(
+            max_workers=MAX_PARALLEL_RELOADS, thread_name_prefix="agentkit-cdp-reload"
+        ) as executor:
+            while True:
+                time.sleep(self._poll_interval)
+
+                with self._lock:
+                    if not self._pending:
+                        self._worker = None
+                        return
+                    snapshot = dict(self._pending)
+
+                list(executor.map(self._poll_handle, snapshot.items()))
+
+                with self._lock:
+                    for handle in snapshot:
+                        if handle.done():
+                            self._pending.pop(handle, None)
+
+    @staticmethod
+    def _poll_handle(entry: tuple[CdpOperationHandle, tuple[float, float]]) -> None:
+        """Reload one operation, resolving or expiring its handle.
+
+        Args:
+            entry (tuple[CdpOperationHandle, tuple[float, float]]): The handle with its
+                deadline and timeout
+
+        """
+        handle, (deadline, timeout) = entry
+        # Transient API failures are retried on the next poll
+        with contextlib.suppress(Exception):
+            handle.poll()
+
+        if not handle.done() and time.monotonic() >= deadline:
+            handle._expire(timeout)
+
+
+_watcher: CdpOperationWatcher | None = None
+_watcher_lock = threading.Lock()
+
+
+def get_cdp_operation_watcher() -> CdpOperationWatcher:
+    """Get the process-wide CDP operation watcher, creating it on first use.
+
+    Returns:
+        CdpOperationWatcher: The operation watcher
+
+    """
+    global _watcher
+
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = CdpOperationWatcher()
+
+        return _watcher
@@ -2,7 +2,10 @@
 
 import json
 import os
+import threading
+from concurrent.futures import Future
 from decimal import Decimal
+from functools import partial
 from typing import Any
 
 from cdp import (
@@ -19,8 +22,26 @@ from pydantic import BaseModel, Field
 from web3 import Web3
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
+from ..abi import get_compiled_function
 from ..network import NETWORK_ID_TO_CHAIN, Network
-from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .cdp_operation import (
+    DEFAULT_OPERATION_TIMEOUT,
+    CdpOperationHandle,
+    get_cdp_operation_watcher,
+)
+from .evm_wallet_provider import (
+    EvmGasConfig,
+    EvmReadCacheConfig,
+    EvmRpcConfig,
+    EvmWalletProvider,
+)
+from .fee_oracle import FeeEstimate, get_fee_oracle
+from .head_subscription import get_head_subscription
+from .nonce_manager import NonceManager, is_already_known
+from .receipt_watcher import get_receipt_watcher
+from .rpc_batch import broadcast_in_parallel, fetch_send_preparation
+from .rpc_pool import get_rpc_endpoint_pool
+from .single_flight import SingleFlight
 
 
 class CdpProviderConfig(BaseModel):
@@ -37,10 +58,24 @@ class CdpWalletProviderConfig(CdpProviderConfig):
     mnemonic_phrase: str | None = Field(None, description="The mnemonic phrase of the wallet")
     wallet_data: str | None = Field(None, description="The data of the CDP Wallet as a JSON string")
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
+    rpc: EvmRpcConfig | None = Field(None, description="RPC endpoint pool settings")
+    read_cache: EvmReadCacheConfig | None = Field(
+        None, description="Read cache settings, reads are not cached if not provided"
+    )
+    preload_wallet: bool = Field(
+        True,
+        description="Start loading the wallet in the background on construction, "
+        "instead of on first use",
+    )
 
 
 class CdpWalletProvider(EvmWalletProvider):
-    """A wallet provider that uses the CDP SDK."""
+    """A wallet provider that uses the CDP SDK.
+
+    Creating or importing the CDP wallet takes several API round trips, so construction only
+    configures the SDK and the wallet is loaded in the background. Calls that need the wallet
+    wait for it to finish loading; load_wallet returns a future to wait on it up front.
+    """
 
     def __init__(self, config: CdpWalletProviderConfig | None = None):
         """Initialize CDP wallet provider.
@@ -70,27 +105,37 @@ class CdpWalletProvider(EvmWalletProvider):
 
             network_id = config.network_id or os.getenv("NETWORK_ID", "base-sepolia")
             chain = NETWORK_ID_TO_CHAIN[network_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
 
             if not network_id:
                 raise ValueError("NETWORK_ID is required")
 
             if config.wallet_data:
                 wallet_data = WalletData.from_dict(json.loads(config.wallet_data))
-                self._wallet = Wallet.import_data(wallet_data)
+                self._create_wallet = partial(Wallet.import_data, wallet_data)
             elif config.mnemonic_phrase:
                 phrase = MnemonicSeedPhrase(config.mnemonic_phrase)
-                self._wallet = Wallet.import_wallet(phrase, network_id)
+                self._create_wallet = partial(Wallet.import_wallet, phrase, network_id)
             else:
-                self._wallet = Wallet.create(network_id=network_id)
+                self._create_wallet = partial(Wallet.create, network_id=network_id)
 
-            self._address = self._wallet.default_address.address_id
+            self._wallet_future: Future[Wallet] = Future()
+            self._wallet_load_lock = threading.Lock()
+            self._wallet_load_started = False
             self._network = Network(
                 protocol_family="evm",
                 network_id=network_id,
                 chain_id=chain.id,
             )
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            rpc_config = config.rpc or EvmRpcConfig()
+            self._web3 = Web3(
+                get_rpc_endpoint_pool(
+                    chain.id,
+                    rpc_config.rpc_urls or chain.rpc_urls["default"].http,
+                    hedge_requests=rpc_config.hedge_requests,
+                    failure_threshold=rpc_config.failure_threshold,
+                    recovery_timeout=rpc_config.recovery_timeout,
+                )
+            )
 
             self._gas_limit_multiplier = (
                 max(config.gas.gas_limit_multiplier, 1)
@@ -104,6 +149,29 @@ class CdpWalletProvider(EvmWalletProvider):
                 else 1
             )
 
+            ws_urls = (
+                [rpc_config.ws_url] if rpc_config.ws_url else chain.rpc_urls["default"].web_socket
+            )
+            head_subscription = (
+                get_head_subscription(chain.id, ws_urls[0], chain.block_time) if ws_urls else None
+            )
+
+            self._fee_oracle = get_fee_oracle(chain.id, self._web3, head_subscription)
+            self._receipt_watcher = get_receipt_watcher(
+                chain.id, self._web3, chain.block_time, head_subscription
+            )
+            self._nonce_manager = NonceManager(
+                lambda: self._web3.eth.get_transaction_count(self._address, "pending")
+            )
+            self._read_flight = SingleFlight()
+            self._read_cache = (
+                config.read_cache.create_cache(chain.block_time) if config.read_cache else None
+            )
+            if self._read_cache is not None and head_subscription is not None:
+                self._read_cache.follow(head_subscription)
+
+            if config.preload_wallet:
+                self.load_wallet()
 
         except ImportError as e:
             raise ImportError(
@@ -112,6 +180,84 @@ class CdpWalletProvider(EvmWalletProvider):
         except Exception as e:
             raise ValueError(f"Failed to initialize CDP wallet: {e!s}") from e
 
+    @property
+    def _wallet(self) -> Wallet:
+        """Get the CDP wallet, waiting for it to load if needed.
+
+        Returns:
+            Wallet: The CDP wallet
+
+        Raises:
+            ValueError: If the wallet failed to load
+
+        """
+        wallet = getattr(self, "_loaded_wallet", None)
+        if wallet is None:
+            try:
+                wallet = self.load_wallet().result()
+            except Exception as e:
+                raise ValueError(f"Failed to initialize CDP wallet: {e!s}") from e
+            self._loaded_wallet = wallet
+        return wallet
+
+    @_wallet.setter
+    def _wallet(self, wallet: Wallet) -> None:
+        """Set the CDP wallet.
+
+        Args:
+            wallet (Wallet): The CDP wallet
+
+        """
+        self._loaded_wallet = wallet
+
+    @property
+    def _address(self) -> str:
+        """Get the wallet's default address, waiting for the wallet to load if needed.
+
+        Returns:
+            str: The address as a hex string
+
+        """
+        return self._wallet.default_address.address_id
+
+    def load_wallet(self) -> Future[Wallet]:
+        """Start loading the CDP wallet in the background, if it is not loading already.
+
+        Returns:
+            Future[Wallet]: Resolves to the wallet once it has been created or imported
+
+        """
+        with self._wallet_load_lock:
+            if not self._wallet_load_started:
+                self._wallet_load_started = True
+                self._wallet_future.set_running_or_notify_cancel()
+                threading.Thread(
+                    target=self._run_wallet_load, name="agentkit-cdp-wallet-load", daemon=True
+                ).start()
+        return self._wallet_future
+
+    def _run_wallet_load(self) -> None:
+        """Create or import the wallet and resolve the readiness future. Runs on a thread."""
+        try:
+            wallet = self._create_wallet()
+        except BaseException as e:
+            self._wallet_future.set_exception(e)
+        else:
+            self._wallet_future.set_result(wallet)
+
+    def track_initialization(self) -> None:
+        """Track the initialization of the wallet provider once the wallet has loaded.
+
+        The event needs the wallet's address, so it is sent from the loading thread instead
+        of waiting for the wallet here.
+        """
+
+        def track(future: Future[Wallet]) -> None:
+            if not future.cancelled() and future.exception() is None:
+                super(CdpWalletProvider, self).track_initialization()
+
+        self._wallet_future.add_done_callback(track)
+
     def get_address(self) -> str:
         """Get the wallet address.
 
@@ -134,7 +280,16 @@ class CdpWalletProvider(EvmWalletProvider):
         if not self._wallet:
             raise Exception("Wallet not initialized")
 
-        balance = self._wallet.balance("eth")
+        if self._read_cache is None:
+            balance = self._wallet.balance("eth")
+        else:
+            balance = self._read_cache.read(
+                "getBalance",
+                self._address,
+                "latest",
+                lambda: self._wallet.balance("eth"),
+                lambda: self._web3.eth.block_number,
+            )
         return Decimal(str(Web3.to_wei(balance, "ether")))
 
     def get_name(self) -> str:
@@ -168,28 +323,52 @@ class CdpWalletProvider(EvmWalletProvider):
         Raises:
             Exception: If transfer fails or wallet is not initialized
 
+        """
+        handle = self.start_native_transfer(to, value)
+
+        try:
+            return handle.result()
+        except Exception as e:
+            raise Exception(f"Failed to transfer native tokens: {e!s}") from e
+
+    def start_native_transfer(
+        self, to: str, value: Decimal, timeout: float = DEFAULT_OPERATION_TIMEOUT
+    ) -> CdpOperationHandle[str]:
+        """Start a transfer of the native asset and return once it has been broadcast.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+            timeout (float): Seconds to wait for confirmation before the handle fails
+
+        Returns:
+            CdpOperationHandle[str]: A handle that resolves to the transaction hash
+
+        Raises:
+            Exception: If the transfer cannot be started or wallet is not initialized
+
         """
         if not self._wallet:
             raise Exception("Wallet not initialized")
 
         try:
-            transfer_result = self._wallet.transfer(
+            transfer = self._wallet.transfer(
                 amount=value,
                 asset_id="eth",
                 destination=Web3.to_checksum_address(to),
                 gasless=False,
             )
-
-            transfer_result.wait()
-            tx_hash = transfer_result.transaction_hash
-
-            if not tx_hash:
-                raise Exception("Transaction hash not found")
-
-            return tx_hash
         except Exception as e:
             raise Exception(f"Failed to transfer native tokens: {e!s}") from e
 
+        handle = CdpOperationHandle(
+            transfer,
+            is_terminal=lambda transfer: transfer.terminal_state,
+            resolve=_transfer_transaction_hash,
+            description="Transfer",
+        )
+        return get_cdp_operation_watcher().watch(handle, timeout)
+
     def read_contract(
         self,
         contract_address: ChecksumAddress,
@@ -214,11 +393,27 @@ class CdpWalletProvider(EvmWalletProvider):
             Exception: If the contract call fails or wallet is not initialized
 
         """
-        contract = self._web3.eth.contract(address=contract_address, abi=abi)
-        func = contract.functions[function_name]
-        if args is None:
-            args = []
-        return func(*args).call(block_identifier=block_identifier)
+        contract_address = Web3.to_checksum_address(contract_address)
+        function = get_compiled_function(abi, function_name, args)
+        data = function.encode(args)
+        key = (contract_address.lower(), data)
+
+        def call() -> bytes:
+            # Identical reads already in flight share one eth_call
+            return self._read_flight.do(
+                (*key, block_identifier),
+                lambda: self._web3.eth.call(
+                    {"to": contract_address, "data": data}, block_identifier=block_identifier
+                ),
+            )
+
+        if self._read_cache is None:
+            return_data = call()
+        else:
+            return_data = self._read_cache.read(
+                function_name, key, block_identifier, call, lambda: self._web3.eth.block_number
+            )
+        return function.decode(return_data)
 
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key.
@@ -300,7 +495,65 @@ class CdpWalletProvider(EvmWalletProvider):
             Exception: If transaction preparation or sending fails
 
         """
-        self._prepare_transaction(transaction)
+        (transaction,) = self._prepare_transactions([transaction])
+
+        def send_with_nonce(nonce: int) -> HexStr:
+            return self._sign_and_broadcast(transaction, nonce)
+
+        return self._nonce_manager.send(send_with_nonce)
+
+    def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions at once and return their hashes in order.
+
+        Fees and gas for every transaction are fetched in one batched request, the transactions
+        get consecutive nonces and are signed and broadcast in parallel, so they can all be
+        included in the next block.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data.
+                A transaction that depends on an earlier one, such as a deposit after an approve,
+                cannot be estimated before the earlier one is mined and must set its own gas
+
+        Returns:
+            list[HexStr]: The transaction hashes as hex strings
+
+        Raises:
+            BroadcastError: If some of the transactions fail to broadcast, with the hashes of
+                the others
+            Exception: If transaction preparation fails
+
+        """
+        if not transactions:
+            return []
+
+        transactions = self._prepare_transactions(transactions)
+
+        def send_with_nonces(nonces: list[int]) -> list[HexStr]:
+            return broadcast_in_parallel(
+                [
+                    partial(self._sign_and_broadcast, transaction, nonce)
+                    for transaction, nonce in zip(transactions, nonces, strict=True)
+                ]
+            )
+
+        return self._nonce_manager.send_many(len(transactions), send_with_nonces)
+
+    def _sign_and_broadcast(self, transaction: TxParams, nonce: int) -> HexStr:
+        """Sign a prepared transaction with the given nonce and broadcast it through CDP.
+
+        Args:
+            transaction (TxParams): The prepared transaction
+            nonce (int): The nonce to send with
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        # A send retried after a nonce error signs the same prepared transaction again
+        transaction = {
+            **{key: value for key, value in transaction.items() if key not in ("r", "s", "v")},
+            "nonce": nonce,
+        }
 
         signature = self.sign_transaction(transaction)
 
@@ -315,92 +568,123 @@ class CdpWalletProvider(EvmWalletProvider):
         external_address = ExternalAddress(
             self._wallet.network_id, self._wallet.default_address.address_id
         )
-        broadcasted_transaction = external_address.broadcast_external_transaction(
-            "02" + signed_bytes.hex()
-        )
+        raw_transaction = "02" + signed_bytes.hex()
+        try:
+            broadcasted_transaction = external_address.broadcast_external_transaction(
+                raw_transaction
+            )
+        except Exception as e:
+            if not is_already_known(e):
+                raise
+
+            # An earlier broadcast of this exact transaction reached the node
+            self._nonce_manager.resync()
+            return Web3.to_hex(Web3.keccak(hexstr=raw_transaction))
 
         return broadcasted_transaction.transaction_hash
 
     def wait_for_transaction_receipt(
-        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
     ) -> dict[str, Any]:
         """Wait for transaction confirmation and return receipt.
 
+        By default the wait is served by the chain's shared receipt watcher, which checks all
+        pending transactions in one batched request per block.
+
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float | None): Time between polling attempts in seconds. If set, this
+                transaction is polled on its own instead of through the receipt watcher
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
 
         Raises:
-            TimeoutError: If transaction is not mined within timeout period
+            TimeExhausted: If transaction is not mined within timeout period
 
         """
-        return self._web3.eth.wait_for_transaction_receipt(
-            tx_hash, timeout=timeout, poll_latency=poll_latency
-        )
+        if poll_latency is not None:
+            receipt = self._web3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=timeout, poll_latency=poll_latency
+            )
+        else:
+            receipt = self._receipt_watcher.wait_for_transaction_receipt(tx_hash, timeout=timeout)
 
-    def _prepare_transaction(self, transaction: TxParams) -> TxParams:
-        """Prepare EIP-1559 transaction for signing.
+        # Reads made after the wait see the state the transaction produced
+        if self._read_cache is not None:
+            self._read_cache.observe_head(receipt["blockNumber"])
+        return receipt
+
+    def _prepare_transactions(self, transactions: list[TxParams]) -> list[TxParams]:
+        """Prepare EIP-1559 transactions for signing.
+
+        Fee history, gas estimates and, if the nonce is not synced yet, the transaction count
+        are fetched in a single batched JSON-RPC request. Transactions that set their own gas
+        keep it. The nonce is not set here, it is allocated by the nonce manager at send time.
 
         Args:
-            transaction (TxParams): Raw transaction parameters
+            transactions (list[TxParams]): Raw transaction parameters, left unchanged
 
         Returns:
-            TxParams: Transaction parameters with gas estimation and fee calculation
+            list[TxParams]: Transaction parameters with gas estimation and fee calculation
 
         Raises:
             Exception: If transaction preparation fails
 
         """
-        if transaction["to"]:
-            transaction["to"] = Web3.to_bytes(hexstr=transaction["to"])
-        else:
-            transaction["to"] = b""
-
-        transaction["from"] = self._address
-        transaction["value"] = int(transaction.get("value", 0))
-        transaction["type"] = 2
-        transaction["chainId"] = int(self._network.chain_id)
+        transactions = [dict(transaction) for transaction in transactions]
+        for transaction in transactions:
+            if transaction["to"]:
+                transaction["to"] = Web3.to_bytes(hexstr=transaction["to"])
+            else:
+                transaction["to"] = b""
 
-        nonce = self._web3.eth.get_transaction_count(self._address)
-        transaction["nonce"] = nonce
+            transaction["from"] = self._address
+            transaction["value"] = int(transaction.get("value", 0))
+            transaction["type"] = 2
+            transaction["chainId"] = int(self._network.chain_id)
 
-        data_field = transaction.get("data", b"")
-        if isinstance(data_field, str) and data_field.startswith("0x"):
-            data_bytes = bytes.fromhex(data_field[2:])
+            data_field = transaction.get("data", b"")
+            if isinstance(data_field, str) and data_field.startswith("0x"):
+                data_field = bytes.fromhex(data_field[2:])
 
-        transaction["data"] = data_bytes
+            transaction["data"] = data_field
 
-        max_priority_fee_per_gas, max_fee_per_gas = self._estimate_fees()
-        transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
-        transaction["maxFeePerGas"] = max_fee_per_gas
+        fee_estimate, gas_estimates = fetch_send_preparation(
+            self._web3, transactions, self._fee_oracle, self._nonce_manager, self._address
+        )
 
-        gas = int(self._web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
-        transaction["gas"] = gas
+        max_priority_fee_per_gas, max_fee_per_gas = self._estimate_fees(fee_estimate)
+        for transaction, gas_estimate in zip(transactions, gas_estimates, strict=True):
+            transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+            transaction["maxFeePerGas"] = max_fee_per_gas
+            if gas_estimate is not None:
+                transaction["gas"] = int(gas_estimate * self._gas_limit_multiplier)
 
-        del transaction["from"]
+            del transaction["from"]
 
-        return transaction
+        return transactions
 
-    def _estimate_fees(self):
+    def _estimate_fees(self, fee_estimate: FeeEstimate | None = None):
         """Estimate gas fees for a transaction, applying the configured fee multipliers.
 
+        Args:
+            fee_estimate (FeeEstimate | None): Fee data to use, fetched from the fee oracle if not provided
+
         Returns:
             tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
         """
+        if fee_estimate is None:
+            fee_estimate = self._fee_oracle.get_fee_estimate()
 
         def get_base_fee():
-            latest_block = self._web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
             # Multiply the configured fee multiplier to give some buffer
-            return int(base_fee * self._fee_per_gas_multiplier)
+            return int(fee_estimate.base_fee_per_gas * self._fee_per_gas_multiplier)
 
         def get_max_priority_fee():
-            max_priority_fee_per_gas = Web3.to_wei(0.1, "gwei")
+            max_priority_fee_per_gas = fee_estimate.max_priority_fee_per_gas()
             # Multiply the configured fee multiplier to give some buffer
             return int(max_priority_fee_per_gas * self._fee_per_gas_multiplier)
 
@@ -528,23 +812,82 @@ class CdpWalletProvider(EvmWalletProvider):
         Raises:
             Exception: If trade fails or wallet is not initialized
 
+        """
+        handle = self.start_trade(amount, from_asset_id, to_asset_id)
+
+        try:
+            return handle.result()
+        except Exception as e:
+            raise Exception(f"Error trading assets: {e!s}") from e
+
+    def start_trade(
+        self,
+        amount: str,
+        from_asset_id: str,
+        to_asset_id: str,
+        timeout: float = DEFAULT_OPERATION_TIMEOUT,
+    ) -> CdpOperationHandle[str]:
+        """Start a trade of one asset for another and return once it has been broadcast.
+
+        Args:
+            amount (str): The amount of the from asset to trade, e.g. `15`, `0.000001`.
+            from_asset_id (str): The from asset ID to trade (e.g., "eth", "usdc", or a valid contract address).
+            to_asset_id (str): The to asset ID to trade (e.g., "eth", "usdc", or a valid contract address).
+            timeout (float): Seconds to wait for confirmation before the handle fails
+
+        Returns:
+            CdpOperationHandle[str]: A handle that resolves to a message containing the trade
+                details and transaction information
+
+        Raises:
+            Exception: If the trade cannot be started or wallet is not initialized
+
         """
         if not self._wallet:
             raise Exception("Wallet not initialized")
 
         try:
-            trade_result = self._wallet.trade(
+            trade = self._wallet.trade(
                 amount=amount,
                 from_asset_id=from_asset_id,
                 to_asset_id=to_asset_id,
-            ).wait()
+            )
+        except Exception as e:
+            raise Exception(f"Error trading assets: {e!s}") from e
 
+        def describe_trade(trade) -> str:
             return "\n".join(
                 [
-                    f"Traded {amount} of {from_asset_id} for {trade_result.to_amount} of {to_asset_id}.",
-                    f"Transaction hash for the trade: {trade_result.transaction.transaction_hash}",
-                    f"Transaction link for the trade: {trade_result.transaction.transaction_link}",
+                    f"Traded {amount} of {from_asset_id} for {trade.to_amount} of {to_asset_id}.",
+                    f"Transaction hash for the trade: {trade.transaction.transaction_hash}",
+                    f"Transaction link for the trade: {trade.transaction.transaction_link}",
                 ]
             )
-        except Exception as e:
-            raise Exception(f"Error trading assets: {e!s}") from e
+
+        handle = CdpOperationHandle(
+            trade,
+            is_terminal=lambda trade: trade.transaction.terminal_state,
+            resolve=describe_trade,
+            description="Trade",
+        )
+        return get_cdp_operation_watcher().watch(handle, timeout)
+
+
+def _transfer_transaction_hash(transfer) -> str:
+    """Get the transaction hash of a completed transfer.
+
+    Args:
+        transfer: The completed CDP transfer
+
+    Returns:
+        str: The transaction hash
+
+    Raises:
+        Exception: If the transfer has no transaction hash
+
+    """
+    tx_hash = transfer.transaction_hash
+    if not tx_hash:
+        raise Exception("Transaction hash not found")
+
+    return tx_hash
@@ -1,6 +1,8 @@
 """Eth account wallet provider."""
 
+from collections.abc import Hashable
 from decimal import Decimal
+from functools import partial
 from typing import Any
 
 from eth_account.account import LocalAccount
@@ -8,11 +10,23 @@ from eth_account.datastructures import SignedTransaction
 from eth_account.messages import encode_defunct
 from pydantic import BaseModel, Field
 from web3 import Web3
-from web3.middleware import SignAndSendRawMiddlewareBuilder
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
+from ..abi import get_compiled_function
 from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
-from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .evm_wallet_provider import (
+    EvmGasConfig,
+    EvmReadCacheConfig,
+    EvmRpcConfig,
+    EvmWalletProvider,
+)
+from .fee_oracle import FeeEstimate, get_fee_oracle
+from .head_subscription import get_head_subscription
+from .nonce_manager import NonceManager, is_already_known
+from .receipt_watcher import get_receipt_watcher
+from .rpc_batch import broadcast_in_parallel, fetch_send_preparation
+from .rpc_pool import get_rpc_endpoint_pool
+from .single_flight import SingleFlight
 
 
 class EthAccountWalletProviderConfig(BaseModel):
@@ -21,6 +35,10 @@ class EthAccountWalletProviderConfig(BaseModel):
     account: LocalAccount
     chain_id: str
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
+    rpc: EvmRpcConfig | None = Field(None, description="RPC endpoint pool settings")
+    read_cache: EvmReadCacheConfig | None = Field(
+        None, description="Read cache settings, reads are not cached if not provided"
+    )
 
     class Config:
         """Configuration for EthAccountWalletProvider."""
@@ -42,11 +60,16 @@ class EthAccountWalletProvider(EvmWalletProvider):
         self.account = config.account
 
         chain = NETWORK_ID_TO_CHAIN[CHAIN_ID_TO_NETWORK_ID[config.chain_id]]
-        rpc_url = chain.rpc_urls["default"].http[0]
-
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
-        self.web3.middleware_onion.inject(
-            SignAndSendRawMiddlewareBuilder.build(self.account), layer=0
+        rpc_config = config.rpc or EvmRpcConfig()
+
+        self.web3 = Web3(
+            get_rpc_endpoint_pool(
+                config.chain_id,
+                rpc_config.rpc_urls or chain.rpc_urls["default"].http,
+                hedge_requests=rpc_config.hedge_requests,
+                failure_threshold=rpc_config.failure_threshold,
+                recovery_timeout=rpc_config.recovery_timeout,
+            )
         )
 
         self._network = Network(
@@ -67,6 +90,36 @@ class EthAccountWalletProvider(EvmWalletProvider):
             else 1
         )
 
+        ws_urls = [rpc_config.ws_url] if rpc_config.ws_url else chain.rpc_urls["default"].web_socket
+        head_subscription = (
+            get_head_subscription(self.config.chain_id, ws_urls[0], chain.block_time)
+            if ws_urls
+            else None
+        )
+
+        self._fee_oracle = get_fee_oracle(self.config.chain_id, self.web3, head_subscription)
+        self._receipt_watcher = get_receipt_watcher(
+            self.config.chain_id, self.web3, chain.block_time, head_subscription
+        )
+        self._nonce_manager = NonceManager(
+            lambda: self.web3.eth.get_transaction_count(self.account.address, "pending")
+        )
+        self._read_flight = SingleFlight()
+        self._read_cache = (
+            config.read_cache.create_cache(chain.block_time) if config.read_cache else None
+        )
+        if self._read_cache is not None and head_subscription is not None:
+            self._read_cache.follow(head_subscription)
+
+    def _wallet_metadata_key(self) -> Hashable:
+        """Get the account address and chain, so the metadata follows a replaced account.
+
+        Returns:
+            Hashable: The address and chain ID
+
+        """
+        return (self.account.address, self._network.chain_id)
+
     def get_address(self) -> str:
         """Get the wallet address.
 
@@ -92,7 +145,17 @@ class EthAccountWalletProvider(EvmWalletProvider):
             Decimal: The wallet's balance in wei as a Decimal
 
         """
-        balance_wei = self.web3.eth.get_balance(self.account.address)
+        address = self.account.address
+        if self._read_cache is None:
+            balance_wei = self.web3.eth.get_balance(address)
+        else:
+            balance_wei = self._read_cache.read(
+                "getBalance",
+                address,
+                "latest",
+                lambda: self.web3.eth.get_balance(address),
+                lambda: self.web3.eth.block_number,
+            )
         return Decimal(str(balance_wei))
 
     def get_name(self) -> str:
@@ -143,35 +206,39 @@ class EthAccountWalletProvider(EvmWalletProvider):
             SignedTransaction: The signed transaction object
 
         """
-        if "chainId" not in transaction:
-            transaction["chainId"] = int(self._network.chain_id)
-        if "from" not in transaction:
-            transaction["from"] = self.account.address
+        transaction = {
+            "chainId": int(self._network.chain_id),
+            "from": self.account.address,
+            **transaction,
+        }
 
         return self.account.sign_transaction(transaction)
 
-    def estimate_fees(self):
+    def estimate_fees(self, fee_estimate: FeeEstimate | None = None):
         """Estimate gas fees for a transaction, applying the configured fee multipliers.
 
+        Args:
+            fee_estimate (FeeEstimate | None): Fee data to use, fetched from the fee oracle if not provided
+
         Returns:
             tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
         """
+        if fee_estimate is None:
+            fee_estimate = self._fee_oracle.get_fee_estimate()
 
         def get_base_fee():
-            """Get the base fee from the latest block and apply the multiplier.
+            """Get the next block's base fee and apply the multiplier.
 
             Returns:
                 int: The adjusted base fee in wei
 
             """
-            latest_block = self.web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
             # Multiply the configured fee multiplier to give some buffer
-            return int(base_fee * self._fee_per_gas_multiplier)
+            return int(fee_estimate.base_fee_per_gas * self._fee_per_gas_multiplier)
 
         def get_max_priority_fee():
-            max_priority_fee_per_gas = Web3.to_wei(0.1, "gwei")
+            max_priority_fee_per_gas = fee_estimate.max_priority_fee_per_gas()
             # Multiply the configured fee multiplier to give some buffer
             return int(max_priority_fee_per_gas * self._fee_per_gas_multiplier)
 
@@ -184,6 +251,9 @@ class EthAccountWalletProvider(EvmWalletProvider):
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a signed transaction to the network.
 
+        Fee history, the gas estimate and, if the nonce is not synced yet, the transaction count
+        are fetched in a single batched JSON-RPC request before the transaction is sent.
+
         Args:
             transaction (TxParams): Transaction parameters including to, value, and data
 
@@ -194,43 +264,134 @@ class EthAccountWalletProvider(EvmWalletProvider):
             Exception: If transaction preparation or sending fails
 
         """
-        transaction["from"] = self.account.address
-        transaction["chainId"] = int(self._network.chain_id)
+        (transaction,) = self._prepare_transactions([transaction])
+
+        def send_with_nonce(nonce: int) -> HexStr:
+            return self._sign_and_broadcast(transaction, nonce)
+
+        return self._nonce_manager.send(send_with_nonce)
+
+    def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions at once and return their hashes in order.
+
+        Fees and gas for every transaction are fetched in one batched request, the transactions
+        get consecutive nonces and are broadcast in parallel, so they can all be included in the
+        next block.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data.
+                A transaction that depends on an earlier one, such as a deposit after an approve,
+                cannot be estimated before the earlier one is mined and must set its own gas
 
-        nonce = self.web3.eth.get_transaction_count(self.account.address)
-        transaction["nonce"] = nonce
+        Returns:
+            list[HexStr]: The transaction hashes as hex strings
 
-        max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees()
-        transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
-        transaction["maxFeePerGas"] = max_fee_per_gas
+        Raises:
+            BroadcastError: If some of the transactions fail to broadcast, with the hashes of
+                the others
+            Exception: If transaction preparation fails
 
+        """
+        if not transactions:
+            return []
+
+        transactions = self._prepare_transactions(transactions)
+
+        def send_with_nonces(nonces: list[int]) -> list[HexStr]:
+            return broadcast_in_parallel(
+                [
+                    partial(self._sign_and_broadcast, transaction, nonce)
+                    for transaction, nonce in zip(transactions, nonces, strict=True)
+                ]
+            )
 
-        gas = int(self.web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
-        transaction["gas"] = gas
+        return self._nonce_manager.send_many(len(transactions), send_with_nonces)
 
-        hash = self.web3.eth.send_transaction(transaction)
-        return Web3.to_hex(hash)
+    def _prepare_transactions(self, transactions: list[TxParams]) -> list[TxParams]:
+        """Set the sender, chain, fees and gas of transactions, leaving the nonce unset.
+
+        Args:
+            transactions (list[TxParams]): The transactions to prepare, left unchanged
+
+        Returns:
+            list[TxParams]: Prepared copies of the transactions
+
+        """
+        transactions = [
+            {**transaction, "from": self.account.address, "chainId": int(self._network.chain_id)}
+            for transaction in transactions
+        ]
+
+        fee_estimate, gas_estimates = fetch_send_preparation(
+            self.web3, transactions, self._fee_oracle, self._nonce_manager, self.account.address
+        )
+
+        max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees(fee_estimate)
+        for transaction, gas_estimate in zip(transactions, gas_estimates, strict=True):
+            transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+            transaction["maxFeePerGas"] = max_fee_per_gas
+            if gas_estimate is not None:
+                transaction["gas"] = int(gas_estimate * self._gas_limit_multiplier)
+
+        return transactions
+
+    def _sign_and_broadcast(self, transaction: TxParams, nonce: int) -> HexStr:
+        """Sign a prepared transaction with the given nonce and broadcast it.
+
+        Args:
+            transaction (TxParams): The prepared transaction
+            nonce (int): The nonce to send with
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        # A send retried after a nonce error signs the same prepared transaction again
+        transaction = {**transaction, "nonce": nonce}
+        # Signing locally skips eth_sendTransaction middleware, which fetches the latest block
+        signed = self.account.sign_transaction(transaction)
+        try:
+            return Web3.to_hex(self.web3.eth.send_raw_transaction(signed.raw_transaction))
+        except Exception as e:
+            if not is_already_known(e):
+                raise
+
+        # An earlier broadcast of this exact transaction reached the node
+        self._nonce_manager.resync()
+        return Web3.to_hex(signed.hash)
 
     def wait_for_transaction_receipt(
-        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
     ) -> dict[str, Any]:
         """Wait for transaction confirmation and return receipt.
 
+        By default the wait is served by the chain's shared receipt watcher, which checks all
+        pending transactions in one batched request per block.
+
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float | None): Time between polling attempts in seconds. If set, this
+                transaction is polled on its own instead of through the receipt watcher
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
 
         Raises:
-            TimeoutError: If transaction is not mined within timeout period
+            TimeExhausted: If transaction is not mined within timeout period
 
         """
-        return self.web3.eth.wait_for_transaction_receipt(
-            tx_hash, timeout=timeout, poll_latency=poll_latency
-        )
+        if poll_latency is not None:
+            receipt = self.web3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=timeout, poll_latency=poll_latency
+            )
+        else:
+            receipt = self._receipt_watcher.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+
+        # Reads made after the wait see the state the transaction produced
+        if self._read_cache is not None:
+            self._read_cache.observe_head(receipt["blockNumber"])
+        return receipt
 
     def read_contract(
         self,
@@ -253,11 +414,27 @@ class EthAccountWalletProvider(EvmWalletProvider):
             Any: The result of the contract function call
 
         """
-        contract = self.web3.eth.contract(address=contract_address, abi=abi)
-        func = contract.functions[function_name]
-        if args is None:
-            args = []
-        return func(*args).call(block_identifier=block_identifier)
+        contract_address = Web3.to_checksum_address(contract_address)
+        function = get_compiled_function(abi, function_name, args)
+        data = function.encode(args)
+        key = (contract_address.lower(), data)
+
+        def call() -> bytes:
+            # Identical reads already in flight share one eth_call
+            return self._read_flight.do(
+                (*key, block_identifier),
+                lambda: self.web3.eth.call(
+                    {"to": contract_address, "data": data}, block_identifier=block_identifier
+                ),
+            )
+
+        if self._read_cache is None:
+            return_data = call()
+        else:
+            return_data = self._read_cache.read(
+                function_name, key, block_identifier, call, lambda: self.web3.eth.block_number
+            )
+        return function.decode(return_data)
 
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network.
@@ -5,16 +5,93 @@ from typing import Any
 
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
+from web3 import Web3
 from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
 
+from ..abi import get_compiled_function
+from ..network import NETWORK_ID_TO_CHAIN
+from .multicall import MULTICALL3_ABI, ReadContractCall
+from .read_cache import (
+    DEFAULT_BLOCK_TIME,
+    DEFAULT_IMMUTABLE_FUNCTIONS,
+    DEFAULT_MAX_ENTRIES,
+    HEAD_CHECKS_PER_BLOCK,
+    ReadCache,
+)
+from .rpc_pool import DEFAULT_FAILURE_THRESHOLD, DEFAULT_RECOVERY_TIMEOUT
 from .wallet_provider import WalletProvider
 
 
 class EvmGasConfig(BaseModel):
     """Configuration for gas multipliers."""
 
-    gas_limit_multiplier: float | None = Field(None, description="An internal multiplier on gas limit estimation")
-    fee_per_gas_multiplier: float | None = Field(None, description="An internal multiplier on fee per gas estimation")
+    gas_limit_multiplier: float | None = Field(
+        None, description="An internal multiplier on gas limit estimation"
+    )
+    fee_per_gas_multiplier: float | None = Field(
+        None, description="An internal multiplier on fee per gas estimation"
+    )
+
+
+class EvmRpcConfig(BaseModel):
+    """Configuration for the RPC endpoint pool."""
+
+    rpc_urls: list[str] | None = Field(
+        None, description="RPC endpoints to use instead of the chain's default endpoints"
+    )
+    ws_url: str | None = Field(
+        None,
+        description="WebSocket endpoint used to follow new blocks, defaults to the chain's first "
+        "WebSocket endpoint. Without one, new blocks are found by polling",
+    )
+    hedge_requests: bool = Field(
+        True, description="Whether reads slower than an endpoint's p95 go to a second endpoint"
+    )
+    failure_threshold: int = Field(
+        DEFAULT_FAILURE_THRESHOLD,
+        description="Consecutive failures before an endpoint is taken out of rotation",
+    )
+    recovery_timeout: float = Field(
+        DEFAULT_RECOVERY_TIMEOUT,
+        description="Seconds before a failed endpoint receives a trial request",
+    )
+
+
+class EvmReadCacheConfig(BaseModel):
+    """Configuration for the head-aware read cache."""
+
+    immutable_functions: list[str] = Field(
+        default_factory=lambda: list(DEFAULT_IMMUTABLE_FUNCTIONS),
+        description="Contract functions whose results are cached permanently",
+    )
+    function_ttls: dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds to cache each listed function for, instead of until the next block",
+    )
+    max_entries: int = Field(DEFAULT_MAX_ENTRIES, description="Maximum number of cached reads")
+    head_refresh_interval: float | None = Field(
+        None,
+        description="Seconds a seen block number is trusted, defaults to half the block time",
+    )
+
+    def create_cache(self, block_time: float | None = None) -> ReadCache:
+        """Create a read cache with these settings.
+
+        Args:
+            block_time (float | None): The chain's average block time in seconds
+
+        Returns:
+            ReadCache: The read cache
+
+        """
+        return ReadCache(
+            immutable_functions=self.immutable_functions,
+            function_ttls=self.function_ttls,
+            max_entries=self.max_entries,
+            head_refresh_interval=self.head_refresh_interval
+            or (block_time or DEFAULT_BLOCK_TIME) / HEAD_CHECKS_PER_BLOCK,
+        )
+
 
 class EvmWalletProvider(WalletProvider, ABC):
     """Abstract base class for all EVM wallet providers."""
@@ -39,9 +116,24 @@ class EvmWalletProvider(WalletProvider, ABC):
         """Send a signed transaction to the network."""
         pass
 
+    def send_transactions(self, transactions: list[TxParams]) -> list[HexStr]:
+        """Send several transactions and return their hashes in order.
+
+        Providers with local nonce management override this to prepare fees once, assign
+        consecutive nonces and broadcast in parallel. The default sends one after another.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
+
+        Returns:
+            list[HexStr]: The transaction hashes as hex strings
+
+        """
+        return [self.send_transaction(transaction) for transaction in transactions]
+
     @abstractmethod
     def wait_for_transaction_receipt(
-        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
     ) -> dict[str, Any]:
         """Wait for transaction confirmation and return receipt."""
         pass
@@ -57,3 +149,92 @@ class EvmWalletProvider(WalletProvider, ABC):
     ) -> Any:
         """Read data from a smart contract."""
         pass
+
+    def batch_read_contract(
+        self,
+        calls: list[ReadContractCall],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[Any]:
+        """Read data from several smart contract functions in a single Multicall3 call.
+
+        Each result is decoded with its own call's ABI. Falls back to one read_contract per
+        call on networks without a known Multicall3 deployment.
+
+        Args:
+            calls (list[ReadContractCall]): The contract reads to perform
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[Any]: The results in the same order as the calls, with None for failed calls
+                that allow failure
+
+        Raises:
+            Exception: If a call that does not allow failure fails
+
+        """
+        if not calls:
+            return []
+
+        chain = NETWORK_ID_TO_CHAIN.get(self.get_network().network_id)
+        multicall = chain.contracts.get("multicall3") if chain else None
+
+        if not multicall:
+            return [self._read_contract_call(call, block_identifier) for call in calls]
+
+        functions = [
+            get_compiled_function(call["abi"], call["function_name"], call.get("args"))
+            for call in calls
+        ]
+        aggregate_results = self.read_contract(
+            contract_address=Web3.to_checksum_address(multicall.address),
+            abi=MULTICALL3_ABI,
+            function_name="aggregate3",
+            args=[
+                [
+                    (call["contract_address"], True, function.encode(call.get("args")))
+                    for call, function in zip(calls, functions, strict=True)
+                ]
+            ],
+            block_identifier=block_identifier,
+        )
+
+        results = []
+        for call, function, (success, return_data) in zip(
+            calls, functions, aggregate_results, strict=True
+        ):
+            try:
+                if not success:
+                    raise Exception("execution reverted")
+                results.append(function.decode(return_data))
+            except Exception as e:
+                if not call.get("allow_failure"):
+                    raise Exception(
+                        f"Failed to read {call['function_name']} from {call['contract_address']}: {e!s}"
+                    ) from e
+                results.append(None)
+
+        return results
+
+    def _read_contract_call(self, call: ReadContractCall, block_identifier: BlockIdentifier) -> Any:
+        """Perform a single batched read without Multicall3.
+
+        Args:
+            call (ReadContractCall): The contract read to perform
+            block_identifier (BlockIdentifier): The block number to read from
+
+        Returns:
+            Any: The result, or None if the call failed and allows failure
+
+        """
+        try:
+            return self.read_contract(
+                contract_address=call["contract_address"],
+                abi=call["abi"],
+                function_name=call["function_name"],
+                args=call.get("args"),
+                block_identifier=block_identifier,
+            )
+        except Exception:
+            if not call.get("allow_failure"):
+                raise
+            return None
@@ -0,0 +1,270 @@
+"""Block-scoped fee oracle for EVM wallet providers."""
+
+import asyncio
+import statistics
+import threading
+import time
+import weakref
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from web3 import AsyncWeb3, Web3
+
+from .head_subscription import HeadSubscription
+from .rpc_pool import rpc_endpoint_key
+
+FEE_HISTORY_BLOCK_COUNT = 5
+FEE_HISTORY_PERCENTILES = [25, 50, 75]
+DEFAULT_PRIORITY_FEE_PERCENTILE = 50
+DEFAULT_MAX_PRIORITY_FEE_PER_GAS = Web3.to_wei(0.1, "gwei")
+# Seconds an estimate is reused without checking the chain head, shorter than a block on Base
+FEE_ESTIMATE_TTL = 1.0
+
+
+@dataclass(frozen=True)
+class FeeEstimate:
+    """Fee data for transactions prepared against a given block."""
+
+    block_number: int
+    base_fee_per_gas: int
+    priority_fees: dict[int, int]
+
+    def max_priority_fee_per_gas(self, percentile: int = DEFAULT_PRIORITY_FEE_PERCENTILE) -> int:
+        """Get the priority fee at the given percentile.
+
+        Args:
+            percentile (int): One of the percentiles in FEE_HISTORY_PERCENTILES
+
+        Returns:
+            int: The priority fee in wei
+
+        """
+        return self.priority_fees[percentile]
+
+
+def _fee_estimate_from_history(head: int, fee_history: dict[str, Any]) -> FeeEstimate:
+    """Build a fee estimate from an eth_feeHistory response.
+
+    Args:
+        head (int): The block number the history ends at
+        fee_history (dict[str, Any]): The eth_feeHistory response
+
+    Returns:
+        FeeEstimate: The fee estimate for the block
+
+    """
+    # The last entry is the base fee of the next block, which is what a new transaction pays
+    base_fee_per_gas = fee_history["baseFeePerGas"][-1]
+
+    rewards = fee_history.get("reward") or []
+    priority_fees = {}
+    for index, percentile in enumerate(FEE_HISTORY_PERCENTILES):
+        samples = [block_rewards[index] for block_rewards in rewards if block_rewards]
+        priority_fees[percentile] = (
+            int(statistics.median(samples)) if samples else DEFAULT_MAX_PRIORITY_FEE_PER_GAS
+        )
+
+    return FeeEstimate(
+        block_number=head,
+        base_fee_per_gas=base_fee_per_gas,
+        priority_fees=priority_fees,
+    )
+
+
+class FeeOracle:
+    """Serves fee estimates from eth_feeHistory, refreshed at most once per block.
+
+    Every transaction prepared while the chain head is unchanged is served from memory. With a
+    head subscription the chain head is taken from it while it is live instead of being fetched
+    for every estimate. Without one, an estimate is reused for a short time after it was last
+    checked against the chain head.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        head_subscription: HeadSubscription | None = None,
+        ttl: float = FEE_ESTIMATE_TTL,
+    ):
+        """Initialize the fee oracle.
+
+        Args:
+            web3 (Web3): The web3 instance used to query the chain
+            head_subscription (HeadSubscription | None): The chain's head subscription, if any
+            ttl (float): Seconds an estimate is reused without a live head, defaults to 1
+
+        """
+        self._web3 = web3
+        self._lock = threading.Lock()
+        self._estimate: FeeEstimate | None = None
+        self._checked_at = 0.0
+        self._head_subscription = head_subscription
+        self._ttl = ttl
+
+    def get_fee_estimate(self) -> FeeEstimate:
+        """Get the fee estimate for the current chain head.
+
+        Returns:
+            FeeEstimate: The cached estimate, refreshed if a new block has been produced
+
+        """
+        estimate = self.current_estimate()
+        if estimate is not None:
+            return estimate
+
+        head = self._head_subscription.live_head() if self._head_subscription else None
+        if head is None:
+            head = self._web3.eth.block_number
+
+        with self._lock:
+            if self._estimate is None or self._estimate.block_number < head:
+                self._estimate = self._fetch_fee_estimate(head)
+            self._checked_at = time.monotonic()
+
+            return self._estimate
+
+    def current_estimate(self) -> FeeEstimate | None:
+        """Get the cached estimate if it is known to be current without a request.
+
+        While following a live head subscription the estimate is compared to the head,
+        otherwise it is current until the TTL has passed since it was last checked.
+
+        Returns:
+            FeeEstimate | None: The cached estimate, or None if it may be out of date
+
+        """
+        head = self._head_subscription.live_head() if self._head_subscription else None
+
+        with self._lock:
+            if self._estimate is None:
+                return None
+            if head is not None:
+                return self._estimate if self._estimate.block_number >= head else None
+            if time.monotonic() - self._checked_at >= self._ttl:
+                return None
+
+            return self._estimate
+
+    def update(self, fee_history: dict[str, Any]) -> FeeEstimate:
+        """Update the cached estimate from fee history fetched elsewhere, e.g. in a batch request.
+
+        Args:
+            fee_history (dict[str, Any]): An eth_feeHistory response ending at the latest block
+
+        Returns:
+            FeeEstimate: The newest estimate known to the oracle
+
+        """
+        # baseFeePerGas has one entry per block in the history plus one for the next block
+        head = fee_history["oldestBlock"] + len(fee_history["baseFeePerGas"]) - 2
+        estimate = _fee_estimate_from_history(head, fee_history)
+
+        with self._lock:
+            if self._estimate is None or self._estimate.block_number < head:
+                self._estimate = estimate
+            self._checked_at = time.monotonic()
+
+            return self._estimate
+
+    def _fetch_fee_estimate(self, head: int) -> FeeEstimate:
+        """Fetch fee history ending at the given block.
+
+        Args:
+            head (int): The latest block number
+
+        Returns:
+            FeeEstimate: The fee estimate for the block
+
+        """
+        fee_history = self._web3.eth.fee_history(
+            FEE_HISTORY_BLOCK_COUNT, head, FEE_HISTORY_PERCENTILES
+        )
+        return _fee_estimate_from_history(head, fee_history)
+
+
+_fee_oracles: dict[tuple[str, Hashable, HeadSubscription | None], FeeOracle] = {}
+_fee_oracles_lock = threading.Lock()
+
+
+def get_fee_oracle(
+    chain_id: str, web3: Web3, head_subscription: HeadSubscription | None = None
+) -> FeeOracle:
+    """Get the shared fee oracle for a chain's RPC endpoints, creating it on first use.
+
+    Providers configured with the same RPC endpoints and head subscription share an oracle,
+    providers with their own endpoints or WebSocket URL get one that uses those.
+
+    Args:
+        chain_id (str): The chain ID
+        web3 (Web3): The web3 instance used by the oracle
+        head_subscription (HeadSubscription | None): The head subscription the oracle follows
+
+    Returns:
+        FeeOracle: The fee oracle for the chain, endpoints and head subscription
+
+    """
+    key = (chain_id, rpc_endpoint_key(web3), head_subscription)
+    with _fee_oracles_lock:
+        if key not in _fee_oracles:
+            _fee_oracles[key] = FeeOracle(web3, head_subscription)
+
+        return _fee_oracles[key]
+
+
+class AsyncFeeOracle:
+    """Asyncio counterpart of FeeOracle for providers built on AsyncWeb3."""
+
+    def __init__(self, web3: AsyncWeb3):
+        """Initialize the fee oracle.
+
+        Args:
+            web3 (AsyncWeb3): The web3 instance used to query the chain
+
+        """
+        self._web3 = web3
+        self._lock = asyncio.Lock()
+        self._estimate: FeeEstimate | None = None
+
+    async def get_fee_estimate(self) -> FeeEstimate:
+        """Get the fee estimate for the current chain head.
+
+        Returns:
+            FeeEstimate: The cached estimate, refreshed if a new block has been produced
+
+        """
+        head = await self._web3.eth.block_number
+
+        async with self._lock:
+            if self._estimate is None or self._estimate.block_number < head:
+                fee_history = await self._web3.eth.fee_history(
+                    FEE_HISTORY_BLOCK_COUNT, head, FEE_HISTORY_PERCENTILES
+                )
+                self._estimate = _fee_estimate_from_history(head, fee_history)
+
+            return self._estimate
+
+
+# Asyncio primitives belong to a single event loop, so async oracles are shared per loop
+_async_fee_oracles: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, Hashable], AsyncFeeOracle]
+] = weakref.WeakKeyDictionary()
+
+
+def get_async_fee_oracle(chain_id: str, web3: AsyncWeb3) -> AsyncFeeOracle:
+    """Get the shared async fee oracle for a chain's RPC endpoints on the running event loop.
+
+    Args:
+        chain_id (str): The chain ID
+        web3 (AsyncWeb3): The web3 instance used by the oracle
+
+    Returns:
+        AsyncFeeOracle: The fee oracle for the chain and endpoints
+
+    """
+    key = (chain_id, rpc_endpoint_key(web3))
+    oracles = _async_fee_oracles.setdefault(asyncio.get_running_loop(), {})
+    if key not in oracles:
+        oracles[key] = AsyncFeeOracle(web3)
+
+    return oracles[key]
@@ -0,0 +1,213 @@
+"""Chain head subscriptions over WebSocket."""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Callable
+
+from web3 import AsyncWeb3, WebSocketProvider
+
+DEFAULT_BLOCK_TIME = 2.0
+# Blocks without a new head before the feed is considered stalled and consumers poll again
+STALE_AFTER_BLOCKS = 5
+MIN_STALE_AFTER = 10.0
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+
+class HeadSubscription:
+    """Follows the chain head through an eth_subscribe newHeads WebSocket subscription.
+
+    A background thread keeps the subscription open, reconnecting with backoff when it drops,
+    and calls every listener with the number of each new block. Consumers read live_head to
+    skip polling for the head while the feed is live, and fall back to polling when it is
+    disconnected or stalls.
+    """
+
+    def __init__(self, url: str, block_time: float | None = None):
+        """Initialize the subscription and start following the head.
+
+        Args:
+            url (str): The WebSocket JSON-RPC endpoint
+            block_time (float | None): The chain's average block time in seconds
+
+        """
+        self._url = url
+        self._stale_after = max(
+            (block_time or DEFAULT_BLOCK_TIME) * STALE_AFTER_BLOCKS, MIN_STALE_AFTER
+        )
+        self._lock = threading.Lock()
+        self._listeners: list[Callable[[int], None]] = []
+        self._head: int | None = None
+        self._head_seen_at = 0.0
+        self._subscribed = threading.Event()
+        self._stopped = threading.Event()
+
+        self._loop = asyncio.new_event_loop()
+        self._task: asyncio.Task | None = None
+        self._thread = threading.Thread(
+            target=self._run, name="agentkit-head-subscription", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """Get the WebSocket endpoint.
+
+        Returns:
+            str: The endpoint URL
+
+        """
+        return self._url
+
+    @property
+    def head(self) -> int | None:
+        """Get the latest block number received, whether or not the feed is still live.
+
+        Returns:
+            int | None: The block number, or None if no head has been received
+
+        """
+        return self._head
+
+    def live_head(self) -> int | None:
+        """Get the latest block number if the feed is live.
+
+        Returns:
+            int | None: The block number, or None if the subscription is down or has not
+                delivered a head recently
+
+        """
+        with self._lock:
+            if not self._subscribed.is_set() or self._head is None:
+                return None
+            if time.monotonic() - self._head_seen_at >= self._stale_after:
+                return None
+            return self._head
+
+    def wait_until_subscribed(self, timeout: float | None = None) -> bool:
+        """Wait for the subscription to be established.
+
+        Args:
+            timeout (float | None): Maximum time to wait in seconds
+
+        Returns:
+            bool: True if the subscription is established
+
+        """
+        return self._subscribed.wait(timeout)
+
+    def add_listener(self, listener: Callable[[int], None]) -> None:
+        """Call a function with the block number of every new head.
+
+        Listeners run on the subscription thread and should return quickly.
+
+        Args:
+            listener (Callable[[int], None]): The function to call
+
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[int], None]) -> None:
+        """Stop calling a listener.
+
+        Args:
+            listener (Callable[[int], None]): The function passed to add_listener
+
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def close(self) -> None:
+        """Close the subscription and stop its thread."""
+        self._stopped.set()
+        with contextlib.suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self._cancel)
+        self._thread.join(5)
+
+    def _run(self) -> None:
+        """Run the subscription loop on the subscription thread."""
+        asyncio.set_event_loop(self._loop)
+        self._task = self._loop.create_task(self._follow())
+        with contextlib.suppress(asyncio.CancelledError):
+            self._loop.run_until_complete(self._task)
+        self._loop.close()
+
+    def _cancel(self) -> None:
+        """Cancel the subscription loop. Runs on the subscription thread."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _follow(self) -> None:
+        """Keep the newHeads subscription open until closed, reconnecting when it drops."""
+        delay = RECONNECT_DELAY
+        while not self._stopped.is_set():
+            try:
+                async with AsyncWeb3(WebSocketProvider(self._url)) as web3:
+                    await web3.eth.subscribe("newHeads")
+                    self._subscribed.set()
+                    delay = RECONNECT_DELAY
+
+                    async for message in web3.socket.process_subscriptions():
+                        self._on_head(message["result"]["number"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Reconnected below, consumers poll in the meantime
+                pass
+            finally:
+                self._subscribed.clear()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def _on_head(self, number: int | str) -> None:
+        """Record a new head and notify listeners.
+
+        Args:
+            number (int | str): The block number, as an int or hex string
+
+        """
+        block_number = int(number, 16) if isinstance(number, str) else int(number)
+
+        with self._lock:
+            self._head_seen_at = time.monotonic()
+            if self._head is not None and block_number <= self._head:
+                return
+            self._head = block_number
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            # A failing listener must not stop the feed for the others
+            with contextlib.suppress(Exception):
+                listener(block_number)
+
+
+_head_subscriptions: dict[tuple[str, str], HeadSubscription] = {}
+_head_subscriptions_lock = threading.Lock()
+
+
+def get_head_subscription(
+    chain_id: str, url: str, block_time: float | None = None
+) -> HeadSubscription:
+    """Get the shared head subscription for a chain and endpoint, creating it on first use.
+
+    Args:
+        chain_id (str): The chain ID
+        url (str): The WebSocket JSON-RPC endpoint
+        block_time (float | None): The chain's average block time in seconds
+
+    Returns:
+        HeadSubscription: The head subscription
+
+    """
+    key = (chain_id, url)
+    with _head_subscriptions_lock:
+        if key not in _head_subscriptions:
+            _head_subscriptions[key] = HeadSubscription(url, block_time)
+
+        return _head_subscriptions[key]
@@ -0,0 +1,50 @@
+"""Multicall3 helpers for batching contract reads."""
+
+from typing import Any, TypedDict
+
+from web3.types import ChecksumAddress
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+class ReadContractCall(TypedDict, total=False):
+    """A single contract read for batch_read_contract.
+
+    Takes the same parameters as read_contract. When allow_failure is True a failed call
+    yields None instead of failing the whole batch.
+    """
+
+    contract_address: ChecksumAddress
+    abi: list[dict[str, Any]]
+    function_name: str
+    args: list[Any]
+    allow_failure: bool
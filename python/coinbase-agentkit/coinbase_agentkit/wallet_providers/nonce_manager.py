@@ -0,0 +1,427 @@
+"""Local nonce management for EVM wallet providers."""
+
+import asyncio
+import contextlib
+import heapq
+import threading
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from cdp.errors import ApiError
+from web3.exceptions import ContractLogicError, Web3RPCError
+
+from .rpc_batch import BroadcastError
+
+T = TypeVar("T")
+
+NONCE_ERROR_MESSAGES = ("nonce too low",)
+ALREADY_KNOWN_MESSAGES = ("already known",)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Check whether an error indicates the nonce was already used on chain.
+
+    Args:
+        error (Exception): The error raised while sending a transaction
+
+    Returns:
+        bool: True if the error is a nonce error, False otherwise
+
+    """
+    message = str(error).lower()
+    return any(marker in message for marker in NONCE_ERROR_MESSAGES)
+
+
+def is_rejected_before_broadcast(error: Exception) -> bool:
+    """Check whether an error means the transaction never reached the chain.
+
+    Signing and gas estimation fail before the broadcast, and a JSON-RPC or CDP API error
+    response means the transaction was rejected. Anything else, such as a timeout or a dropped
+    connection, may have happened after the node received the transaction.
+
+    Args:
+        error (Exception): The error raised while sending a transaction
+
+    Returns:
+        bool: True if the transaction was not broadcast, False if it may have been
+
+    """
+    if isinstance(error, ApiError):
+        return error.http_code is not None and error.http_code < 500
+
+    return isinstance(error, ValueError | TypeError | ContractLogicError | Web3RPCError)
+
+
+def is_already_known(error: Exception) -> bool:
+    """Check whether an error indicates the node already has the exact transaction being sent.
+
+    This happens when a broadcast is repeated after the first attempt reached the node, so the
+    transaction was sent and its hash is the hash of the signed transaction.
+
+    Args:
+        error (Exception): The error raised while sending a transaction
+
+    Returns:
+        bool: True if the transaction is already known, False otherwise
+
+    """
+    message = str(error).lower()
+    return any(marker in message for marker in ALREADY_KNOWN_MESSAGES)
+
+
+class _NonceCounter:
+    """Local nonce counter and released nonces shared by the sync and async nonce managers."""
+
+    _next_nonce: int | None
+    _unused_nonces: list[int]
+
+    def _take(self, count: int) -> list[int]:
+        """Take nonces from the released ones, then the counter. The lock must be held.
+
+        Args:
+            count (int): The number of nonces to take
+
+        Returns:
+            list[int]: The nonces, in ascending order
+
+        """
+        nonces = [
+            heapq.heappop(self._unused_nonces) for _ in range(min(count, len(self._unused_nonces)))
+        ]
+        remaining = count - len(nonces)
+        nonces.extend(range(self._next_nonce, self._next_nonce + remaining))
+        self._next_nonce += remaining
+        return nonces
+
+    def _release(self, nonces: list[int]) -> None:
+        """Return unused nonces. The lock must be held.
+
+        Args:
+            nonces (list[int]): The unused nonces
+
+        """
+        if self._next_nonce is None:
+            return
+
+        for nonce in nonces:
+            if nonce < self._next_nonce and nonce not in self._unused_nonces:
+                heapq.heappush(self._unused_nonces, nonce)
+
+        # Released nonces just below the counter are handed out by the counter itself
+        while self._next_nonce - 1 in self._unused_nonces:
+            self._unused_nonces.remove(self._next_nonce - 1)
+            self._next_nonce -= 1
+        heapq.heapify(self._unused_nonces)
+
+    def _advance(self, chain_nonce: int) -> None:
+        """Move the counter forward to a transaction count from chain. The lock must be held.
+
+        Args:
+            chain_nonce (int): The account's pending transaction count
+
+        """
+        if self._next_nonce is None or chain_nonce > self._next_nonce:
+            self._next_nonce = chain_nonce
+
+        self._unused_nonces = [nonce for nonce in self._unused_nonces if nonce >= chain_nonce]
+        heapq.heapify(self._unused_nonces)
+
+
+class NonceManager(_NonceCounter):
+    """Hands out transaction nonces for a single account from a local counter.
+
+    The counter is synced from the chain once, then incremented locally under a lock so
+    concurrent sends never share a nonce and transactions can be sent back to back
+    without waiting for receipts. Nonces of sends rejected before reaching the chain are handed
+    out again before new ones, so a failure never leaves a gap that holds up later transactions.
+    A nonce whose send failed in a way that may have happened after the broadcast, such as a
+    timeout, is never handed out again, and the counter is resynced from chain instead.
+    """
+
+    def __init__(self, fetch_nonce: Callable[[], int]):
+        """Initialize the nonce manager.
+
+        Args:
+            fetch_nonce (Callable[[], int]): Returns the account's pending transaction count
+
+        """
+        self._fetch_nonce = fetch_nonce
+        self._lock = threading.Lock()
+        self._next_nonce: int | None = None
+        self._unused_nonces: list[int] = []
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether the local counter has been synced from chain.
+
+        Returns:
+            bool: True if the next allocation will not query the chain
+
+        """
+        return self._next_nonce is not None
+
+    def sync(self, nonce: int) -> None:
+        """Initialize the counter from a transaction count fetched elsewhere.
+
+        The value is ignored if the counter is already synced, since it may have advanced locally.
+
+        Args:
+            nonce (int): The account's pending transaction count
+
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = nonce
+
+    def next_nonce(self) -> int:
+        """Allocate the next nonce, syncing from chain if the counter is not initialized.
+
+        Returns:
+            int: The allocated nonce
+
+        """
+        return self._allocate(1)[0]
+
+    def resync(self) -> None:
+        """Move the counter forward to the chain's pending transaction count.
+
+        The counter never moves back, since nonces allocated to sends still in flight may not be
+        counted by the chain yet. Unused nonces the chain has since counted are dropped.
+        """
+        chain_nonce = self._fetch_nonce()
+        with self._lock:
+            self._advance(chain_nonce)
+
+    def reset(self) -> None:
+        """Discard the local counter so the next allocation resyncs from chain."""
+        with self._lock:
+            self._next_nonce = None
+            self._unused_nonces.clear()
+
+    def release(self, nonces: list[int]) -> None:
+        """Return nonces whose transactions never reached the chain, so they are handed out again.
+
+        Args:
+            nonces (list[int]): The unused nonces
+
+        """
+        with self._lock:
+            self._release(nonces)
+
+    def send(self, send_with_nonce: Callable[[int], T]) -> T:
+        """Allocate a nonce and send a transaction with it.
+
+        If the send is rejected before the broadcast the nonce is released for the next send,
+        and after any other failure the counter is resynced. When the failure is a nonce error,
+        the nonce was used by a transaction sent elsewhere, so the counter is resynced and the
+        send is retried once with a new nonce.
+
+        Args:
+            send_with_nonce (Callable[[int], T]): Signs and broadcasts a transaction with the given nonce
+
+        Returns:
+            T: The result of the send
+
+        Raises:
+            Exception: If the send fails
+
+        """
+        try:
+            return self._send_once(send_with_nonce)
+        except Exception as e:
+            if not is_nonce_error(e):
+                raise
+
+        self.resync()
+        return self._send_once(send_with_nonce)
+
+    def send_many(self, count: int, send_with_nonces: Callable[[list[int]], T]) -> T:
+        """Allocate nonces for several transactions and send them.
+
+        Failures are handled the same way as in send, except that the send is not retried. When
+        it fails with a BroadcastError only the nonces of the transactions rejected before the
+        broadcast are released, and a nonce below a broadcast one is handed out again to fill
+        the gap.
+
+        Args:
+            count (int): The number of nonces to allocate
+            send_with_nonces (Callable[[list[int]], T]): Signs and broadcasts transactions with the given nonces
+
+        Returns:
+            T: The result of the send
+
+        Raises:
+            Exception: If the send fails
+
+        """
+        nonces = self._allocate(count)
+        try:
+            return send_with_nonces(nonces)
+        except BroadcastError as e:
+            # Only the failed nonces are released, the rest were broadcast
+            failed = [
+                (nonce, error)
+                for nonce, error in zip(nonces, e.errors, strict=True)
+                if error is not None
+            ]
+            self._recover(failed)
+            raise
+        except Exception as e:
+            self._recover([(nonce, e) for nonce in nonces])
+            raise
+
+    def _send_once(self, send_with_nonce: Callable[[int], T]) -> T:
+        """Send a transaction with a newly allocated nonce, recovering it if the send fails.
+
+        Args:
+            send_with_nonce (Callable[[int], T]): Signs and broadcasts a transaction with the given nonce
+
+        Returns:
+            T: The result of the send
+
+        """
+        nonce = self.next_nonce()
+        try:
+            return send_with_nonce(nonce)
+        except Exception as e:
+            # send resyncs itself before retrying after a nonce error
+            if not is_nonce_error(e):
+                self._recover([(nonce, e)])
+            raise
+
+    def _recover(self, failed: list[tuple[int, Exception]]) -> None:
+        """Release the nonces of rejected sends, and resync after any other failure.
+
+        The nonce of a nonce error belongs to another transaction, and the nonce of a send that
+        may have been broadcast could still be mined, so neither is released. A failed resync is
+        ignored so the send's own error is raised.
+
+        Args:
+            failed (list[tuple[int, Exception]]): The nonce and error of each failed send
+
+        """
+        rejected = [
+            nonce
+            for nonce, error in failed
+            if is_rejected_before_broadcast(error) and not is_nonce_error(error)
+        ]
+        self.release(rejected)
+        if len(rejected) < len(failed):
+            with contextlib.suppress(Exception):
+                self.resync()
+
+    def _allocate(self, count: int) -> list[int]:
+        """Allocate nonces, reusing released ones first.
+
+        Args:
+            count (int): The number of nonces to allocate
+
+        Returns:
+            list[int]: The allocated nonces, in ascending order
+
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._fetch_nonce()
+
+            return self._take(count)
+
+
+class AsyncNonceManager(_NonceCounter):
+    """Asyncio counterpart of NonceManager for providers driven from an event loop."""
+
+    def __init__(self, fetch_nonce: Callable[[], Awaitable[int]]):
+        """Initialize the nonce manager.
+
+        Args:
+            fetch_nonce (Callable[[], Awaitable[int]]): Returns the account's pending transaction count
+
+        """
+        self._fetch_nonce = fetch_nonce
+        self._lock = asyncio.Lock()
+        self._next_nonce: int | None = None
+        self._unused_nonces: list[int] = []
+
+    async def next_nonce(self) -> int:
+        """Allocate the next nonce, syncing from chain if the counter is not initialized.
+
+        Returns:
+            int: The allocated nonce
+
+        """
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self._fetch_nonce()
+
+            return self._take(1)[0]
+
+    async def resync(self) -> None:
+        """Move the counter forward to the chain's pending transaction count.
+
+        Behaves the same way as NonceManager.resync.
+        """
+        chain_nonce = await self._fetch_nonce()
+        async with self._lock:
+            self._advance(chain_nonce)
+
+    def reset(self) -> None:
+        """Discard the local counter so the next allocation resyncs from chain."""
+        self._next_nonce = None
+        self._unused_nonces.clear()
+
+    def release(self, nonces: list[int]) -> None:
+        """Return nonces whose transactions never reached the chain, so they are handed out again.
+
+        Args:
+            nonces (list[int]): The unused nonces
+
+        """
+        self._release(nonces)
+
+    async def send(self, send_with_nonce: Callable[[int], Awaitable[T]]) -> T:
+        """Allocate a nonce and send a transaction with it.
+
+        Failures are handled the same way as NonceManager.send.
+
+        Args:
+            send_with_nonce (Callable[[int], Awaitable[T]]): Signs and broadcasts a transaction with the given nonce
+
+        Returns:
+            T: The result of the send
+
+        Raises:
+            Exception: If the send fails
+
+        """
+        try:
+            return await self._send_once(send_with_nonce)
+        except Exception as e:
+            if not is_nonce_error(e):
+                raise
+
+        await self.resync()
+        return await self._send_once(send_with_nonce)
+
+    async def _send_once(self, send_with_nonce: Callable[[int], Awaitable[T]]) -> T:
+        """Send a transaction with a newly allocated nonce, recovering it if the send fails.
+
+        Args:
+            send_with_nonce (Callable[[int], Awaitable[T]]): Signs and broadcasts a transaction with the given nonce
+
+        Returns:
+            T: The result of the send
+
+        """
+        nonce = await self.next_nonce()
+        try:
+            return await send_with_nonce(nonce)
+        except Exception as e:
+            if is_nonce_error(e):
+                raise
+
+            if is_rejected_before_broadcast(e):
+                self.release([nonce])
+            else:
+                with contextlib.suppress(Exception):
+                    await self.resync()
+            raise
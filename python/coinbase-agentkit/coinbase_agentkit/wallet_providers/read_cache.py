@@ -0,0 +1,278 @@
+"""Head-aware caching of contract reads."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from web3.types import BlockIdentifier
+
+from .head_subscription import HeadSubscription
+
+T = TypeVar("T")
+
+# Functions whose results never change for a given contract. Names such as fee or token0 are
+# immutable on some contracts but not others, so they are only cached permanently on request
+DEFAULT_IMMUTABLE_FUNCTIONS = ("decimals",)
+DEFAULT_MAX_ENTRIES = 10_000
+# Head checks per block, so reads against "latest" notice a new block soon after it is produced
+HEAD_CHECKS_PER_BLOCK = 2
+DEFAULT_BLOCK_TIME = 2.0
+
+
+class ReadCache:
+    """Caches reads for the current chain head and drops them once a new head is seen.
+
+    Reads against "latest" are keyed by the head block number. The head is fetched at most
+    once per head refresh interval, or pushed in through observe_head, and every cached
+    "latest" read is dropped when it advances. Reads of immutable functions and reads against
+    a fixed block number never go stale and are kept until evicted. Functions with a TTL
+    override are served for that many seconds regardless of the head. Other block tags, such
+    as "pending", are never cached.
+    """
+
+    def __init__(
+        self,
+        immutable_functions: list[str] | tuple[str, ...] = DEFAULT_IMMUTABLE_FUNCTIONS,
+        function_ttls: dict[str, float] | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        head_refresh_interval: float = DEFAULT_BLOCK_TIME / HEAD_CHECKS_PER_BLOCK,
+    ):
+        """Initialize the read cache.
+
+        Args:
+            immutable_functions (list[str] | tuple[str, ...]): Functions cached permanently
+            function_ttls (dict[str, float] | None): Seconds to cache each listed function for,
+                instead of until the next head
+            max_entries (int): Maximum number of cached reads in each tier
+            head_refresh_interval (float): Seconds an observed head is trusted before it is
+                fetched again
+
+        """
+        self._immutable_functions = frozenset(immutable_functions)
+        self._function_ttls = dict(function_ttls or {})
+        self._max_entries = max_entries
+        self._head_refresh_interval = head_refresh_interval
+
+        self._lock = threading.Lock()
+        self._head: int | None = None
+        self._head_observed_at = 0.0
+        self._head_subscription: HeadSubscription | None = None
+        # Entries for the current head, dropped when it advances
+        self._head_entries: OrderedDict[Hashable, Any] = OrderedDict()
+        # Immutable, fixed block and TTL entries, mapped to their expiry time or None
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+
+    @property
+    def head(self) -> int | None:
+        """Get the latest head block number the cache has seen.
+
+        Returns:
+            int | None: The head block number, or None if no head has been seen
+
+        """
+        return self._head
+
+    def observe_head(self, block_number: int) -> None:
+        """Record the chain head, dropping reads cached for an older head.
+
+        Args:
+            block_number (int): The head block number
+
+        """
+        with self._lock:
+            self._head_observed_at = time.monotonic()
+            if self._head is None or block_number > self._head:
+                self._head = block_number
+                self._head_entries.clear()
+
+    def follow(self, head_subscription: HeadSubscription) -> None:
+        """Invalidate from a head subscription instead of fetching the head while it is live.
+
+        Args:
+            head_subscription (HeadSubscription): The chain's head subscription
+
+        """
+        if self._head_subscription is not None:
+            self._head_subscription.remove_listener(self.observe_head)
+        self._head_subscription = head_subscription
+        head_subscription.add_listener(self.observe_head)
+
+    def clear(self) -> None:
+        """Drop every cached read."""
+        with self._lock:
+            self._head_entries.clear()
+            self._entries.clear()
+
+    def read(
+        self,
+        function_name: str,
+        key: Hashable,
+        block_identifier: BlockIdentifier,
+        fetch: Callable[[], T],
+        fetch_head: Callable[[], int],
+    ) -> T:
+        """Serve a read from the cache, or fetch and cache it.
+
+        Args:
+            function_name (str): The name of the function being read, used to pick its tier
+            key (Hashable): Identifies the read, e.g. the contract address and calldata
+            block_identifier (BlockIdentifier): The block the read is against
+            fetch (Callable[[], T]): Performs the read
+            fetch_head (Callable[[], int]): Returns the current head block number
+
+        Returns:
+            T: The result of the read
+
+        """
+        if self._needs_head(function_name, block_identifier):
+            self.observe_head(fetch_head())
+
+        cache_key = self._cache_key(function_name, key, block_identifier)
+        if cache_key is None:
+            return fetch()
+
+        found, value = self._lookup(cache_key)
+        if found:
+            return value
+
+        value = fetch()
+        self._store(cache_key, function_name, value)
+        return value
+
+    async def aread(
+        self,
+        function_name: str,
+        key: Hashable,
+        block_identifier: BlockIdentifier,
+        fetch: Callable[[], Awaitable[T]],
+        fetch_head: Callable[[], Awaitable[int]],
+    ) -> T:
+        """Serve a read from the cache, or fetch and cache it, from asyncio code.
+
+        Args:
+            function_name (str): The name of the function being read, used to pick its tier
+            key (Hashable): Identifies the read, e.g. the contract address and calldata
+            block_identifier (BlockIdentifier): The block the read is against
+            fetch (Callable[[], Awaitable[T]]): Performs the read
+            fetch_head (Callable[[], Awaitable[int]]): Returns the current head block number
+
+        Returns:
+            T: The result of the read
+
+        """
+        if self._needs_head(function_name, block_identifier):
+            self.observe_head(await fetch_head())
+
+        cache_key = self._cache_key(function_name, key, block_identifier)
+        if cache_key is None:
+            return await fetch()
+
+        found, value = self._lookup(cache_key)
+        if found:
+            return value
+
+        value = await fetch()
+        self._store(cache_key, function_name, value)
+        return value
+
+    def _needs_head(self, function_name: str, block_identifier: BlockIdentifier) -> bool:
+        """Check whether a read must refresh the head before it can be served.
+
+        Args:
+            function_name (str): The name of the function being read
+            block_identifier (BlockIdentifier): The block the read is against
+
+        Returns:
+            bool: True if the read is keyed by the head and the head is stale
+
+        """
+        if block_identifier != "latest":
+            return False
+        if function_name in self._immutable_functions or function_name in self._function_ttls:
+            return False
+        if self._head_subscription is not None and self._head_subscription.live_head() is not None:
+            return self._head is None
+        return (
+            self._head is None
+            or time.monotonic() - self._head_observed_at >= self._head_refresh_interval
+        )
+
+    def _cache_key(
+        self, function_name: str, key: Hashable, block_identifier: BlockIdentifier
+    ) -> Hashable | None:
+        """Build the cache key of a read.
+
+        Args:
+            function_name (str): The name of the function being read
+            key (Hashable): Identifies the read
+            block_identifier (BlockIdentifier): The block the read is against
+
+        Returns:
+            Hashable | None: The cache key, or None if the read must not be cached
+
+        """
+        if function_name in self._immutable_functions:
+            return ("fixed", key)
+        if isinstance(block_identifier, int):
+            return ("block", block_identifier, key)
+        if block_identifier != "latest":
+            return None
+        if function_name in self._function_ttls:
+            return ("ttl", key)
+        return ("head", self._head, key)
+
+    def _lookup(self, cache_key: Hashable) -> tuple[bool, Any]:
+        """Find a cached read.
+
+        Args:
+            cache_key (Hashable): The cache key of the read
+
+        Returns:
+            tuple[bool, Any]: Whether the read was found, and its value
+
+        """
+        with self._lock:
+            if cache_key[0] == "head":
+                if cache_key[1] != self._head or cache_key not in self._head_entries:
+                    return False, None
+                return True, self._head_entries[cache_key]
+
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return False, None
+
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[cache_key]
+                return False, None
+
+            self._entries.move_to_end(cache_key)
+            return True, value
+
+    def _store(self, cache_key: Hashable, function_name: str, value: Any) -> None:
+        """Cache a read, evicting the least recently used read if the tier is full.
+
+        Args:
+            cache_key (Hashable): The cache key of the read
+            function_name (str): The name of the function that was read
+            value (Any): The result of the read
+
+        """
+        with self._lock:
+            if cache_key[0] == "head":
+                # The head advanced while the read was in flight
+                if cache_key[1] != self._head:
+                    return
+                entries = self._head_entries
+                entries[cache_key] = value
+            else:
+                ttl = self._function_ttls.get(function_name) if cache_key[0] == "ttl" else None
+                expires_at = None if ttl is None else time.monotonic() + ttl
+                entries = self._entries
+                entries[cache_key] = (value, expires_at)
+
+            entries.move_to_end(cache_key)
+            while len(entries) > self._max_entries:
+                entries.popitem(last=False)
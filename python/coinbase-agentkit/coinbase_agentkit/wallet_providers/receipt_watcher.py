@@ -0,0 +1,323 @@
+"""Shared transaction receipt watcher for EVM wallet providers."""
+
+import contextlib
+import threading
+import time
+from collections.abc import Hashable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound, Web3RPCError
+from web3.types import TxReceipt
+
+from .head_subscription import HeadSubscription
+from .rpc_pool import rpc_endpoint_key
+
+DEFAULT_BLOCK_TIME = 2.0
+# Head checks per block, so a new block is noticed soon after it is produced
+POLLS_PER_BLOCK = 4
+MIN_POLL_INTERVAL = 0.25
+
+
+@dataclass
+class _PendingReceipt:
+    """A transaction hash being watched, with the number of callers waiting on it."""
+
+    future: Future = field(default_factory=Future)
+    waiters: int = 0
+    checked: bool = False
+
+
+class ReceiptWatcher:
+    """Waits for transaction receipts on behalf of every wallet on a chain.
+
+    A single background thread follows the chain head and, once per new block, fetches the
+    receipts of all pending transactions in one batched JSON-RPC request. Newly watched hashes
+    are checked on the next poll without waiting for a new block. The thread exits when
+    nothing is pending.
+
+    When following a live head subscription the thread sleeps until a new head arrives or a
+    hash is added, instead of polling eth_blockNumber.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        block_time: float | None = None,
+        head_subscription: HeadSubscription | None = None,
+    ):
+        """Initialize the receipt watcher.
+
+        Args:
+            web3 (Web3): The web3 instance used to query the chain
+            block_time (float | None): The chain's average block time in seconds
+            head_subscription (HeadSubscription | None): The chain's head subscription, if any
+
+        """
+        self._web3 = web3
+        self._block_time = block_time or DEFAULT_BLOCK_TIME
+        self._poll_interval = max(self._block_time / POLLS_PER_BLOCK, MIN_POLL_INTERVAL)
+        self._lock = threading.Lock()
+        self._pending: dict[str, _PendingReceipt] = {}
+        self._worker: threading.Thread | None = None
+        self._last_block: int | None = None
+        self._head_subscription = head_subscription
+        self._wake = threading.Event()
+
+        if head_subscription is not None:
+            head_subscription.add_listener(self._on_new_head)
+
+    def wait_for_transaction_receipt(
+        self, tx_hash: HexBytes | str, timeout: float = 120
+    ) -> TxReceipt:
+        """Wait for a transaction to be mined and return its receipt.
+
+        Args:
+            tx_hash (HexBytes | str): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+
+        Returns:
+            TxReceipt: The transaction receipt
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within the timeout
+            Web3RPCError: If the node returns an error for the transaction's receipt
+
+        """
+        key = _normalize_hash(tx_hash)
+        with self._lock:
+            pending = self._add_waiter(key)
+
+        try:
+            return pending.future.result(timeout)
+        except FutureTimeoutError as e:
+            raise TimeExhausted(
+                f"Transaction {key} is not in the chain after {timeout} seconds"
+            ) from e
+        finally:
+            with self._lock:
+                pending.waiters -= 1
+                if pending.waiters <= 0 and self._pending.get(key) is pending:
+                    del self._pending[key]
+
+    def _add_waiter(self, key: str) -> _PendingReceipt:
+        """Register a waiter for a hash and start the worker if needed. Requires the lock.
+
+        Args:
+            key (str): The normalized transaction hash
+
+        Returns:
+            _PendingReceipt: The pending entry for the hash
+
+        """
+        pending = self._pending.setdefault(key, _PendingReceipt())
+        pending.waiters += 1
+        self._wake.set()
+
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="agentkit-receipt-watcher", daemon=True
+            )
+            self._worker.start()
+
+        return pending
+
+    def _run(self) -> None:
+        """Poll for receipts until nothing is pending."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._worker = None
+                    return
+                # Cleared before the snapshot, so a hash added after it wakes the next wait
+                self._wake.clear()
+                snapshot = dict(self._pending)
+
+            # Transient RPC failures are retried on the next poll
+            with contextlib.suppress(Exception):
+                self._poll(snapshot)
+
+            if self._live_head() is None:
+                time.sleep(self._poll_interval)
+            else:
+                # Checks again once per block time in case the feed stalls
+                self._wake.wait(self._block_time)
+
+    def _on_new_head(self, block_number: int) -> None:
+        """Wake the worker when the subscription delivers a new head.
+
+        Args:
+            block_number (int): The new head block number
+
+        """
+        self._wake.set()
+
+    def _live_head(self) -> int | None:
+        """Get the head from the subscription, if one is followed and live.
+
+        Returns:
+            int | None: The head block number, or None if it has to be fetched
+
+        """
+        if self._head_subscription is None:
+            return None
+        return self._head_subscription.live_head()
+
+    def _poll(self, snapshot: dict[str, _PendingReceipt]) -> None:
+        """Fetch receipts for the pending hashes that need checking.
+
+        Every hash is checked when a new block has been produced, and hashes that have never
+        been checked are checked right away.
+
+        Args:
+            snapshot (dict[str, _PendingReceipt]): The pending hashes at the start of the poll
+
+        """
+        block_number = self._live_head()
+        if block_number is None:
+            block_number = self._web3.eth.block_number
+        new_block = block_number != self._last_block
+        self._last_block = block_number
+
+        to_check = [key for key, pending in snapshot.items() if new_block or not pending.checked]
+        if not to_check:
+            return
+
+        results = self._fetch_receipts(to_check)
+
+        with self._lock:
+            for key in to_check:
+                pending = snapshot[key]
+                pending.checked = True
+
+                result = results.get(key)
+                if result is None:
+                    continue
+
+                if isinstance(result, Exception):
+                    pending.future.set_exception(result)
+                else:
+                    pending.future.set_result(result)
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+
+    def _fetch_receipts(self, keys: list[str]) -> dict[str, TxReceipt | Exception]:
+        """Fetch the receipts of several transactions in one batched request.
+
+        Args:
+            keys (list[str]): The normalized transaction hashes
+
+        Returns:
+            dict[str, TxReceipt | Exception]: The receipts of the mined transactions and the
+                errors returned for individual hashes, by hash
+
+        """
+        try:
+            responses = self._web3.provider.make_batch_request(
+                [("eth_getTransactionReceipt", [key]) for key in keys]
+            )
+        except (AttributeError, NotImplementedError):
+            return self._fetch_receipts_individually(keys)
+
+        if not isinstance(responses, list):
+            raise Exception(f"Batch receipt request failed: {responses.get('error')}")
+
+        results: dict[str, TxReceipt | Exception] = {}
+        for key, response in zip(keys, responses, strict=True):
+            error = response.get("error")
+            if error is not None:
+                # Some nodes answer with an error rather than null for unknown transactions
+                if not _is_not_found(error):
+                    results[key] = Web3RPCError(str(error), rpc_response=response)
+                continue
+
+            result = response.get("result")
+            if result:
+                results[key] = AttributeDict.recursive(receipt_formatter(result))
+        return results
+
+    def _fetch_receipts_individually(self, keys: list[str]) -> dict[str, TxReceipt | Exception]:
+        """Fetch receipts one request at a time, for providers that cannot batch.
+
+        Args:
+            keys (list[str]): The normalized transaction hashes
+
+        Returns:
+            dict[str, TxReceipt | Exception]: The receipts of the mined transactions and the
+                errors returned for individual hashes, by hash
+
+        """
+        results: dict[str, TxReceipt | Exception] = {}
+        for key in keys:
+            try:
+                results[key] = self._web3.eth.get_transaction_receipt(key)
+            except TransactionNotFound:
+                continue
+            except Web3RPCError as e:
+                if not _is_not_found(e):
+                    results[key] = e
+        return results
+
+
+def _is_not_found(error: Any) -> bool:
+    """Check whether a JSON-RPC error means the transaction is not known or not mined yet.
+
+    Args:
+        error (Any): The JSON-RPC error object or exception
+
+    Returns:
+        bool: True if the transaction has no receipt yet, False otherwise
+
+    """
+    return "not found" in str(error).lower()
+
+
+def _normalize_hash(tx_hash: Any) -> str:
+    """Normalize a transaction hash to a lowercase 0x-prefixed hex string.
+
+    Args:
+        tx_hash (Any): The transaction hash as bytes or a hex string
+
+    Returns:
+        str: The normalized hash
+
+    """
+    if isinstance(tx_hash, str):
+        return Web3.to_hex(hexstr=tx_hash).lower()
+    return Web3.to_hex(tx_hash).lower()
+
+
+_receipt_watchers: dict[tuple[str, Hashable, HeadSubscription | None], ReceiptWatcher] = {}
+_receipt_watchers_lock = threading.Lock()
+
+
+def get_receipt_watcher(
+    chain_id: str,
+    web3: Web3,
+    block_time: float | None = None,
+    head_subscription: HeadSubscription | None = None,
+) -> ReceiptWatcher:
+    """Get the shared receipt watcher for a chain's RPC endpoints, creating it on first use.
+
+    Args:
+        chain_id (str): The chain ID
+        web3 (Web3): The web3 instance used by the watcher
+        block_time (float | None): The chain's average block time in seconds
+        head_subscription (HeadSubscription | None): The head subscription the watcher follows
+
+    Returns:
+        ReceiptWatcher: The receipt watcher for the chain, endpoints and head subscription
+
+    """
+    key = (chain_id, rpc_endpoint_key(web3), head_subscription)
+    with _receipt_watchers_lock:
+        if key not in _receipt_watchers:
+            _receipt_watchers[key] = ReceiptWatcher(web3, block_time, head_subscription)
+
+        return _receipt_watchers[key]
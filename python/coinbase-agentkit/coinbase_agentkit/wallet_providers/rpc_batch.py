@@ -0,0 +1,203 @@
+"""JSON-RPC batching and parallel broadcast for EVM wallet providers."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from web3 import Web3
+from web3._utils.method_formatters import (
+    PYTHONIC_RESULT_FORMATTERS,
+    get_error_formatters,
+    get_request_formatters,
+)
+from web3.exceptions import Web3RPCError
+from web3.types import RPCEndpoint, TxParams
+
+from .fee_oracle import FEE_HISTORY_BLOCK_COUNT, FEE_HISTORY_PERCENTILES, FeeEstimate, FeeOracle
+
+if TYPE_CHECKING:
+    # The nonce manager handles BroadcastError, so it is only imported for type checking here
+    from .nonce_manager import NonceManager
+
+T = TypeVar("T")
+
+MAX_PARALLEL_BROADCASTS = 16
+
+
+class BroadcastError(Exception):
+    """Raised when some transactions of a parallel broadcast fail.
+
+    The transactions that did not fail were broadcast, so their hashes are kept alongside the
+    errors of the ones that failed.
+
+    Attributes:
+        tx_hashes (list[Any]): The result of each broadcast, None where it failed
+        errors (list[Exception | None]): The error of each broadcast, None where it succeeded
+
+    """
+
+    def __init__(self, tx_hashes: list[Any], errors: list[Exception | None]):
+        """Initialize the error.
+
+        Args:
+            tx_hashes (list[Any]): The result of each broadcast, None where it failed
+            errors (list[Exception | None]): The error of each broadcast, None where it succeeded
+
+        """
+        self.tx_hashes = tx_hashes
+        self.errors = errors
+        index, error = next(
+            (index, error) for index, error in enumerate(errors) if error is not None
+        )
+        failed = sum(error is not None for error in errors)
+        message = f"Failed to send transaction {index}: {error!s}"
+        if failed > 1:
+            message += f" ({failed} of {len(errors)} transactions failed)"
+        super().__init__(message)
+
+
+def batch_request(web3: Web3, requests: Sequence[tuple[str, Sequence[Any]]]) -> list[Any]:
+    """Send independent JSON-RPC calls as a single batch request.
+
+    Parameters and results are formatted the same way web3 formats them for individual calls.
+    Providers that cannot batch fall back to one request per call.
+
+    Args:
+        web3 (Web3): The web3 instance whose provider sends the batch
+        requests (Sequence[tuple[str, Sequence[Any]]]): The (method, params) pairs to send
+
+    Returns:
+        list[Any]: The formatted results, in the order of the requests
+
+    Raises:
+        Exception: If the batch is rejected or any call in it fails
+
+    """
+    methods = [RPCEndpoint(method) for method, _ in requests]
+    formatted_requests = [
+        (method, get_request_formatters(method)(tuple(params)))
+        for method, (_, params) in zip(methods, requests, strict=True)
+    ]
+
+    try:
+        responses = web3.provider.make_batch_request(formatted_requests)
+    except (AttributeError, NotImplementedError):
+        return [web3.manager.request_blocking(method, list(params)) for method, params in requests]
+
+    if not isinstance(responses, list):
+        raise Exception(f"Batch request failed: {responses.get('error')}")
+
+    results = []
+    for method, response in zip(methods, responses, strict=True):
+        if response.get("error") is not None:
+            # Raises the same errors as an individual call, e.g. ContractLogicError on revert
+            get_error_formatters(method)(response)
+            raise Web3RPCError(str(response["error"]), rpc_response=response)
+
+        result_formatter = PYTHONIC_RESULT_FORMATTERS.get(method)
+        result = response.get("result")
+        results.append(result_formatter(result) if result_formatter else result)
+
+    return results
+
+
+def fetch_send_preparation(
+    web3: Web3,
+    transactions: list[TxParams],
+    fee_oracle: FeeOracle,
+    nonce_manager: "NonceManager",
+    address: str,
+) -> tuple[FeeEstimate, list[int | None]]:
+    """Fetch the chain data needed to send transactions in one batch request.
+
+    The batch holds a gas estimate for every transaction that does not set its own gas limit,
+    plus the latest fee history when the fee oracle's cached estimate may be out of date and
+    the pending transaction count when the nonce manager has not synced yet. The fee oracle
+    and nonce manager are updated with the results.
+
+    Args:
+        web3 (Web3): The web3 instance used to query the chain
+        transactions (list[TxParams]): The transactions to estimate gas for
+        fee_oracle (FeeOracle): The fee oracle to update with the fee history
+        nonce_manager (NonceManager): The nonce manager to sync with the transaction count
+        address (str): The sending address
+
+    Returns:
+        tuple[FeeEstimate, list[int | None]]: The fee estimate and the unadjusted gas estimate
+            of each transaction, None for transactions that set their own gas limit
+
+    Raises:
+        Exception: If the batch request or any call in it fails
+
+    """
+    fee_estimate = fee_oracle.current_estimate()
+    fetch_fees = fee_estimate is None
+
+    requests: list[tuple[str, Sequence[Any]]] = []
+    if fetch_fees:
+        requests.append(
+            ("eth_feeHistory", (FEE_HISTORY_BLOCK_COUNT, "latest", FEE_HISTORY_PERCENTILES))
+        )
+    estimated = [
+        index for index, transaction in enumerate(transactions) if "gas" not in transaction
+    ]
+    requests.extend(("eth_estimateGas", (transactions[index],)) for index in estimated)
+
+    sync_nonce = not nonce_manager.is_synced
+    if sync_nonce:
+        requests.append(("eth_getTransactionCount", (address, "pending")))
+
+    results = batch_request(web3, requests) if requests else []
+
+    if fetch_fees:
+        fee_estimate = fee_oracle.update(results.pop(0))
+    if sync_nonce:
+        nonce_manager.sync(results.pop())
+
+    gas_estimates: list[int | None] = [None] * len(transactions)
+    for index, gas_estimate in zip(estimated, results, strict=True):
+        gas_estimates[index] = gas_estimate
+
+    return fee_estimate, gas_estimates
+
+
+def broadcast_in_parallel(broadcasts: list[Callable[[], T]]) -> list[T]:
+    """Run broadcasts concurrently and return their results in order.
+
+    Every broadcast runs to completion before an error is raised, so a failure never leaves
+    a broadcast running in the background.
+
+    Args:
+        broadcasts (list[Callable[[], T]]): Functions that each sign and broadcast a transaction
+
+    Returns:
+        list[T]: The results, in the order of the broadcasts
+
+    Raises:
+        BroadcastError: If any broadcast fails, with the results of the others
+
+    """
+    results: list[T | None] = [None] * len(broadcasts)
+    errors: list[Exception | None] = [None] * len(broadcasts)
+
+    if len(broadcasts) == 1:
+        try:
+            results[0] = broadcasts[0]()
+        except Exception as e:
+            errors[0] = e
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(len(broadcasts), MAX_PARALLEL_BROADCASTS),
+            thread_name_prefix="agentkit-broadcast",
+        ) as executor:
+            futures = [executor.submit(broadcast) for broadcast in broadcasts]
+
+        for index, future in enumerate(futures):
+            errors[index] = future.exception()
+            if errors[index] is None:
+                results[index] = future.result()
+
+    first_error = next((error for error in errors if error is not None), None)
+    if first_error is not None:
+        raise BroadcastError(results, errors) from first_error
+    return results
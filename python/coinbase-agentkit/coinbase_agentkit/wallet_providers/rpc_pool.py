@@ -0,0 +1,520 @@
+"""Pool of RPC endpoints with health scoring, hedged reads and circuit breaking."""
+
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
+
+from web3 import AsyncWeb3, Web3
+from web3.providers import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from ..http_sessions import get_http_session, get_http_session_config
+
+T = TypeVar("T")
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+# Hedge delay used until an endpoint has enough samples for a meaningful p95
+DEFAULT_HEDGE_DELAY = 1.0
+MIN_LATENCY_SAMPLES = 10
+LATENCY_WINDOW = 100
+LATENCY_SMOOTHING = 0.2
+# Reads hedged at once per pool, each using up to two threads. Further reads are not hedged
+MAX_HEDGED_READS = 32
+
+# Methods that must reach the same node, so the pending nonce it reports matches what it accepts
+STICKY_METHODS = frozenset(
+    {
+        "eth_sendRawTransaction",
+        "eth_sendTransaction",
+        "eth_getTransactionCount",
+    }
+)
+
+
+class RpcEndpoint:
+    """An RPC endpoint with its latency history and circuit breaker state."""
+
+    def __init__(self, url: str, provider: JSONBaseProvider):
+        """Initialize the endpoint.
+
+        Args:
+            url (str): The endpoint URL
+            provider (JSONBaseProvider): The provider that sends requests to the endpoint
+
+        """
+        self.url = url
+        self.provider = provider
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._average_latency: float | None = None
+        self.consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def average_latency(self) -> float | None:
+        """Get the smoothed latency of successful requests.
+
+        Returns:
+            float | None: The latency in seconds, or None if no request has succeeded yet
+
+        """
+        return self._average_latency
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the circuit breaker has taken the endpoint out of rotation.
+
+        Returns:
+            bool: True if the endpoint is failing
+
+        """
+        return self._opened_at is not None
+
+    def p95_latency(self) -> float | None:
+        """Get the 95th percentile latency of recent successful requests.
+
+        Returns:
+            float | None: The latency in seconds, or None if there are too few samples
+
+        """
+        with self._lock:
+            if len(self._latencies) < MIN_LATENCY_SAMPLES:
+                return None
+            return statistics.quantiles(self._latencies, n=20)[-1]
+
+    def score(self) -> float:
+        """Score the endpoint for routing, lower is better.
+
+        Endpoints that have not been measured yet score best so they are tried.
+
+        Returns:
+            float: The smoothed latency, penalized by recent failures
+
+        """
+        return (self._average_latency or 0.0) * (1 + self.consecutive_failures)
+
+    def is_available(self, recovery_timeout: float) -> bool:
+        """Check whether the endpoint may receive a request.
+
+        An open circuit admits a single trial request once the recovery timeout has passed.
+
+        Args:
+            recovery_timeout (float): Seconds an open circuit waits before a trial request
+
+        Returns:
+            bool: True if a request may be sent
+
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            return (
+                not self._trial_in_flight and time.monotonic() - self._opened_at >= recovery_timeout
+            )
+
+    def begin_request(self) -> None:
+        """Mark the start of a request, claiming the trial slot of an open circuit."""
+        with self._lock:
+            if self._opened_at is not None:
+                self._trial_in_flight = True
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful request and close the circuit.
+
+        Args:
+            latency (float): The request latency in seconds
+
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._average_latency = (
+                latency
+                if self._average_latency is None
+                else LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self._average_latency
+            )
+            self.consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self, failure_threshold: int) -> None:
+        """Record a failed request, opening the circuit after too many in a row.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the circuit
+
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            if self.consecutive_failures >= failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+class RpcEndpointPool(JSONBaseProvider):
+    """A web3 provider that spreads requests over several RPC endpoints.
+
+    Reads go to the healthiest, fastest endpoint. If it has not answered within its p95
+    latency the read is hedged to the next endpoint and the first answer wins, and a failed
+    read fails over to the next endpoint. Endpoints that fail repeatedly are taken out of
+    rotation until a trial request succeeds. Requests on the send path always go to a single
+    sticky endpoint, which only changes when its circuit opens.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        hedge_requests: bool = True,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+    ):
+        """Initialize the pool.
+
+        Args:
+            urls (list[str]): The endpoint URLs
+            hedge_requests (bool): Whether slow reads are sent to a second endpoint
+            failure_threshold (int): Consecutive failures before an endpoint is taken out of rotation
+            recovery_timeout (float): Seconds before a failed endpoint receives a trial request
+
+        Raises:
+            ValueError: If no URLs are provided
+
+        """
+        if not urls:
+            raise ValueError("At least one RPC URL is required")
+
+        super().__init__()
+        # Shared per-host sessions are used from every thread, web3 would otherwise open a
+        # session per thread and endpoint
+        timeout = get_http_session_config().timeout
+        self.endpoints = [
+            RpcEndpoint(
+                url,
+                Web3.HTTPProvider(
+                    url, session=get_http_session(url), request_kwargs={"timeout": timeout}
+                ),
+            )
+            for url in urls
+        ]
+        self._hedge_requests = hedge_requests
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._sticky: RpcEndpoint | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._hedged_reads = 0
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request through the pool.
+
+        Args:
+            method (RPCEndpoint): The RPC method
+            params (Any): The method parameters
+
+        Returns:
+            RPCResponse: The response
+
+        """
+        return self._route(
+            method in STICKY_METHODS,
+            lambda endpoint: endpoint.provider.make_request(method, params),
+        )
+
+    def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        """Send a JSON-RPC batch request through the pool.
+
+        A batch containing a send path method is routed to the sticky endpoint as a whole.
+
+        Args:
+            requests (list[tuple[RPCEndpoint, Any]]): The (method, params) pairs
+
+        Returns:
+            list[RPCResponse] | RPCResponse: The responses, or an error response for the batch
+
+        """
+        return self._route(
+            any(method in STICKY_METHODS for method, _ in requests),
+            lambda endpoint: endpoint.provider.make_batch_request(requests),
+        )
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Check whether any endpoint is connected.
+
+        Args:
+            show_traceback (bool): Whether to raise the connection error of the last endpoint
+
+        Returns:
+            bool: True if an endpoint is connected
+
+        """
+        for endpoint in self._ranked_endpoints():
+            if endpoint.provider.is_connected(show_traceback=False):
+                return True
+
+        if show_traceback:
+            return self.endpoints[-1].provider.is_connected(show_traceback=True)
+        return False
+
+    def _route(self, sticky: bool, request: Callable[[RpcEndpoint], T]) -> T:
+        """Send a request to the sticky endpoint or through the hedged read path.
+
+        Args:
+            sticky (bool): Whether the request belongs to the send path
+            request (Callable[[RpcEndpoint], T]): Sends the request to an endpoint
+
+        Returns:
+            T: The response
+
+        """
+        if sticky:
+            # Send path requests are not retried elsewhere, a broadcast that timed out may
+            # still have reached the node
+            return self._timed_request(self._sticky_endpoint(), request)
+        return self._hedged_request(request)
+
+    def _ranked_endpoints(self) -> list[RpcEndpoint]:
+        """Rank the endpoints that may receive a request, best first.
+
+        Endpoints due a trial request come first so their circuit can close, a failed trial
+        falls through to the next endpoint. If every circuit is open all endpoints are
+        returned, so the pool keeps trying rather than failing every request until a recovery
+        timeout passes.
+
+        Returns:
+            list[RpcEndpoint]: The endpoints in routing order
+
+        """
+        available = [
+            endpoint for endpoint in self.endpoints if endpoint.is_available(self._recovery_timeout)
+        ]
+        return sorted(
+            available or self.endpoints,
+            key=lambda endpoint: (not endpoint.is_open, endpoint.score()),
+        )
+
+    def _sticky_endpoint(self) -> RpcEndpoint:
+        """Get the send path endpoint, choosing a new one if its circuit has opened.
+
+        Returns:
+            RpcEndpoint: The sticky endpoint
+
+        """
+        with self._lock:
+            if self._sticky is None or self._sticky.is_open:
+                self._sticky = self._ranked_endpoints()[0]
+            return self._sticky
+
+    def _timed_request(self, endpoint: RpcEndpoint, request: Callable[[RpcEndpoint], T]) -> T:
+        """Send a request to one endpoint and record its outcome.
+
+        JSON-RPC error responses come back as results, so only transport failures count
+        against the endpoint.
+
+        Args:
+            endpoint (RpcEndpoint): The endpoint to send to
+            request (Callable[[RpcEndpoint], T]): Sends the request to an endpoint
+
+        Returns:
+            T: The response
+
+        """
+        endpoint.begin_request()
+        started = time.monotonic()
+        try:
+            response = request(endpoint)
+        except Exception:
+            endpoint.record_failure(self._failure_threshold)
+            raise
+
+        endpoint.record_success(time.monotonic() - started)
+        return response
+
+    def _hedged_request(self, request: Callable[[RpcEndpoint], T]) -> T:
+        """Send a read, hedging it to a second endpoint if the first is slow.
+
+        Failed attempts fail over to the next endpoint in ranking order. Reads are sent from
+        the calling thread when there is nothing to hedge to or hedging is off, and when the
+        pool is already hedging as many reads as it has threads for.
+
+        Args:
+            request (Callable[[RpcEndpoint], T]): Sends the request to an endpoint
+
+        Returns:
+            T: The first successful response
+
+        Raises:
+            Exception: The last error if every endpoint fails
+
+        """
+        ranked = self._ranked_endpoints()
+        if not self._hedge_requests or len(ranked) == 1:
+            return self._failover_request(ranked, request)
+
+        with self._lock:
+            hedge = self._hedged_reads < MAX_HEDGED_READS
+            if hedge:
+                self._hedged_reads += 1
+        if not hedge:
+            # Waiting for a free hedging thread would be slower than not hedging
+            return self._failover_request(ranked, request)
+
+        try:
+            return self._race_request(ranked, request)
+        finally:
+            with self._lock:
+                self._hedged_reads -= 1
+
+    def _race_request(self, endpoints: list[RpcEndpoint], request: Callable[[RpcEndpoint], T]) -> T:
+        """Send a read on a worker, racing it against the next endpoint once it is slow.
+
+        Args:
+            endpoints (list[RpcEndpoint]): The endpoints in routing order
+            request (Callable[[RpcEndpoint], T]): Sends the request to an endpoint
+
+        Returns:
+            T: The first successful response
+
+        Raises:
+            Exception: The last error if every endpoint fails
+
+        """
+        candidates = iter(endpoints)
+        executor = self._get_executor()
+        in_flight: dict[Future, RpcEndpoint] = {}
+        hedged = False
+        last_error: Exception | None = None
+
+        def launch() -> RpcEndpoint | None:
+            endpoint = next(candidates, None)
+            if endpoint is not None:
+                in_flight[executor.submit(self._timed_request, endpoint, request)] = endpoint
+            return endpoint
+
+        latest = launch()
+        while in_flight:
+            hedge_delay = None
+            if not hedged and latest is not None:
+                hedge_delay = latest.p95_latency() or DEFAULT_HEDGE_DELAY
+
+            done, _ = wait(in_flight, timeout=hedge_delay, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True
+                latest = launch() or latest
+                continue
+
+            for future in done:
+                del in_flight[future]
+                try:
+                    return future.result()
+                except Exception as e:
+                    last_error = e
+
+            if not in_flight:
+                latest = launch()
+
+        raise last_error or Exception("No RPC endpoints available")
+
+    def _failover_request(
+        self, endpoints: list[RpcEndpoint], request: Callable[[RpcEndpoint], T]
+    ) -> T:
+        """Send a read from the calling thread, trying each endpoint in turn until one answers.
+
+        Args:
+            endpoints (list[RpcEndpoint]): The endpoints in routing order
+            request (Callable[[RpcEndpoint], T]): Sends the request to an endpoint
+
+        Returns:
+            T: The first successful response
+
+        Raises:
+            Exception: The last error if every endpoint fails
+
+        """
+        last_error: Exception | None = None
+        for endpoint in endpoints:
+            try:
+                return self._timed_request(endpoint, request)
+            except Exception as e:
+                last_error = e
+
+        raise last_error or Exception("No RPC endpoints available")
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor that runs hedged reads, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The executor
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2 * MAX_HEDGED_READS,
+                    thread_name_prefix="agentkit-rpc-pool",
+                )
+            return self._executor
+
+
+_rpc_pools: dict[tuple, RpcEndpointPool] = {}
+_rpc_pools_lock = threading.Lock()
+
+
+def get_rpc_endpoint_pool(
+    chain_id: str,
+    urls: list[str],
+    hedge_requests: bool = True,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+) -> RpcEndpointPool:
+    """Get the shared endpoint pool for a chain and settings, creating it on first use.
+
+    Sharing the pool lets every wallet on a chain benefit from the same health data.
+
+    Args:
+        chain_id (str): The chain ID
+        urls (list[str]): The endpoint URLs
+        hedge_requests (bool): Whether slow reads are sent to a second endpoint
+        failure_threshold (int): Consecutive failures before an endpoint is taken out of rotation
+        recovery_timeout (float): Seconds before a failed endpoint receives a trial request
+
+    Returns:
+        RpcEndpointPool: The endpoint pool
+
+    """
+    key = (chain_id, tuple(urls), hedge_requests, failure_threshold, recovery_timeout)
+    with _rpc_pools_lock:
+        if key not in _rpc_pools:
+            _rpc_pools[key] = RpcEndpointPool(
+                urls,
+                hedge_requests=hedge_requests,
+                failure_threshold=failure_threshold,
+                recovery_timeout=recovery_timeout,
+            )
+
+        return _rpc_pools[key]
+
+
+def rpc_endpoint_key(web3: Web3 | AsyncWeb3) -> Hashable:
+    """Identify the RPC endpoints a web3 instance sends its requests to.
+
+    Shared endpoint pools are identified by the pool itself, providers for a single endpoint by
+    its URL. State derived from chain queries, such as fee estimates, can be shared between
+    web3 instances with the same key.
+
+    Args:
+        web3 (Web3 | AsyncWeb3): The web3 instance
+
+    Returns:
+        Hashable: The key of the web3 instance's endpoints
+
+    """
+    endpoint_uri = getattr(web3.provider, "endpoint_uri", None)
+    return web3.provider if endpoint_uri is None else str(endpoint_uri)
@@ -0,0 +1,52 @@
+"""Sender scopes that keep dependent sends through a wallet pool on one account."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class SenderScope:
+    """Identifies a group of sends that depend on each other, such as an approve and a swap.
+
+    A WalletPoolProvider pins each scope to one of its accounts the first time the scope uses
+    it, and forgets the pin once the scope is no longer referenced.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+_current_scope: ContextVar[SenderScope | None] = ContextVar("agentkit_sender_scope", default=None)
+
+
+def current_sender_scope() -> SenderScope | None:
+    """Get the sender scope of the running code.
+
+    Returns:
+        SenderScope | None: The innermost active scope, or None outside of any scope
+
+    """
+    return _current_scope.get()
+
+
+@contextmanager
+def sender_scope() -> Iterator[SenderScope]:
+    """Keep every send through a wallet pool made inside the block on one account.
+
+    Actions that take a wallet provider run in their own scope. A scope opened inside another
+    one joins it, so an action that calls other actions sends from a single account.
+
+    Yields:
+        SenderScope: The active scope
+
+    """
+    scope = _current_scope.get()
+    if scope is not None:
+        yield scope
+        return
+
+    scope = SenderScope()
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
@@ -0,0 +1,119 @@
+"""Coalescing of identical concurrent requests."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers asking for the same key.
+
+    The first caller for a key runs the call and every caller that arrives while it is in
+    flight waits for and receives the same result or error. Once the call finishes the key
+    is released, so later callers run a fresh call and nothing is cached.
+    """
+
+    def __init__(self):
+        """Initialize the single flight group."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run fn, or join the in-flight call with the same key.
+
+        Args:
+            key (Hashable): Identifies calls that are interchangeable
+            fn (Callable[[], T]): Performs the call
+
+        Returns:
+            T: The result of the call
+
+        Raises:
+            Exception: The error raised by the call
+
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                leader = False
+            else:
+                leader = True
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._release(key)
+            future.set_exception(e)
+            raise
+
+        self._release(key)
+        future.set_result(result)
+        return result
+
+    def _release(self, key: Hashable) -> None:
+        """Let later callers for a key start a new call.
+
+        Args:
+            key (Hashable): The key of the finished call
+
+        """
+        with self._lock:
+            self._calls.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """Shares one in-flight coroutine between concurrent callers asking for the same key.
+
+    The call runs as a task that callers await through a shield, so a caller being cancelled
+    does not cancel the call for the others.
+    """
+
+    def __init__(self):
+        """Initialize the single flight group."""
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn, or join the in-flight call with the same key.
+
+        Args:
+            key (Hashable): Identifies calls that are interchangeable
+            fn (Callable[[], Awaitable[T]]): Starts the call
+
+        Returns:
+            T: The result of the call
+
+        Raises:
+            Exception: The error raised by the call
+
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._release(key, task))
+
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """Let later callers for a key start a new call.
+
+        Args:
+            key (Hashable): The key of the finished call
+            task (asyncio.Task[Any]): The finished call
+
+        """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # Mark the error as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
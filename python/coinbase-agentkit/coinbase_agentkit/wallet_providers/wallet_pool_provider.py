@@ -0,0 +1,492 @@
+"""Wallet provider that spreads transactions across several accounts."""
+
+import threading
+import weakref
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+from eth_account.datastructures import SignedTransaction
+from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+
+from ..network import Network
+from .evm_wallet_provider import EvmWalletProvider
+from .sender_scopes import SenderScope, current_sender_scope
+
+T = TypeVar("T")
+
+MAX_SENDER_KEYS = 1024
+
+
+class _Lane:
+    """An account in the pool with the number of sends currently in flight on it."""
+
+    def __init__(self, index: int, wallet_provider: EvmWalletProvider):
+        self.index = index
+        self.wallet_provider = wallet_provider
+        self.in_flight = 0
+        # The account's metadata snapshot and the pool's snapshot built from it
+        self.metadata: tuple[Mapping[str, str], Mapping[str, str]] | None = None
+
+    @cached_property
+    def address(self) -> str:
+        """The account's lowercase address, resolved on first use so wallets can load lazily."""
+        return self.wallet_provider.get_address().lower()
+
+
+class WalletPoolProvider(EvmWalletProvider):
+    """A wallet provider that sends from several accounts on the same network in parallel.
+
+    Transactions from one account land in nonce order, so a single account limits how many
+    transactions can be confirmed per block. The pool treats each account as a lane and pins
+    every sender scope to the lane with the fewest sends in flight, so throughput grows with
+    the number of accounts.
+
+    Sends that depend on each other, such as an approve followed by a deposit, must come from
+    the same account. Every action that takes a wallet provider runs in its own sender scope
+    (see sender_scope), and inside a scope the pool acts as the scope's account: get_address,
+    get_balance, signing and every send use it. Concurrent actions are spread over the
+    accounts. Outside of a scope the pool acts as the first account, except that the
+    transactions of one send_transactions call are split across every account.
+
+    A sender key passed to send_transaction and send_transactions, or to for_sender to get the
+    account's provider, keeps every send for that key on one account across scopes. The pool
+    remembers the MAX_SENDER_KEYS most recently used keys, so a key that has not been used
+    for longer than that may move to another account. A transaction that sets "from" is sent
+    by the account with that address.
+
+    Reads and receipts use the first account. Outside of a scope get_balance returns the
+    combined balance of every account.
+    """
+
+    def __init__(self, wallet_providers: list[EvmWalletProvider]):
+        """Initialize the pool.
+
+        Args:
+            wallet_providers (list[EvmWalletProvider]): The accounts to send from, e.g.
+                EthAccountWalletProvider or CdpWalletProvider instances, all on one network
+
+        Raises:
+            ValueError: If no providers are given or they are on different networks
+
+        """
+        if not wallet_providers:
+            raise ValueError("At least one wallet provider is required")
+
+        networks = {provider.get_network().network_id for provider in wallet_providers}
+        if len(networks) > 1:
+            raise ValueError(
+                f"All wallet providers must be on the same network, got {sorted(networks)}"
+            )
+
+        self._lanes = [_Lane(index, provider) for index, provider in enumerate(wallet_providers)]
+        self._lock = threading.Lock()
+        self._sender_lanes: OrderedDict[str, _Lane] = OrderedDict()
+        self._scope_lanes: weakref.WeakKeyDictionary[SenderScope, _Lane] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def wallet_providers(self) -> list[EvmWalletProvider]:
+        """Get the providers of the accounts in the pool.
+
+        Returns:
+            list[EvmWalletProvider]: The providers, in the order they were given
+
+        """
+        return [lane.wallet_provider for lane in self._lanes]
+
+    def track_initialization(self) -> None:
+        """Track the initialization of the pool once its first account's wallet has loaded.
+
+        Accounts that load their wallet in the background, such as CdpWalletProvider, would
+        otherwise make building the pool wait for the first wallet.
+        """
+        load_wallet = getattr(self._lanes[0].wallet_provider, "load_wallet", None)
+        if load_wallet is None:
+            super().track_initialization()
+            return
+
+        def track(future: Future) -> None:
+            if not future.cancelled() and future.exception() is None:
+                super(WalletPoolProvider, self).track_initialization()
+
+        load_wallet().add_done_callback(track)
+
+    def get_wallet_metadata(self) -> Mapping[str, str]:
+        """Get a read-only snapshot of the pool's name and the current scope's account.
+
+        The snapshot is built from the account's own snapshot and kept per account, so every
+        event reports the account that the scope sends from.
+
+        Returns:
+            Mapping[str, str]: The wallet metadata, with the fields of WalletMetadata
+
+        """
+        lane = self._account_lane()
+        source = lane.wallet_provider.get_wallet_metadata()
+        cached = lane.metadata
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        metadata = MappingProxyType({**source, "wallet_provider": self.get_name()})
+        lane.metadata = (source, metadata)
+        return metadata
+
+    def invalidate_wallet_metadata(self) -> None:
+        """Drop the metadata snapshots of the pool and every account."""
+        for lane in self._lanes:
+            lane.wallet_provider.invalidate_wallet_metadata()
+            lane.metadata = None
+
+    def get_address(self) -> str:
+        """Get the address of the account that sends for the current sender scope.
+
+        Returns:
+            str: The address of the scope's account, or of the first account outside a scope
+
+        """
+        return self._account_lane().wallet_provider.get_address()
+
+    def get_addresses(self) -> list[str]:
+        """Get the addresses of every account in the pool.
+
+        Returns:
+            list[str]: The addresses, in the order the providers were given
+
+        """
+        return [lane.wallet_provider.get_address() for lane in self._lanes]
+
+    def get_network(self) -> Network:
+        """Get the network the pool's accounts are on.
+
+        Returns:
+            Network: The network
+
+        """
+        return self._lanes[0].wallet_provider.get_network()
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider.
+
+        Returns:
+            str: The string 'wallet_pool_provider'
+
+        """
+        return "wallet_pool_provider"
+
+    def get_balance(self) -> Decimal:
+        """Get the balance of the current sender scope's account, or of every account.
+
+        Returns:
+            Decimal: The scope's account balance in wei, or outside a scope the sum of the
+                accounts' balances
+
+        """
+        if current_sender_scope() is not None:
+            return self._account_lane().wallet_provider.get_balance()
+
+        balances = self._map_lanes(lambda lane: lane.wallet_provider.get_balance())
+        return sum(balances, Decimal(0))
+
+    def for_sender(self, sender: str) -> EvmWalletProvider:
+        """Get the provider of the account that sends for a sender key.
+
+        Args:
+            sender (str): Identifies a logical sender whose transactions must stay in order,
+                e.g. a session or strategy ID
+
+        Returns:
+            EvmWalletProvider: The provider of the sender's account
+
+        """
+        with self._lock:
+            return self._sender_lane(sender).wallet_provider
+
+    def sign_message(self, message: str | bytes) -> HexStr:
+        """Sign a message with the account get_address reports.
+
+        Args:
+            message (str | bytes): The message to sign
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        return self._account_lane().wallet_provider.sign_message(message)
+
+    def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
+        """Sign typed data according to EIP-712 with the account get_address reports.
+
+        Args:
+            typed_data (dict[str, Any]): The typed data to sign
+
+        Returns:
+            HexStr: The signature as a hex string
+
+        """
+        return self._account_lane().wallet_provider.sign_typed_data(typed_data)
+
+    def sign_transaction(self, transaction: TxParams) -> SignedTransaction:
+        """Sign a transaction with the account in its "from" field, or the one get_address reports.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            SignedTransaction: The signed transaction
+
+        """
+        lane = self._lane_for_address(transaction.get("from")) or self._account_lane()
+        return lane.wallet_provider.sign_transaction(transaction)
+
+    def send_transaction(self, transaction: TxParams, sender: str | None = None) -> HexStr:
+        """Send a transaction from the sender's account, or the one get_address reports.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+            sender (str | None): Keeps every send with this key on one account
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        """
+        with self._reserve(self._pick_lane(transaction, sender)) as lane:
+            return lane.wallet_provider.send_transaction(transaction)
+
+    def send_transactions(
+        self, transactions: list[TxParams], sender: str | None = None
+    ) -> list[HexStr]:
+        """Send several transactions spread across the accounts, and return hashes in order.
+
+        With a sender key or inside a sender scope they are all sent, in order, from the
+        sender's account. Otherwise each transaction goes to the least busy account and every
+        account sends its share in parallel.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
+            sender (str | None): Keeps every send with this key on one account
+
+        Returns:
+            list[HexStr]: The transaction hashes as hex strings
+
+        """
+        if not transactions:
+            return []
+
+        if sender is not None or current_sender_scope() is not None:
+            with self._reserve(self._pick_lane(transactions[0], sender)) as lane:
+                return lane.wallet_provider.send_transactions(transactions)
+
+        # Assign every transaction before sending, so the split reflects the whole batch
+        from_lanes = [
+            self._lane_for_address(transaction.get("from")) for transaction in transactions
+        ]
+        assignments: dict[int, list[int]] = {}
+        with self._lock:
+            for index, from_lane in enumerate(from_lanes):
+                lane = from_lane or self._least_busy_lane()
+                lane.in_flight += 1
+                assignments.setdefault(lane.index, []).append(index)
+
+        def send_share(lane_index: int) -> list[HexStr]:
+            lane = self._lanes[lane_index]
+            indexes = assignments[lane_index]
+            try:
+                return lane.wallet_provider.send_transactions(
+                    [transactions[index] for index in indexes]
+                )
+            finally:
+                with self._lock:
+                    lane.in_flight -= len(indexes)
+
+        with ThreadPoolExecutor(max_workers=len(assignments)) as executor:
+            shares = dict(zip(assignments, executor.map(send_share, assignments), strict=True))
+
+        tx_hashes: list[HexStr | None] = [None] * len(transactions)
+        for lane_index, indexes in assignments.items():
+            for index, tx_hash in zip(indexes, shares[lane_index], strict=True):
+                tx_hashes[index] = tx_hash
+        return tx_hashes
+
+    def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset from the account get_address reports.
+
+        Args:
+            to (str): The destination address to receive the transfer
+            value (Decimal): The amount to transfer in whole units (e.g. 1.5 for 1.5 ETH)
+
+        Returns:
+            str: The transaction hash as a string
+
+        """
+        with self._reserve(self._pick_lane({}, None)) as lane:
+            return lane.wallet_provider.native_transfer(to, value)
+
+    def wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float | None = None
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation and return receipt.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for, sent from any account in the pool
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float | None): Time between polling attempts in seconds
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        """
+        return self._lanes[0].wallet_provider.wait_for_transaction_receipt(
+            tx_hash, timeout=timeout, poll_latency=poll_latency
+        )
+
+    def read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        return self._lanes[0].wallet_provider.read_contract(
+            contract_address, abi, function_name, args, block_identifier
+        )
+
+    def _pick_lane(self, transaction: TxParams, sender: str | None) -> _Lane:
+        """Choose the account to send a transaction from.
+
+        Args:
+            transaction (TxParams): The transaction to send
+            sender (str | None): The sender key, if the send must stay on one account
+
+        Returns:
+            _Lane: The account's lane
+
+        """
+        lane = self._lane_for_address(transaction.get("from"))
+        with self._lock:
+            if lane is None:
+                lane = self._sender_lane(sender) if sender is not None else self._scope_lane()
+            lane.in_flight += 1
+            return lane
+
+    @contextmanager
+    def _reserve(self, lane: _Lane) -> Iterator[_Lane]:
+        """Release a lane picked by _pick_lane once its send finishes.
+
+        Args:
+            lane (_Lane): The picked lane
+
+        Yields:
+            _Lane: The same lane
+
+        """
+        try:
+            yield lane
+        finally:
+            with self._lock:
+                lane.in_flight -= 1
+
+    def _least_busy_lane(self) -> _Lane:
+        """Get the lane with the fewest sends in flight and live sender scopes. Requires the lock.
+
+        Scopes count as load from the moment they are pinned, so concurrent actions that look
+        up the address before their first send are still spread over the accounts.
+
+        Returns:
+            _Lane: The least busy lane, the first one on ties
+
+        """
+        scopes = Counter(lane.index for lane in self._scope_lanes.values())
+        return min(self._lanes, key=lambda lane: lane.in_flight + scopes[lane.index])
+
+    def _sender_lane(self, sender: str) -> _Lane:
+        """Get the lane a sender key is pinned to, pinning it on first use. Requires the lock.
+
+        Args:
+            sender (str): The sender key
+
+        Returns:
+            _Lane: The sender's lane
+
+        """
+        if sender in self._sender_lanes:
+            self._sender_lanes.move_to_end(sender)
+        else:
+            self._sender_lanes[sender] = self._least_busy_lane()
+            if len(self._sender_lanes) > MAX_SENDER_KEYS:
+                self._sender_lanes.popitem(last=False)
+        return self._sender_lanes[sender]
+
+    def _account_lane(self) -> _Lane:
+        """Get the lane the pool acts as for the running code.
+
+        Returns:
+            _Lane: The current sender scope's lane, or the first lane outside a scope
+
+        """
+        with self._lock:
+            return self._scope_lane()
+
+    def _scope_lane(self) -> _Lane:
+        """Get the current sender scope's lane, pinning it on first use. Requires the lock.
+
+        Returns:
+            _Lane: The scope's lane, or the first lane outside a scope
+
+        """
+        scope = current_sender_scope()
+        if scope is None:
+            return self._lanes[0]
+
+        if scope not in self._scope_lanes:
+            self._scope_lanes[scope] = self._least_busy_lane()
+        return self._scope_lanes[scope]
+
+    def _lane_for_address(self, address: str | None) -> _Lane | None:
+        """Get the lane of the account with an address. Must be called without the lock.
+
+        Resolving the accounts' addresses may wait for their wallets to load.
+
+        Args:
+            address (str | None): The address
+
+        Returns:
+            _Lane | None: The account's lane, or None if the address is not in the pool
+
+        """
+        if not address:
+            return None
+        return next((lane for lane in self._lanes if lane.address == address.lower()), None)
+
+    def _map_lanes(self, fn: Callable[[_Lane], T]) -> list[T]:
+        """Call a function for every lane in parallel.
+
+        Args:
+            fn (Callable[[_Lane], T]): The function to call
+
+        Returns:
+            list[T]: The results, in lane order
+
+        """
+        with ThreadPoolExecutor(max_workers=len(self._lanes)) as executor:
+            return list(executor.map(fn, self._lanes))
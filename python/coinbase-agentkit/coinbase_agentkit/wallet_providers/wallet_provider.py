@@ -1,12 +1,25 @@
 """Base class for wallet providers."""
 
 from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Hashable, Mapping
 from decimal import Decimal
+from types import MappingProxyType
+from typing import TypedDict
 
 from ..analytics import RequiredEventData, send_analytics_event
 from ..network import Network
 
 
+class WalletMetadata(TypedDict):
+    """Metadata for a wallet."""
+
+    wallet_provider: str
+    wallet_address: str
+    network_id: str
+    chain_id: str
+    protocol_family: str
+
+
 class WalletProviderMeta(ABCMeta):
     """Metaclass for WalletProvider to handle initialization tracking."""
 
@@ -17,28 +30,69 @@ class WalletProviderMeta(ABCMeta):
         return instance
 
 
-class WalletProvider(ABC, metaclass=WalletProviderMeta):
-    """Base class for all wallet providers."""
+class WalletProviderBase(ABC, metaclass=WalletProviderMeta):
+    """Base class shared by synchronous and asyncio wallet providers.
+
+    Both kinds report their name, address and network synchronously, so initialization
+    tracking and the wallet metadata snapshot are implemented once here.
+    """
 
     def track_initialization(self) -> None:
         """Track the initialization of the wallet provider."""
         try:
-            network = self.get_network()
-
             event_data = RequiredEventData(
                 name="agent_initialization",
                 action="initialize_wallet_provider",
                 component="wallet_provider",
+                **self.get_wallet_metadata(),
+            )
+
+            send_analytics_event(event_data)
+        except Exception as e:
+            print(f"Warning: Failed to track wallet provider initialization: {e}")
+
+    def get_wallet_metadata(self) -> Mapping[str, str]:
+        """Get a read-only snapshot of the wallet's name, address and network.
+
+        The snapshot is built on first use and reused while _wallet_metadata_key is unchanged,
+        so callers such as action analytics do not call the provider on every invocation.
+        Providers whose address or network can change without a change to that key must call
+        invalidate_wallet_metadata.
+
+        Returns:
+            Mapping[str, str]: The wallet metadata, with the fields of WalletMetadata
+
+        """
+        key = self._wallet_metadata_key()
+        cached = getattr(self, "_wallet_metadata", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        network = self.get_network()
+        metadata = MappingProxyType(
+            WalletMetadata(
                 wallet_provider=self.get_name(),
                 wallet_address=self.get_address(),
                 network_id=network.network_id or "",
                 chain_id=network.chain_id or "",
                 protocol_family=network.protocol_family,
             )
+        )
+        self._wallet_metadata = (key, metadata)
+        return metadata
 
-            send_analytics_event(event_data)
-        except Exception as e:
-            print(f"Warning: Failed to track wallet provider initialization: {e}")
+    def invalidate_wallet_metadata(self) -> None:
+        """Drop the wallet metadata snapshot so the next get_wallet_metadata rebuilds it."""
+        self._wallet_metadata = None
+
+    def _wallet_metadata_key(self) -> Hashable:
+        """Get a cheap value that changes whenever the wallet's address or network changes.
+
+        Returns:
+            Hashable: The key, None by default for providers whose address and network are fixed
+
+        """
+        return None
 
     @abstractmethod
     def get_address(self) -> str:
@@ -50,6 +104,15 @@ class WalletProvider(ABC, metaclass=WalletProviderMeta):
         """Get the current network."""
         pass
 
+    @abstractmethod
+    def get_name(self) -> str:
+        """Get the name of the wallet provider."""
+        pass
+
+
+class WalletProvider(WalletProviderBase):
+    """Base class for all wallet providers."""
+
     @abstractmethod
     def get_balance(self) -> Decimal:
         """Get the wallet balance in native currency."""
@@ -60,11 +123,6 @@ class WalletProvider(ABC, metaclass=WalletProviderMeta):
         """Sign a message with the wallet."""
         pass
 
-    @abstractmethod
-    def get_name(self) -> str:
-        """Get the name of the wallet provider."""
-        pass
-
     @abstractmethod
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network."""
@@ -0,0 +1,118 @@
+"""Tests for the compiled contract function cache."""
+
+import pytest
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput
+
+from coinbase_agentkit.abi import contract_cache, encode_function_data, get_compiled_function
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+OVERLOADED_ABI = [
+    {
+        "type": "function",
+        "name": "transfer",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "to", "type": "address"}],
+        "outputs": [],
+    },
+    {
+        "type": "function",
+        "name": "transfer",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+        "outputs": [],
+    },
+]
+
+
+def test_encode_function_data_matches_web3():
+    """Test that calldata is identical to web3's contract encoding."""
+    contract = Web3().eth.contract(abi=ERC20_ABI)
+
+    assert encode_function_data(ERC20_ABI, "transfer", [MOCK_ADDRESS, 1000]) == (
+        contract.encode_abi("transfer", [MOCK_ADDRESS, 1000])
+    )
+    assert encode_function_data(ERC20_ABI, "balanceOf", [MOCK_ADDRESS]) == (
+        contract.encode_abi("balanceOf", [MOCK_ADDRESS])
+    )
+
+
+def test_encode_and_decode_normalize_like_web3():
+    """Test that hex string bytes, tuples and addresses are handled the same way as web3."""
+    abi = [
+        {
+            "type": "function",
+            "name": "route",
+            "stateMutability": "view",
+            "inputs": [
+                {"name": "data", "type": "bytes"},
+                {
+                    "name": "hops",
+                    "type": "tuple[]",
+                    "components": [
+                        {"name": "pool", "type": "address"},
+                        {"name": "salt", "type": "bytes32"},
+                    ],
+                },
+            ],
+            "outputs": [
+                {"name": "", "type": "address"},
+                {"name": "", "type": "address[]"},
+            ],
+        }
+    ]
+    args = ["0xdead", [{"pool": MOCK_ADDRESS, "salt": "0x" + "11" * 32}]]
+
+    assert encode_function_data(abi, "route", args) == Web3().eth.contract(abi=abi).encode_abi(
+        "route", args
+    )
+
+    lowercase = "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"
+    return_data = Web3().codec.encode(["address", "address[]"], [lowercase, [lowercase]])
+    checksummed = Web3.to_checksum_address(lowercase)
+    assert get_compiled_function(abi, "route").decode(return_data) == [
+        checksummed,
+        [checksummed],
+    ]
+
+
+def test_get_compiled_function_cached():
+    """Test that a function is compiled once per ABI and name."""
+    compiled = get_compiled_function(ERC20_ABI, "balanceOf")
+
+    assert get_compiled_function(ERC20_ABI, "balanceOf") is compiled
+    assert get_compiled_function(list(ERC20_ABI), "balanceOf") is compiled
+    assert compiled.selector == "0x70a08231"
+
+
+def test_get_compiled_function_overloaded():
+    """Test that overloaded functions are resolved from the arguments."""
+    one_arg = get_compiled_function(OVERLOADED_ABI, "transfer", [MOCK_ADDRESS])
+    two_args = get_compiled_function(OVERLOADED_ABI, "transfer", [MOCK_ADDRESS, 1])
+
+    assert one_arg.abi == OVERLOADED_ABI[0]
+    assert two_args.abi == OVERLOADED_ABI[1]
+
+
+def test_decode():
+    """Test that return data is decoded and single outputs are unwrapped."""
+    compiled = get_compiled_function(ERC20_ABI, "balanceOf")
+
+    assert compiled.decode(Web3().codec.encode(["uint256"], [1000])) == 1000
+
+    with pytest.raises(BadFunctionCallOutput):
+        compiled.decode(b"")
+
+
+def test_abi_fingerprints_bounded():
+    """Test that fingerprints are remembered for a bounded number of ABI objects."""
+    abis = [list(ERC20_ABI) for _ in range(contract_cache.MAX_FINGERPRINTS + 10)]
+
+    fingerprints = {contract_cache.abi_fingerprint(abi) for abi in abis}
+
+    assert len(fingerprints) == 1
+    assert len(contract_cache._fingerprints) == contract_cache.MAX_FINGERPRINTS
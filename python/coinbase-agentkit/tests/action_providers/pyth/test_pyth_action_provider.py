@@ -1,4 +1,5 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import Mock, patch
 
 import pytest
 import requests
@@ -21,7 +22,7 @@ def test_pyth_fetch_price_feed_id_success():
         ]
     }
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = mock_response["data"]
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -35,7 +36,7 @@ def test_pyth_fetch_price_feed_id_success():
 
 def test_pyth_fetch_price_feed_id_empty_response():
     """Test pyth fetch price feed id error with empty response for ticker symbol."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = []
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -45,7 +46,7 @@ def test_pyth_fetch_price_feed_id_empty_response():
 
 def test_pyth_fetch_price_feed_id_http_error():
     """Test pyth fetch price feed id error with HTTP error."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "404 Client Error: Not Found"
         )
@@ -69,7 +70,7 @@ def test_pyth_fetch_price_success():
         ]
     }
 
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.json.return_value = mock_response
         mock_get.return_value.raise_for_status.return_value = None
 
@@ -80,10 +81,67 @@ def test_pyth_fetch_price_success():
 
 def test_pyth_fetch_price_http_error():
     """Test pyth fetch price error with HTTP error."""
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "404 Client Error: Not Found"
         )
 
         result = pyth_action_provider().fetch_price({"price_feed_id": MOCK_PRICE_FEED_ID})
         assert "Error fetching price from Pyth" in result
+
+
+class FakeAsyncResponse:
+    """Stand-in for an aiohttp response."""
+
+    def __init__(self, data):
+        self.data = data
+
+    async def __aenter__(self):
+        """Enter the response context."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Exit the response context."""
+        return False
+
+    def raise_for_status(self):
+        """Succeed."""
+
+    async def json(self):
+        """Return the response body."""
+        return self.data
+
+
+def test_pyth_actions_ainvoke_without_threads():
+    """Test that the Pyth actions use their async implementations when awaited."""
+    responses = {
+        "price_feeds": [{"id": MOCK_PRICE_FEED_ID, "attributes": {"base": "BTC"}}],
+        "latest": {"parsed": [{"price": {"price": "4212345", "expo": -2}}]},
+    }
+    session = Mock()
+    session.get.side_effect = lambda url: FakeAsyncResponse(
+        responses["price_feeds" if "price_feeds" in url else "latest"]
+    )
+    actions = {action.name: action for action in pyth_action_provider().get_actions(None)}
+
+    async def fetch():
+        feed_id = await actions["PythActionProvider_fetch_price_feed_id"].ainvoke(
+            {"token_symbol": MOCK_TOKEN_SYMBOL}
+        )
+        return feed_id, await actions["PythActionProvider_fetch_price"].ainvoke(
+            {"price_feed_id": feed_id}
+        )
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.pyth.pyth_action_provider.get_async_http_session",
+            return_value=session,
+        ),
+        patch("requests.Session.get") as mock_get,
+    ):
+        assert asyncio.run(fetch()) == (MOCK_PRICE_FEED_ID, "42123.45")
+
+    mock_get.assert_not_called()
+    session.get.assert_any_call(
+        "https://hermes.pyth.network/v2/price_feeds?query=BTC&asset_type=crypto"
+    )
@@ -0,0 +1,222 @@
+"""Tests for the action provider base class."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from eth_account import Account
+from pydantic import BaseModel
+
+from coinbase_agentkit import ActionProvider, create_action
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import (
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+    WalletProvider,
+)
+
+
+class EmptySchema(BaseModel):
+    """Schema for test actions."""
+
+
+class BaseTestProvider(ActionProvider):
+    """Action provider with actions and a property that must not run at construction."""
+
+    property_reads = 0
+
+    def __init__(self):
+        super().__init__("test", [])
+
+    @property
+    def expensive(self) -> str:
+        """Count reads of a property with side effects."""
+        type(self).property_reads += 1
+        return "value"
+
+    @create_action(name="second", description="Second", schema=EmptySchema)
+    def second(self, args: dict) -> str:
+        """Second action."""
+        return "second"
+
+    @create_action(name="first", description="First", schema=EmptySchema)
+    def first(self, args: dict) -> str:
+        """First action."""
+        return "first"
+
+    @create_action(name="whoami", description="Wallet address", schema=EmptySchema)
+    def whoami(self, wallet_provider: WalletProvider, args: dict) -> str:
+        """Return the wallet's address."""
+        return wallet_provider.get_address()
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+class OverridingTestProvider(BaseTestProvider):
+    """Action provider that replaces an inherited action with a plain method."""
+
+    def second(self, args: dict) -> str:
+        """No longer an action."""
+        return "overridden"
+
+
+def test_actions_collected_once_per_class():
+    """Test that actions are collected at class creation and shared by instances."""
+    first_instance = BaseTestProvider()
+    second_instance = BaseTestProvider()
+
+    assert [action.name for action in BaseTestProvider._actions] == [
+        "BaseTestProvider_first",
+        "BaseTestProvider_second",
+        "BaseTestProvider_whoami",
+    ]
+    assert first_instance._actions is second_instance._actions is BaseTestProvider._actions
+    assert BaseTestProvider.property_reads == 0
+
+
+def test_subclass_override_replaces_action():
+    """Test that overriding an action in a subclass without the decorator removes it."""
+    provider = OverridingTestProvider()
+
+    assert [action.name for action in provider.get_actions(None)] == [
+        "BaseTestProvider_first",
+        "BaseTestProvider_whoami",
+    ]
+
+
+class CountingWalletProvider(WalletProvider):
+    """Wallet provider that counts calls to the methods that identify it."""
+
+    def __init__(self):
+        self.address = "0x1234567890123456789012345678901234567890"
+        self.identity_calls = 0
+
+    def get_address(self) -> str:
+        """Get the address, counting the call."""
+        self.identity_calls += 1
+        return self.address
+
+    def get_network(self) -> Network:
+        """Get the network, counting the call."""
+        self.identity_calls += 1
+        return Network(protocol_family="evm", network_id="base-sepolia", chain_id="84532")
+
+    def get_name(self) -> str:
+        """Get the name, counting the call."""
+        self.identity_calls += 1
+        return "counting_wallet_provider"
+
+    def get_balance(self):
+        """Not used."""
+
+    def sign_message(self, message):
+        """Not used."""
+
+    def native_transfer(self, to, value):
+        """Not used."""
+
+
+def test_action_analytics_reuse_wallet_metadata():
+    """Test that invocations reuse the wallet metadata snapshot until it is invalidated."""
+    with patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+        wallet_provider = CountingWalletProvider()
+    action = next(
+        action
+        for action in BaseTestProvider().get_actions(wallet_provider)
+        if action.name == "BaseTestProvider_whoami"
+    )
+
+    with patch(
+        "coinbase_agentkit.action_providers.action_decorator.send_analytics_event"
+    ) as mock_send_analytics_event:
+        wallet_provider.identity_calls = 0
+        for _ in range(3):
+            action.invoke({})
+        # One get_address per invocation from the action itself, none from analytics
+        assert wallet_provider.identity_calls == 3
+
+        wallet_provider.address = "0x0000000000000000000000000000000000000001"
+        wallet_provider.invalidate_wallet_metadata()
+        action.invoke({})
+
+    events = [call.args[0] for call in mock_send_analytics_event.call_args_list]
+    assert {event["wallet_address"] for event in events[:3]} == {
+        "0x1234567890123456789012345678901234567890"
+    }
+    assert events[3]["wallet_address"] == wallet_provider.address
+    assert events[3]["network_id"] == "base-sepolia"
+
+
+def test_wallet_metadata_follows_replaced_account():
+    """Test that the metadata snapshot is rebuilt when a provider's account is replaced."""
+    with patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+        wallet_provider = EthAccountWalletProvider(
+            EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532")
+        )
+    metadata = wallet_provider.get_wallet_metadata()
+    assert wallet_provider.get_wallet_metadata() is metadata
+
+    wallet_provider.account = Account.create()
+
+    assert wallet_provider.get_wallet_metadata()["wallet_address"] == (
+        wallet_provider.account.address
+    )
+
+
+class AsyncTestProvider(ActionProvider):
+    """Action provider with an async action and a blocking synchronous action."""
+
+    def __init__(self):
+        super().__init__("async_test", [])
+
+    @create_action(name="sleep_async", description="Sleep without blocking", schema=EmptySchema)
+    async def sleep_async(self, args: dict) -> str:
+        """Sleep on the event loop."""
+        await asyncio.sleep(0.2)
+        return "async"
+
+    @create_action(name="sleep_sync", description="Sleep on a thread", schema=EmptySchema)
+    def sleep_sync(self, args: dict) -> str:
+        """Sleep, blocking the calling thread."""
+        time.sleep(0.2)
+        return threading.current_thread().name
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+def test_ainvoke_runs_actions_concurrently():
+    """Test that async actions are awaited and sync actions run off the event loop."""
+    actions = {action.name: action for action in AsyncTestProvider().get_actions(None)}
+
+    async def invoke_all():
+        return await asyncio.gather(
+            *(actions["AsyncTestProvider_sleep_async"].ainvoke({}) for _ in range(5)),
+            *(actions["AsyncTestProvider_sleep_sync"].ainvoke({}) for _ in range(5)),
+        )
+
+    started = time.monotonic()
+    results = asyncio.run(invoke_all())
+
+    assert time.monotonic() - started < 0.6
+    assert results[:5] == ["async"] * 5
+    assert all(name.startswith("agentkit-action") for name in results[5:])
+
+
+def test_async_action_invoked_synchronously():
+    """Test that an async action can still be invoked from synchronous code and inside a loop."""
+    action = next(
+        action
+        for action in AsyncTestProvider().get_actions(None)
+        if action.name == "AsyncTestProvider_sleep_async"
+    )
+
+    async def invoke_inside_loop():
+        return action.invoke({})
+
+    assert action.invoke({}) == "async"
+    assert asyncio.run(invoke_inside_loop()) == "async"
@@ -45,14 +45,15 @@ def test_create_token_input_model_missing_params():
 def test_create_token_success():
     """Test successful token creation with valid parameters."""
     with (
-        patch("web3.eth.Eth.contract") as mock_contract,
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
     ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
         mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
         mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
         mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
         mock_wallet.get_network.return_value.chain_id = MOCK_CHAIN_ID
@@ -74,12 +75,8 @@ def test_create_token_success():
         assert response == expected_response
 
         factory_address = get_factory_address(MOCK_CHAIN_ID)
-        mock_contract.assert_called_once_with(
-            address=factory_address,
-            abi=WOW_FACTORY_ABI,
-        )
-
-        mock_contract.return_value.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            WOW_FACTORY_ABI,
             "deploy",
             [
                 MOCK_WALLET_ADDRESS,
@@ -103,14 +100,15 @@ def test_create_token_success():
 def test_create_token_with_custom_token_uri_success():
     """Test successful token creation with custom token URI."""
     with (
-        patch("web3.eth.Eth.contract") as mock_contract,
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
     ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
         mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
         mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
         mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
         mock_wallet.get_network.return_value.chain_id = MOCK_CHAIN_ID
@@ -133,12 +131,8 @@ def test_create_token_with_custom_token_uri_success():
         assert response == expected_response
 
         factory_address = get_factory_address(MOCK_CHAIN_ID)
-        mock_contract.assert_called_once_with(
-            address=factory_address,
-            abi=WOW_FACTORY_ABI,
-        )
-
-        mock_contract.return_value.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            WOW_FACTORY_ABI,
             "deploy",
             [
                 MOCK_WALLET_ADDRESS,
@@ -162,14 +156,15 @@ def test_create_token_with_custom_token_uri_success():
 def test_create_token_error():
     """Test create_token when error occurs."""
     with (
-        patch("web3.eth.Eth.contract") as mock_contract,
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ),
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
     ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
         mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
         mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
         mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
         mock_wallet.get_network.return_value.chain_id = MOCK_CHAIN_ID
@@ -186,7 +181,9 @@ def test_create_token_error():
         assert response == expected_response
 
         factory_address = get_factory_address(MOCK_CHAIN_ID)
-        mock_contract.assert_called_once_with(
-            address=factory_address,
-            abi=WOW_FACTORY_ABI,
+        mock_wallet.send_transaction.assert_called_once_with(
+            {
+                "to": factory_address,
+                "data": "0xencoded",
+            }
         )
@@ -0,0 +1,96 @@
+"""Tests for the background analytics exporter."""
+
+import json
+import threading
+from unittest.mock import Mock, patch
+
+from coinbase_agentkit.analytics import AnalyticsExporter, send_analytics_event
+from coinbase_agentkit.analytics.exporter import build_analytics_payload
+
+MOCK_ENDPOINT = "https://analytics.example.com/amp"
+
+
+def sent_batches(session: Mock) -> list[list[dict]]:
+    """Get the events of each batch posted through a mock session."""
+    return [json.loads(call.kwargs["json"]["e"]) for call in session.post.call_args_list]
+
+
+def test_batches_by_size():
+    """Test that a full batch is sent without waiting for the flush interval."""
+    session = Mock()
+    sent = threading.Event()
+    session.post.side_effect = lambda *args, **kwargs: sent.set()
+    exporter = AnalyticsExporter(
+        endpoint=MOCK_ENDPOINT, max_batch_size=3, flush_interval=60, session=session
+    )
+
+    for index in range(3):
+        exporter.enqueue({"index": index})
+
+    assert sent.wait(timeout=5)
+    assert sent_batches(session) == [[{"index": 0}, {"index": 1}, {"index": 2}]]
+    assert session.post.call_args.args == (MOCK_ENDPOINT,)
+    assert session.post.call_args.kwargs["timeout"] > 0
+    exporter.shutdown()
+
+
+def test_batches_by_time():
+    """Test that a partial batch is sent once the flush interval passes."""
+    session = Mock()
+    sent = threading.Event()
+    session.post.side_effect = lambda *args, **kwargs: sent.set()
+    exporter = AnalyticsExporter(max_batch_size=10, flush_interval=0.05, session=session)
+
+    exporter.enqueue({"index": 0})
+
+    assert sent.wait(timeout=5)
+    assert sent_batches(session) == [[{"index": 0}]]
+    exporter.shutdown()
+
+
+def test_drops_oldest_and_flushes_on_shutdown():
+    """Test that a full queue drops its oldest events and shutdown flushes the rest."""
+    session = Mock()
+    exporter = AnalyticsExporter(
+        max_queue_size=2, max_batch_size=10, flush_interval=60, session=session
+    )
+
+    for index in range(3):
+        exporter.enqueue({"index": index})
+    exporter.shutdown()
+
+    assert exporter.dropped_events == 1
+    assert sent_batches(session) == [[{"index": 1}, {"index": 2}]]
+
+
+def test_failed_send_does_not_stop_worker():
+    """Test that the worker keeps sending after a request fails."""
+    session = Mock()
+    session.post.side_effect = [Exception("connection refused"), Mock()]
+    exporter = AnalyticsExporter(max_batch_size=1, flush_interval=60, session=session)
+
+    exporter.enqueue({"index": 0})
+    exporter.enqueue({"index": 1})
+    exporter.shutdown()
+
+    assert session.post.call_count == 2
+
+
+def test_build_analytics_payload():
+    """Test that batches use the e/checksum payload format."""
+    payload = build_analytics_payload([{"event_type": "test"}])
+
+    assert json.loads(payload["e"]) == [{"event_type": "test"}]
+    assert len(payload["checksum"]) == 32
+
+
+def test_send_analytics_event_enqueues():
+    """Test that send_analytics_event queues the event instead of sending it inline."""
+    with patch(
+        "coinbase_agentkit.analytics.send_analytics_event.get_analytics_exporter"
+    ) as mock_get_exporter:
+        send_analytics_event({"name": "test_event", "action": "test", "component": "test"})
+
+    event = mock_get_exporter.return_value.enqueue.call_args.args[0]
+    assert event["event_type"] == "test_event"
+    assert event["event_properties"]["component_type"] == "test"
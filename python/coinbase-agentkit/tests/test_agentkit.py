@@ -0,0 +1,352 @@
+"""Tests for AgentKit."""
+
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from coinbase_agentkit import (
+    ActionCachePolicy,
+    ActionCall,
+    ActionProvider,
+    AgentKit,
+    AgentKitConfig,
+    create_action,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+BASE_SEPOLIA = Network(protocol_family="evm", network_id="base-sepolia", chain_id="84532")
+BASE_MAINNET = Network(protocol_family="evm", network_id="base-mainnet", chain_id="8453")
+
+
+class EmptySchema(BaseModel):
+    """Schema for test actions."""
+
+
+class TestActionProvider(ActionProvider):
+    """Action provider that only supports base-sepolia."""
+
+    __test__ = False
+
+    def __init__(self):
+        super().__init__("test", [])
+        self.supports_network_calls = 0
+
+    @create_action(name="ping", description="Ping", schema=EmptySchema)
+    def ping(self, args: dict) -> str:
+        """Ping."""
+        return "pong"
+
+    def supports_network(self, network: Network) -> bool:
+        """Support base-sepolia only."""
+        self.supports_network_calls += 1
+        return network.network_id == "base-sepolia"
+
+
+@pytest.fixture
+def mock_wallet_provider():
+    """Create a mock wallet provider on base-sepolia."""
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.get_network.return_value = BASE_SEPOLIA
+    return wallet_provider
+
+
+def test_get_actions_cached(mock_wallet_provider):
+    """Test that actions are built once and reused across calls."""
+    provider = TestActionProvider()
+    agent_kit = AgentKit(
+        AgentKitConfig(wallet_provider=mock_wallet_provider, action_providers=[provider])
+    )
+
+    first = agent_kit.get_actions()
+    second = agent_kit.get_actions()
+
+    assert [action.name for action in first] == ["TestActionProvider_ping"]
+    assert first[0] is second[0]
+    assert provider.supports_network_calls == 1
+
+
+def test_get_action_by_name(mock_wallet_provider):
+    """Test that actions can be looked up by name."""
+    agent_kit = AgentKit(
+        AgentKitConfig(
+            wallet_provider=mock_wallet_provider, action_providers=[TestActionProvider()]
+        )
+    )
+
+    assert agent_kit.get_action("TestActionProvider_ping").invoke({}) == "pong"
+    with pytest.raises(ValueError, match="Action missing not found"):
+        agent_kit.get_action("missing")
+
+
+def test_get_actions_rebuilt_on_network_change(mock_wallet_provider):
+    """Test that actions are rebuilt when the wallet's network changes."""
+    agent_kit = AgentKit(
+        AgentKitConfig(
+            wallet_provider=mock_wallet_provider, action_providers=[TestActionProvider()]
+        )
+    )
+    assert len(agent_kit.get_actions()) == 1
+
+    mock_wallet_provider.get_network.return_value = BASE_MAINNET
+
+    assert agent_kit.get_actions() == []
+
+
+def test_get_actions_rebuilt_on_provider_change(mock_wallet_provider):
+    """Test that actions are rebuilt when action providers are added."""
+    agent_kit = AgentKit(
+        AgentKitConfig(
+            wallet_provider=mock_wallet_provider, action_providers=[TestActionProvider()]
+        )
+    )
+    assert len(agent_kit.get_actions()) == 1
+
+    agent_kit.action_providers.append(TestActionProvider())
+
+    assert len(agent_kit.get_actions()) == 2
+
+
+class SchedulingActionProvider(ActionProvider):
+    """Action provider with slow reads and writes that record the order they ran in."""
+
+    def __init__(self):
+        super().__init__("scheduling", [])
+        self.log: list[str] = []
+
+    @create_action(name="read", description="Slow read", schema=EmptySchema, read_only=True)
+    def read(self, wallet_provider: EvmWalletProvider, args: dict) -> str:
+        """Sleep, then return the key."""
+        time.sleep(0.2)
+        self.log.append(f"read {args['key']}")
+        return args["key"]
+
+    @create_action(name="write", description="Slow write", schema=EmptySchema)
+    def write(self, wallet_provider: EvmWalletProvider, args: dict) -> str:
+        """Sleep, then record the write."""
+        time.sleep(args.get("delay", 0.05))
+        if args.get("fail"):
+            raise ValueError("reverted")
+        self.log.append(f"write {args['key']}")
+        return f"wrote {args['key']}"
+
+    @create_action(name="notify", description="Slow action without the wallet", schema=EmptySchema)
+    def notify(self, args: dict) -> str:
+        """Sleep, then record the notification."""
+        time.sleep(0.1)
+        self.log.append(f"notify {args['key']}")
+        return f"notified {args['key']}"
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+@pytest.fixture
+def scheduling_agent_kit(mock_wallet_provider):
+    """Create an AgentKit with the scheduling action provider."""
+    provider = SchedulingActionProvider()
+    agent_kit = AgentKit(
+        AgentKitConfig(wallet_provider=mock_wallet_provider, action_providers=[provider])
+    )
+    return agent_kit, provider
+
+
+def test_run_actions_reads_concurrently(scheduling_agent_kit):
+    """Test that independent reads overlap and results come back in input order."""
+    agent_kit, _ = scheduling_agent_kit
+
+    started = time.monotonic()
+    results = agent_kit.run_actions(
+        [("SchedulingActionProvider_read", {"key": str(key)}) for key in range(5)]
+    )
+
+    assert time.monotonic() - started < 0.6
+    assert [result.result for result in results] == ["0", "1", "2", "3", "4"]
+    assert all(result.error is None for result in results)
+
+
+def test_run_actions_keeps_writes_in_order(scheduling_agent_kit):
+    """Test that writes run in input order and reads run between the writes around them."""
+    agent_kit, provider = scheduling_agent_kit
+
+    started = time.monotonic()
+    results = agent_kit.run_actions(
+        [
+            ("SchedulingActionProvider_write", {"key": "a", "delay": 0.3}),
+            ("SchedulingActionProvider_read", {"key": "r"}),
+            ("SchedulingActionProvider_read", {"key": "s"}),
+            ("SchedulingActionProvider_write", {"key": "b"}),
+        ]
+    )
+
+    assert [result.result for result in results] == ["wrote a", "r", "s", "wrote b"]
+    assert provider.log[0] == "write a"
+    assert sorted(provider.log[1:3]) == ["read r", "read s"]
+    assert provider.log[3] == "write b"
+    # 0.3 for the first write, 0.2 for the overlapping reads and 0.05 for the last write
+    assert time.monotonic() - started < 0.7
+
+
+def test_run_actions_dependencies(scheduling_agent_kit):
+    """Test that calls wait for their dependencies and are skipped when one fails."""
+    agent_kit, provider = scheduling_agent_kit
+
+    results = agent_kit.run_actions(
+        [
+            ActionCall(name="SchedulingActionProvider_write", args={"key": "a"}),
+            ActionCall(name="SchedulingActionProvider_read", args={"key": "r"}, depends_on=[0]),
+            ActionCall(name="SchedulingActionProvider_write", args={"key": "b", "fail": True}),
+            ActionCall(name="SchedulingActionProvider_read", args={"key": "s"}, depends_on=[2]),
+        ]
+    )
+
+    assert provider.log == ["write a", "read r"]
+    assert results[1].result == "r"
+    assert results[2].error == "reverted"
+    assert results[3].error == "Skipped because call 2 failed"
+
+    with pytest.raises(ValueError, match="earlier calls"):
+        agent_kit.run_actions([ActionCall(name="SchedulingActionProvider_read", depends_on=[0])])
+    with pytest.raises(ValueError, match="not found"):
+        agent_kit.run_actions([("missing", {})])
+
+
+def test_run_actions_orders_wallet_actions_only(scheduling_agent_kit):
+    """Test that actions without the wallet provider are not held up or skipped by wallet writes."""
+    agent_kit, provider = scheduling_agent_kit
+
+    results = agent_kit.run_actions(
+        [
+            ("SchedulingActionProvider_write", {"key": "a", "delay": 0.3}),
+            ("SchedulingActionProvider_write", {"key": "b", "fail": True}),
+            ("SchedulingActionProvider_notify", {"key": "n"}),
+            ("SchedulingActionProvider_write", {"key": "c"}),
+        ]
+    )
+
+    assert results[1].error == "reverted"
+    assert results[2].result == "notified n"
+    assert results[3].error == "Skipped because call 1 failed"
+    # The notification finished while the first write was still running
+    assert provider.log == ["notify n", "write a"]
+
+
+def test_arun_actions(scheduling_agent_kit):
+    """Test that the asyncio variant schedules calls the same way."""
+    agent_kit, provider = scheduling_agent_kit
+
+    started = time.monotonic()
+    results = asyncio.run(
+        agent_kit.arun_actions(
+            [
+                ("SchedulingActionProvider_read", {"key": "r"}),
+                ("SchedulingActionProvider_read", {"key": "s"}),
+                ("SchedulingActionProvider_write", {"key": "a"}),
+                ("SchedulingActionProvider_write", {"key": "b"}),
+            ]
+        )
+    )
+
+    assert time.monotonic() - started < 0.5
+    assert [result.result for result in results] == ["r", "s", "wrote a", "wrote b"]
+    assert provider.log.index("write a") < provider.log.index("write b")
+
+
+class CachedActionProvider(ActionProvider):
+    """Action provider with a cached read, an uncached read and a write."""
+
+    def __init__(self):
+        super().__init__("cached", [])
+        self.reads = 0
+
+    @create_action(
+        name="balance",
+        description="Cached read",
+        schema=EmptySchema,
+        read_only=True,
+        cache=ActionCachePolicy(ttl=60),
+    )
+    def balance(self, wallet_provider: EvmWalletProvider, args: dict) -> int:
+        """Count reads."""
+        self.reads += 1
+        return self.reads
+
+    @create_action(
+        name="block_balance",
+        description="Cached per block",
+        schema=EmptySchema,
+        read_only=True,
+        cache=ActionCachePolicy(per_block=True),
+    )
+    def block_balance(self, wallet_provider: EvmWalletProvider, args: dict) -> int:
+        """Count reads."""
+        self.reads += 1
+        return self.reads
+
+    @create_action(name="transfer", description="Write", schema=EmptySchema)
+    def transfer(self, wallet_provider: EvmWalletProvider, args: dict) -> str:
+        """Pretend to transfer."""
+        return "sent"
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+def test_read_only_results_cached(mock_wallet_provider):
+    """Test that identical reads are served from memory until a write runs."""
+    provider = CachedActionProvider()
+    agent_kit = AgentKit(
+        AgentKitConfig(wallet_provider=mock_wallet_provider, action_providers=[provider])
+    )
+    balance = agent_kit.get_action("CachedActionProvider_balance")
+
+    assert balance.invoke({"token": "a"}) == 1
+    assert balance.invoke({"token": "a"}) == 1
+    assert balance.invoke({"token": "b"}) == 2
+    assert asyncio.run(balance.ainvoke({"token": "a"})) == 1
+
+    agent_kit.get_action("CachedActionProvider_transfer").invoke({})
+    assert balance.invoke({"token": "a"}) == 3
+
+
+def test_per_block_results_expire(mock_wallet_provider):
+    """Test that per-block results are reused for one block time of the wallet's chain."""
+    provider = CachedActionProvider()
+    agent_kit = AgentKit(
+        AgentKitConfig(wallet_provider=mock_wallet_provider, action_providers=[provider])
+    )
+    block_balance = agent_kit.get_action("CachedActionProvider_block_balance")
+
+    with patch("coinbase_agentkit.action_providers.action_cache.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        assert block_balance.invoke({}) == 1
+        monotonic.return_value = 101.0
+        assert block_balance.invoke({}) == 1
+        monotonic.return_value = 102.5
+        assert block_balance.invoke({}) == 2
+
+
+def test_result_cache_disabled(mock_wallet_provider):
+    """Test that results are not cached when caching is turned off."""
+    provider = CachedActionProvider()
+    agent_kit = AgentKit(
+        AgentKitConfig(
+            wallet_provider=mock_wallet_provider,
+            action_providers=[provider],
+            cache_action_results=False,
+        )
+    )
+    balance = agent_kit.get_action("CachedActionProvider_balance")
+
+    assert [balance.invoke({}) for _ in range(2)] == [1, 2]
+
+
+def test_cache_policy_requires_read_only():
+    """Test that only read-only actions can set a cache policy."""
+    with pytest.raises(ValueError, match="must be read_only"):
+        create_action(name="write", description="Write", cache=ActionCachePolicy(ttl=1))
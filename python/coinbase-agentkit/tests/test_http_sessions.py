@@ -0,0 +1,88 @@
+"""Tests for shared HTTP sessions."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from coinbase_agentkit.http_sessions import (
+    HttpSessionConfig,
+    configure_http_sessions,
+    get_async_http_session,
+    get_http_session,
+    get_http_session_config,
+)
+from coinbase_agentkit.wallet_providers.rpc_pool import RpcEndpointPool
+
+
+@pytest.fixture(autouse=True)
+def reset_http_sessions():
+    """Restore the default session configuration after each test."""
+    yield
+    configure_http_sessions(HttpSessionConfig())
+
+
+def test_sessions_shared_per_host():
+    """Test that URLs on the same host share a session and other hosts do not."""
+    session = get_http_session("https://hermes.pyth.network/v2/price_feeds?query=BTC")
+
+    assert get_http_session("https://HERMES.pyth.network/v2/updates/price/latest") is session
+    assert get_http_session("https://mainnet.base.org") is not session
+    assert get_http_session("http://hermes.pyth.network") is not session
+
+
+def test_session_settings():
+    """Test that sessions use the configured pool size, timeout and keep-alive."""
+    configure_http_sessions(HttpSessionConfig(pool_maxsize=4, timeout=3.0, keep_alive=False))
+    session = get_http_session("https://example.com")
+
+    adapter = session.get_adapter("https://example.com")
+    assert adapter._pool_maxsize == 4
+    assert session.headers["Connection"] == "close"
+
+    with patch("requests.Session.send") as mock_send:
+        session.get("https://example.com/a")
+        session.get("https://example.com/b", timeout=10)
+
+    assert [call.kwargs["timeout"] for call in mock_send.call_args_list] == [3.0, 10]
+
+
+def test_configure_replaces_sessions():
+    """Test that sessions created after configuration use the new settings."""
+    session = get_http_session("https://example.com")
+
+    configure_http_sessions(HttpSessionConfig(timeout=1.0))
+
+    assert get_http_session("https://example.com") is not session
+    assert get_http_session_config().timeout == 1.0
+
+
+def test_configure_closes_previous_sessions():
+    """Test that replaced sessions are closed, including aiohttp sessions on their own loop."""
+    session = get_http_session("https://example.com")
+    loop = asyncio.new_event_loop()
+
+    async def get_session():
+        return get_async_http_session("https://example.com")
+
+    try:
+        async_session = loop.run_until_complete(get_session())
+
+        with patch.object(session, "close", wraps=session.close) as mock_close:
+            configure_http_sessions(HttpSessionConfig())
+
+        mock_close.assert_called_once()
+        assert async_session.closed
+    finally:
+        loop.close()
+
+
+def test_rpc_endpoint_pool_uses_shared_sessions():
+    """Test that RPC endpoints on a host share its session and the configured timeout."""
+    configure_http_sessions(HttpSessionConfig(timeout=7.0))
+    pool = RpcEndpointPool(["https://rpc.example/a", "https://rpc.example/b"])
+
+    session = get_http_session("https://rpc.example")
+    for endpoint in pool.endpoints:
+        assert endpoint.provider._request_session_manager._explicit_session is session
+        assert endpoint.provider._request_kwargs == {"timeout": 7.0}
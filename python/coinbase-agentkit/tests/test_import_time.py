@@ -0,0 +1,35 @@
+"""Import-time checks for the coinbase_agentkit package."""
+
+import json
+import subprocess
+import sys
+
+# Far more expensive to load than the rest of the package, so a bare import must not load them
+HEAVY_MODULES = ["cdp", "web3", "eth_account", "coinbase_agentkit.action_providers.wow.constants"]
+
+LIST_LOADED_MODULES = f"""
+import json, sys
+import coinbase_agentkit
+print(json.dumps([module for module in {HEAVY_MODULES!r} if module in sys.modules]))
+"""
+
+
+def loaded_heavy_modules() -> list[str]:
+    """Import coinbase_agentkit in a fresh interpreter and list the heavy modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", LIST_LOADED_MODULES], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_bare_import_loads_no_heavy_dependencies():
+    """Test that a bare import loads none of the heavy dependencies."""
+    assert loaded_heavy_modules() == []
+
+
+def test_public_names_still_importable():
+    """Test that public names resolve on first access."""
+    import coinbase_agentkit
+
+    for name in coinbase_agentkit.__all__:
+        assert getattr(coinbase_agentkit, name) is not None
@@ -0,0 +1,32 @@
+"""Shared fixtures for wallet provider tests."""
+
+from unittest.mock import patch
+
+import pytest
+from eth_account import Account
+
+from coinbase_agentkit.wallet_providers import (
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+)
+
+MOCK_CHAIN_ID = "84532"
+
+
+@pytest.fixture
+def create_eth_account_provider():
+    """Create eth-account wallet providers for a new account without sending analytics.
+
+    The returned function takes the provider class, defaulting to EthAccountWalletProvider,
+    and any additional EthAccountWalletProviderConfig fields.
+    """
+
+    def create(provider_class=EthAccountWalletProvider, **config):
+        with patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+            return provider_class(
+                EthAccountWalletProviderConfig(
+                    account=Account.create(), chain_id=MOCK_CHAIN_ID, **config
+                )
+            )
+
+    return create
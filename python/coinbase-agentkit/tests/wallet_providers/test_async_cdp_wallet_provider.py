@@ -0,0 +1,50 @@
+"""Tests for the asyncio CDP wallet provider wrapper."""
+
+import asyncio
+import threading
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers import AsyncCdpWalletProvider, CdpWalletProvider
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_TX_HASH = "0xabcdef"
+
+
+@pytest.fixture
+def mock_cdp_wallet_provider():
+    """Create a mock CDP wallet provider."""
+    wallet_provider = Mock(spec=CdpWalletProvider)
+    wallet_provider.get_address.return_value = MOCK_ADDRESS
+    wallet_provider.get_balance.return_value = Decimal(1000)
+    wallet_provider.send_transaction.return_value = MOCK_TX_HASH
+    return wallet_provider
+
+
+def test_delegates_to_wrapped_provider(mock_cdp_wallet_provider):
+    """Test that calls are delegated to the wrapped provider."""
+    provider = AsyncCdpWalletProvider(mock_cdp_wallet_provider)
+
+    assert provider.get_address() == MOCK_ADDRESS
+    assert asyncio.run(provider.get_balance()) == Decimal(1000)
+    assert asyncio.run(provider.send_transaction({"to": MOCK_ADDRESS})) == MOCK_TX_HASH
+    mock_cdp_wallet_provider.send_transaction.assert_called_once_with({"to": MOCK_ADDRESS})
+
+
+def test_blocking_calls_run_off_the_event_loop(mock_cdp_wallet_provider):
+    """Test that concurrent blocking SDK calls do not serialize on the event loop."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def send_transaction(transaction):
+        barrier.wait()
+        return MOCK_TX_HASH
+
+    mock_cdp_wallet_provider.send_transaction.side_effect = send_transaction
+    provider = AsyncCdpWalletProvider(mock_cdp_wallet_provider)
+
+    async def send_concurrently():
+        return await asyncio.gather(*(provider.send_transaction({}) for _ in range(3)))
+
+    assert asyncio.run(send_concurrently()) == [MOCK_TX_HASH] * 3
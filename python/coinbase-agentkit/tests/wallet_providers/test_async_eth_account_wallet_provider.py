@@ -0,0 +1,137 @@
+"""Tests for the asyncio eth-account wallet provider."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_account.typed_transactions import TypedTransaction
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.wallet_providers import (
+    AsyncEthAccountWalletProvider,
+    WalletProviderBase,
+)
+from coinbase_agentkit.wallet_providers.fee_oracle import FeeEstimate
+
+MOCK_TOKEN_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_TX_HASH = b"\x12" * 32
+MOCK_FEE_ESTIMATE = FeeEstimate(block_number=1, base_fee_per_gas=100, priority_fees={50: 10})
+
+
+@pytest.fixture
+def wallet_provider(create_eth_account_provider):
+    """Create an async eth-account wallet provider with a mocked AsyncWeb3 backend."""
+    provider = create_eth_account_provider(AsyncEthAccountWalletProvider)
+    provider.web3 = AsyncMock()
+    provider.web3.eth.get_balance.return_value = 1000
+    provider.web3.eth.get_transaction_count.return_value = 5
+    provider.web3.eth.estimate_gas.return_value = 21000
+    provider.web3.eth.send_raw_transaction.return_value = MOCK_TX_HASH
+    return provider
+
+
+@pytest.fixture(autouse=True)
+def mock_fee_oracle():
+    """Serve a fixed fee estimate instead of querying fee history."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.async_eth_account_wallet_provider.get_async_fee_oracle"
+    ) as mock_get_fee_oracle:
+        mock_get_fee_oracle.return_value.get_fee_estimate = AsyncMock(
+            return_value=MOCK_FEE_ESTIMATE
+        )
+        yield mock_get_fee_oracle
+
+
+def test_get_balance(wallet_provider):
+    """Test that the balance is read without blocking."""
+    assert asyncio.run(wallet_provider.get_balance()) == Decimal(1000)
+    wallet_provider.web3.eth.get_balance.assert_awaited_once_with(wallet_provider.get_address())
+
+
+def test_read_contract(wallet_provider):
+    """Test that contract reads are encoded, awaited and decoded."""
+    wallet_provider.web3.eth.call.return_value = Web3().codec.encode(["uint256"], [42])
+
+    result = asyncio.run(
+        wallet_provider.read_contract(
+            MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [wallet_provider.get_address()]
+        )
+    )
+
+    assert result == 42
+    call_args = wallet_provider.web3.eth.call.call_args
+    assert call_args.args[0]["to"] == MOCK_TOKEN_ADDRESS
+    assert call_args.args[0]["data"].startswith("0x70a08231")
+    assert call_args.kwargs["block_identifier"] == "latest"
+
+
+def test_read_contract_checksums_address(wallet_provider):
+    """Test that a lowercase contract address is checksummed before the call."""
+    wallet_provider.web3.eth.call.return_value = Web3().codec.encode(["uint256"], [42])
+    address = "0xabcdefabcdefabcdefabcdefabcdefabcdefabcd"
+
+    result = asyncio.run(
+        wallet_provider.read_contract(
+            address, ERC20_ABI, "balanceOf", [wallet_provider.get_address()]
+        )
+    )
+
+    assert result == 42
+    call_args = wallet_provider.web3.eth.call.call_args
+    assert call_args.args[0]["to"] == Web3.to_checksum_address(address)
+
+
+def test_send_transaction(wallet_provider):
+    """Test that transactions are signed locally with fees, gas and a local nonce."""
+
+    async def send_twice():
+        return [
+            await wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS, "value": 1})
+            for _ in range(2)
+        ]
+
+    assert asyncio.run(send_twice()) == [Web3.to_hex(MOCK_TX_HASH)] * 2
+
+    wallet_provider.web3.eth.get_transaction_count.assert_awaited_once()
+    raw_transactions = [
+        call.args[0] for call in wallet_provider.web3.eth.send_raw_transaction.call_args_list
+    ]
+    transactions = [TypedTransaction.from_bytes(raw).as_dict() for raw in raw_transactions]
+    assert [tx["nonce"] for tx in transactions] == [5, 6]
+    assert transactions[0]["maxFeePerGas"] == 110
+    assert transactions[0]["gas"] == int(21000 * 1.2)
+
+
+def test_sign_message(wallet_provider):
+    """Test that messages are signed with the local account."""
+    signature = asyncio.run(wallet_provider.sign_message("hello"))
+
+    recovered = Account.recover_message(
+        encode_defunct(b"hello"), signature=bytes.fromhex(signature.removeprefix("0x"))
+    )
+    assert recovered == wallet_provider.get_address()
+
+
+def test_shares_wallet_provider_base(wallet_provider):
+    """Test that async providers inherit metadata and tracking from the shared base class."""
+    assert isinstance(wallet_provider, WalletProviderBase)
+    assert wallet_provider.get_wallet_metadata()["wallet_address"] == wallet_provider.get_address()
+
+
+def test_wait_for_transaction_receipt_uses_web3_polling_by_default(wallet_provider):
+    """Test that receipts are polled at web3's interval unless a poll latency is given."""
+    wallet_provider.web3.eth.wait_for_transaction_receipt.return_value = {"blockNumber": 1}
+
+    asyncio.run(wallet_provider.wait_for_transaction_receipt(MOCK_TX_HASH, timeout=5))
+    asyncio.run(wallet_provider.wait_for_transaction_receipt(MOCK_TX_HASH, poll_latency=0.5))
+
+    assert [
+        call.kwargs for call in wallet_provider.web3.eth.wait_for_transaction_receipt.call_args_list
+    ] == [
+        {"timeout": 5},
+        {"timeout": 120, "poll_latency": 0.5},
+    ]
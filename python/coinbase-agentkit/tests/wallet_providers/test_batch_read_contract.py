@@ -0,0 +1,153 @@
+"""Tests for Multicall3-backed batch contract reads."""
+
+from types import MethodType
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+from coinbase_agentkit.wallet_providers.multicall import MULTICALL3_ABI
+
+MOCK_TOKEN_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_OWNER_ADDRESS = "0x9876543210987654321098765432109876543210"
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+ERC20_ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "stateMutability": "view",
+        "inputs": [{"name": "account", "type": "address"}],
+        "outputs": [{"type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "decimals",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "uint8"}],
+    },
+]
+
+
+@pytest.fixture
+def mock_wallet():
+    """Create a mock EVM wallet provider that uses the real batch_read_contract."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", chain_id="84532", network_id="base-sepolia"
+    )
+    wallet.batch_read_contract = MethodType(EvmWalletProvider.batch_read_contract, wallet)
+    wallet._read_contract_call = MethodType(EvmWalletProvider._read_contract_call, wallet)
+    return wallet
+
+
+def encode_output(output_type: str, value) -> bytes:
+    """Encode a single return value the way a contract would."""
+    return Web3().codec.encode([output_type], [value])
+
+
+def test_batch_read_contract_single_multicall(mock_wallet):
+    """Test that several reads are sent as one aggregate3 call and decoded per call."""
+    mock_wallet.read_contract.return_value = [
+        (True, encode_output("uint256", 1000)),
+        (True, encode_output("uint8", 18)),
+    ]
+
+    results = mock_wallet.batch_read_contract(
+        [
+            {
+                "contract_address": MOCK_TOKEN_ADDRESS,
+                "abi": ERC20_ABI,
+                "function_name": "balanceOf",
+                "args": [MOCK_OWNER_ADDRESS],
+            },
+            {
+                "contract_address": MOCK_TOKEN_ADDRESS,
+                "abi": ERC20_ABI,
+                "function_name": "decimals",
+            },
+        ]
+    )
+
+    assert results == [1000, 18]
+    mock_wallet.read_contract.assert_called_once()
+    kwargs = mock_wallet.read_contract.call_args.kwargs
+    assert kwargs["contract_address"] == MULTICALL3_ADDRESS
+    assert kwargs["abi"] == MULTICALL3_ABI
+    assert kwargs["function_name"] == "aggregate3"
+    assert kwargs["block_identifier"] == "latest"
+
+    contract = Web3().eth.contract(abi=ERC20_ABI)
+    assert kwargs["args"] == [
+        [
+            (
+                MOCK_TOKEN_ADDRESS,
+                True,
+                contract.encode_abi("balanceOf", [MOCK_OWNER_ADDRESS]),
+            ),
+            (MOCK_TOKEN_ADDRESS, True, contract.encode_abi("decimals", [])),
+        ]
+    ]
+
+
+def test_batch_read_contract_allow_failure(mock_wallet):
+    """Test that failed calls yield None when they allow failure."""
+    mock_wallet.read_contract.return_value = [(False, b"")]
+
+    results = mock_wallet.batch_read_contract(
+        [
+            {
+                "contract_address": MOCK_TOKEN_ADDRESS,
+                "abi": ERC20_ABI,
+                "function_name": "decimals",
+                "allow_failure": True,
+            }
+        ]
+    )
+
+    assert results == [None]
+
+
+def test_batch_read_contract_failure(mock_wallet):
+    """Test that a failed call raises when it does not allow failure."""
+    mock_wallet.read_contract.return_value = [(False, b"")]
+
+    with pytest.raises(Exception, match="Failed to read decimals"):
+        mock_wallet.batch_read_contract(
+            [
+                {
+                    "contract_address": MOCK_TOKEN_ADDRESS,
+                    "abi": ERC20_ABI,
+                    "function_name": "decimals",
+                }
+            ]
+        )
+
+
+def test_batch_read_contract_without_multicall(mock_wallet):
+    """Test that reads fall back to read_contract on unknown networks."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", chain_id="31337", network_id="local"
+    )
+    mock_wallet.read_contract.return_value = 18
+
+    results = mock_wallet.batch_read_contract(
+        [
+            {
+                "contract_address": MOCK_TOKEN_ADDRESS,
+                "abi": ERC20_ABI,
+                "function_name": "decimals",
+            }
+        ]
+    )
+
+    assert results == [18]
+    mock_wallet.read_contract.assert_called_once_with(
+        contract_address=MOCK_TOKEN_ADDRESS,
+        abi=ERC20_ABI,
+        function_name="decimals",
+        args=None,
+        block_identifier="latest",
+    )
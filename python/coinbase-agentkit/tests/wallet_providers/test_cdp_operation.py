@@ -0,0 +1,145 @@
+"""Tests for non-blocking CDP operation handles."""
+
+import asyncio
+import time
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers import CdpOperationHandle, CdpWalletProvider
+from coinbase_agentkit.wallet_providers.cdp_operation import CdpOperationWatcher
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_TX_HASH = "0xabcdef"
+
+
+class FakeTransfer:
+    """Stand-in for a CDP transfer that lands after a number of reloads."""
+
+    def __init__(self, reloads_until_terminal: int = 1, final_status: str = "complete"):
+        self.status = "broadcast"
+        self.transaction_hash = None
+        self.reloads = 0
+        self._reloads_until_terminal = reloads_until_terminal
+        self._final_status = final_status
+
+    @property
+    def terminal_state(self) -> bool:
+        """Whether the transfer has completed or failed."""
+        return self.status in ("complete", "failed")
+
+    def reload(self):
+        """Advance the transfer towards its final status."""
+        self.reloads += 1
+        if self.reloads >= self._reloads_until_terminal:
+            self.status = self._final_status
+            self.transaction_hash = MOCK_TX_HASH
+
+
+class FlakyTransfer(FakeTransfer):
+    """Stand-in for a CDP transfer whose first reload fails."""
+
+    def reload(self):
+        """Fail once, then land."""
+        if not hasattr(self, "errored"):
+            self.errored = True
+            raise Exception("rate limited")
+        super().reload()
+
+
+def create_handle(transfer: FakeTransfer) -> CdpOperationHandle[str]:
+    """Create a handle for a fake transfer that resolves to its transaction hash."""
+    return CdpOperationHandle(
+        transfer,
+        is_terminal=lambda transfer: transfer.terminal_state,
+        resolve=lambda transfer: transfer.transaction_hash,
+        description="Transfer",
+    )
+
+
+@pytest.fixture
+def watcher():
+    """Create a watcher that polls quickly."""
+    return CdpOperationWatcher(poll_interval=0.01)
+
+
+def test_poll_updates_status():
+    """Test that polling reloads the operation and resolves it once terminal."""
+    handle = create_handle(FakeTransfer(reloads_until_terminal=2))
+
+    assert handle.status == "broadcast"
+    assert handle.poll() == "broadcast"
+    assert not handle.done()
+    assert handle.poll() == "complete"
+    assert handle.result(0) == MOCK_TX_HASH
+
+
+def test_watcher_resolves_handles(watcher):
+    """Test that watched handles are resolved in the background and collected in order."""
+    transfers = [FakeTransfer(reloads_until_terminal=n) for n in (3, 1, 2)]
+    handles = [watcher.watch(create_handle(transfer)) for transfer in transfers]
+
+    assert CdpOperationHandle.wait_all(handles, timeout=5) == [MOCK_TX_HASH] * 3
+
+
+def test_failed_operation(watcher):
+    """Test that a failed operation raises from result and can be returned by wait_all."""
+    failed = watcher.watch(create_handle(FakeTransfer(final_status="failed")))
+    complete = watcher.watch(create_handle(FakeTransfer()))
+
+    with pytest.raises(Exception, match="Transfer failed with status failed"):
+        failed.result(5)
+
+    results = CdpOperationHandle.wait_all([failed, complete], return_exceptions=True)
+    assert isinstance(results[0], Exception)
+    assert results[1] == MOCK_TX_HASH
+
+
+def test_operation_timeout(watcher):
+    """Test that a handle fails once its operation exceeds the timeout."""
+    handle = watcher.watch(create_handle(FakeTransfer(reloads_until_terminal=10**6)), timeout=0.05)
+
+    with pytest.raises(TimeoutError, match="Timed out waiting for Transfer"):
+        handle.result(5)
+
+
+def test_reload_errors_are_retried(watcher):
+    """Test that a transient reload failure does not fail the handle."""
+    transfer = FlakyTransfer()
+
+    assert watcher.watch(create_handle(transfer)).result(5) == MOCK_TX_HASH
+
+
+def test_handle_is_awaitable(watcher):
+    """Test that asyncio code can await a handle."""
+    handle = watcher.watch(create_handle(FakeTransfer(reloads_until_terminal=2)))
+
+    assert asyncio.run(asyncio.wait_for(_await(handle), 5)) == MOCK_TX_HASH
+
+
+async def _await(handle):
+    """Await a handle from a coroutine."""
+    return await handle
+
+
+def test_start_native_transfer_returns_after_broadcast():
+    """Test that the CDP provider returns a handle before the transfer lands."""
+    transfer = FakeTransfer(reloads_until_terminal=2)
+    provider = CdpWalletProvider.__new__(CdpWalletProvider)
+    provider._wallet = Mock()
+    provider._wallet.transfer.return_value = transfer
+
+    started = time.monotonic()
+    handle = provider.start_native_transfer(MOCK_ADDRESS, Decimal("1.5"))
+
+    assert time.monotonic() - started < 0.5
+    assert not handle.done()
+    assert handle.result(5) == MOCK_TX_HASH
+    provider._wallet.transfer.assert_called_once_with(
+        amount=Decimal("1.5"), asset_id="eth", destination=MOCK_ADDRESS, gasless=False
+    )
+
+    provider._wallet.transfer.return_value = FakeTransfer(final_status="failed")
+    with pytest.raises(Exception, match="Failed to transfer native tokens: Transfer failed"):
+        provider.native_transfer(MOCK_ADDRESS, Decimal("1.5"))
@@ -0,0 +1,129 @@
+"""Tests for loading the CDP wallet in the background."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coinbase_agentkit.wallet_providers import (
+    AsyncCdpWalletProvider,
+    CdpWalletProvider,
+    CdpWalletProviderConfig,
+)
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+@pytest.fixture
+def mock_wallet_class():
+    """Patch the CDP SDK so that Wallet.create blocks until released."""
+    released = threading.Event()
+    wallet = Mock()
+    wallet.default_address.address_id = MOCK_ADDRESS
+
+    def create(network_id):
+        assert released.wait(5)
+        return wallet
+
+    with (
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Cdp"),
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Wallet") as mock_wallet_class,
+    ):
+        mock_wallet_class.create.side_effect = create
+        mock_wallet_class.released = released
+        yield mock_wallet_class
+
+
+def wait_for_tracking(mock_send_analytics_event: Mock) -> None:
+    """Wait for initialization tracking, which runs on the loading thread after the wallet loads."""
+    deadline = time.monotonic() + 5
+    while not mock_send_analytics_event.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def mock_send_analytics_event():
+    """Patch analytics for the whole test, since initialization is tracked after loading."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"
+    ) as mock_send_analytics_event:
+        yield mock_send_analytics_event
+
+
+def test_construction_does_not_wait_for_wallet(mock_wallet_class, mock_send_analytics_event):
+    """Test that the wallet loads in the background and initialization is tracked afterwards."""
+    provider = CdpWalletProvider(CdpWalletProviderConfig(api_key_name="n", api_key_private_key="k"))
+
+    ready = provider.load_wallet()
+    assert not ready.done()
+    assert provider.get_network().network_id == "base-sepolia"
+    mock_send_analytics_event.assert_not_called()
+
+    mock_wallet_class.released.set()
+    assert provider.get_address() == MOCK_ADDRESS
+    assert ready.done()
+    mock_wallet_class.create.assert_called_once_with(network_id="base-sepolia")
+
+    wait_for_tracking(mock_send_analytics_event)
+    event = mock_send_analytics_event.call_args.args[0]
+    assert event["wallet_address"] == MOCK_ADDRESS
+    assert event["wallet_provider"] == "cdp_wallet_provider"
+
+
+def test_wallet_loaded_on_first_use(mock_wallet_class, mock_send_analytics_event):
+    """Test that a provider that does not preload creates the wallet when it is first needed."""
+    mock_wallet_class.released.set()
+    provider = CdpWalletProvider(
+        CdpWalletProviderConfig(api_key_name="n", api_key_private_key="k", preload_wallet=False)
+    )
+
+    mock_wallet_class.create.assert_not_called()
+
+    assert provider.get_address() == MOCK_ADDRESS
+    mock_wallet_class.create.assert_called_once()
+    # Otherwise the event could reach the analytics patch of the next test
+    wait_for_tracking(mock_send_analytics_event)
+    mock_send_analytics_event.assert_called_once()
+
+
+def test_load_failure_raised_on_use(mock_wallet_class, mock_send_analytics_event):
+    """Test that a failed load is raised by calls that need the wallet and is not tracked."""
+    mock_wallet_class.create.side_effect = Exception("unauthorized")
+    provider = CdpWalletProvider(CdpWalletProviderConfig(api_key_name="n", api_key_private_key="k"))
+
+    with pytest.raises(ValueError, match="Failed to initialize CDP wallet: unauthorized"):
+        provider.get_address()
+    mock_send_analytics_event.assert_not_called()
+
+
+def test_async_wrapper_awaits_wallet(mock_wallet_class, mock_send_analytics_event):
+    """Test that the asyncio wrapper can wait for the wallet without blocking the loop."""
+    provider = AsyncCdpWalletProvider(
+        CdpWalletProvider(CdpWalletProviderConfig(api_key_name="n", api_key_private_key="k"))
+    )
+
+    async def load():
+        asyncio.get_running_loop().call_later(0.05, mock_wallet_class.released.set)
+        await provider.load_wallet()
+        return provider.get_address()
+
+    assert asyncio.run(load()) == MOCK_ADDRESS
+    wait_for_tracking(mock_send_analytics_event)
+
+
+def test_async_create_waits_for_wallet(mock_wallet_class, mock_send_analytics_event):
+    """Test that the asyncio factory only returns once the wallet has loaded."""
+
+    async def create():
+        asyncio.get_running_loop().call_later(0.05, mock_wallet_class.released.set)
+        return await AsyncCdpWalletProvider.create(
+            CdpWalletProviderConfig(api_key_name="n", api_key_private_key="k")
+        )
+
+    provider = asyncio.run(create())
+
+    assert provider.wallet_provider.load_wallet().done()
+    assert provider.get_address() == MOCK_ADDRESS
+    wait_for_tracking(mock_send_analytics_event)
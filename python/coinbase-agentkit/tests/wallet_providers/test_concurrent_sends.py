@@ -0,0 +1,193 @@
+"""Stress tests for sharing one wallet provider between threads."""
+
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+
+from coinbase_agentkit.wallet_providers import BroadcastError
+
+MOCK_TO_ADDRESS = "0x1234567890123456789012345678901234567890"
+THREADS = 8
+SENDS_PER_THREAD = 10
+
+
+class LocalChain(JSONBaseProvider):
+    """Stand-in for a node that validates nonces of raw transactions like a mempool does.
+
+    Transactions with no value are rejected as if the account could not pay for them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.transactions: dict[int, dict] = {}
+        self.rejected = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Get the account's next nonce with no gap below it."""
+        nonce = 0
+        while nonce in self.transactions:
+            nonce += 1
+        return nonce
+
+    def make_request(self, method, params):
+        """Serve a single request."""
+        with self._lock:
+            return self._respond(0, method, params)
+
+    def make_batch_request(self, requests):
+        """Serve a batch request."""
+        with self._lock:
+            return [
+                self._respond(request_id, method, params)
+                for request_id, (method, params) in enumerate(requests)
+            ]
+
+    def _respond(self, request_id, method, params):
+        """Answer one request against the local state."""
+        if method == "eth_sendRawTransaction":
+            transaction = TypedTransaction.from_bytes(HexBytes(params[0])).as_dict()
+            if not transaction["value"]:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "error": {
+                        "code": -32000,
+                        "message": "insufficient funds for gas * price + value",
+                    },
+                }
+            if transaction["nonce"] in self.transactions:
+                self.rejected += 1
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "error": {"code": -32000, "message": "nonce too low"},
+                }
+            self.transactions[transaction["nonce"]] = transaction
+            result = "0x" + f"{transaction['nonce']:064x}"
+        elif method == "eth_getTransactionCount":
+            result = hex(self.pending_count)
+        elif method == "eth_estimateGas":
+            result = hex(21000)
+        elif method == "eth_feeHistory":
+            result = {
+                "oldestBlock": hex(1),
+                "baseFeePerGas": ["0x64", "0x64"],
+                "gasUsedRatio": [0.5],
+                "reward": [["0x1", "0xa", "0x14"]],
+            }
+        elif method == "eth_chainId":
+            result = hex(84532)
+        else:
+            raise NotImplementedError(method)
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+@pytest.fixture
+def chain():
+    """Create a local chain stand-in."""
+    return LocalChain()
+
+
+@pytest.fixture
+def wallet_provider(create_eth_account_provider, chain):
+    """Create one eth-account wallet provider backed by the local chain."""
+    provider = create_eth_account_provider()
+    provider.web3 = Web3(chain)
+    return provider
+
+
+def test_concurrent_sends_share_one_provider(wallet_provider, chain):
+    """Test that threads sharing a provider and a transaction dict never reuse a nonce."""
+    shared_transaction = {"to": MOCK_TO_ADDRESS, "value": 1}
+    original = copy.deepcopy(shared_transaction)
+
+    def send_many_times(thread_index: int) -> list[str]:
+        tx_hashes = []
+        for send_index in range(SENDS_PER_THREAD):
+            if send_index % 2:
+                tx_hashes.append(wallet_provider.send_transaction(shared_transaction))
+            else:
+                tx_hashes.extend(
+                    wallet_provider.send_transactions([shared_transaction, shared_transaction])
+                )
+        return tx_hashes
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(send_many_times, range(THREADS)))
+
+    expected_count = THREADS * SENDS_PER_THREAD * 3 // 2
+    tx_hashes = [tx_hash for thread_hashes in results for tx_hash in thread_hashes]
+
+    assert len(set(tx_hashes)) == expected_count
+    assert sorted(chain.transactions) == list(range(expected_count))
+    assert chain.rejected == 0
+    assert shared_transaction == original
+    assert all(tx["to"] == HexBytes(MOCK_TO_ADDRESS) for tx in chain.transactions.values())
+
+
+def test_concurrent_failures_leave_no_nonce_gap(wallet_provider, chain):
+    """Test that sends failing concurrently with others neither reuse nor skip a nonce."""
+    transaction = {"to": MOCK_TO_ADDRESS, "value": 1}
+    failing_transaction = {"to": MOCK_TO_ADDRESS, "value": 0}
+
+    def send_many_times(thread_index: int) -> tuple[list[str], int]:
+        tx_hashes = []
+        failures = 0
+        for send_index in range(SENDS_PER_THREAD):
+            try:
+                if (thread_index + send_index) % 3 == 0:
+                    wallet_provider.send_transaction(failing_transaction)
+                elif send_index % 2:
+                    tx_hashes.append(wallet_provider.send_transaction(transaction))
+                else:
+                    tx_hashes.extend(
+                        wallet_provider.send_transactions([transaction, failing_transaction])
+                    )
+            except BroadcastError as e:
+                tx_hashes.extend(tx_hash for tx_hash in e.tx_hashes if tx_hash is not None)
+                failures += 1
+            except Exception:
+                failures += 1
+        return tx_hashes, failures
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(send_many_times, range(THREADS)))
+
+    tx_hashes = [tx_hash for thread_hashes, _ in results for tx_hash in thread_hashes]
+    failures = sum(thread_failures for _, thread_failures in results)
+    assert failures > 0
+
+    # Nonces released by failures while other sends were in flight go to the next sends
+    for _ in range(failures):
+        if chain.pending_count == len(chain.transactions):
+            break
+        tx_hashes.append(wallet_provider.send_transaction(transaction))
+
+    assert len(set(tx_hashes)) == len(tx_hashes) == len(chain.transactions)
+    assert sorted(chain.transactions) == list(range(len(chain.transactions)))
+    assert chain.rejected == 0
+
+
+def test_sign_transaction_leaves_parameters_unchanged(wallet_provider):
+    """Test that signing does not add fields to the caller's transaction."""
+    transaction = {
+        "to": MOCK_TO_ADDRESS,
+        "value": 1,
+        "gas": 21000,
+        "maxFeePerGas": 2,
+        "maxPriorityFeePerGas": 1,
+        "nonce": 0,
+    }
+    original = dict(transaction)
+
+    wallet_provider.sign_transaction(transaction)
+
+    assert transaction == original
@@ -0,0 +1,129 @@
+"""Tests for the block-scoped fee oracle."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.fee_oracle import (
+    DEFAULT_MAX_PRIORITY_FEE_PER_GAS,
+    FEE_HISTORY_BLOCK_COUNT,
+    FEE_HISTORY_PERCENTILES,
+    AsyncFeeOracle,
+    FeeOracle,
+    get_fee_oracle,
+)
+
+MOCK_HEAD = 100
+MOCK_FEE_HISTORY = {
+    "oldestBlock": 96,
+    "baseFeePerGas": [10, 11, 12, 13, 14, 15],
+    "reward": [[1, 2, 3], [1, 4, 5], [1, 6, 7], [1, 8, 9], [1, 10, 11]],
+}
+
+
+@pytest.fixture
+def mock_web3():
+    """Create a mock web3 instance with a fixed chain head."""
+    web3 = Mock()
+    web3.eth.block_number = MOCK_HEAD
+    web3.eth.fee_history.return_value = MOCK_FEE_HISTORY
+    return web3
+
+
+def test_get_fee_estimate(mock_web3):
+    """Test that the estimate uses the next block's base fee and median rewards."""
+    estimate = FeeOracle(mock_web3).get_fee_estimate()
+
+    mock_web3.eth.fee_history.assert_called_once_with(
+        FEE_HISTORY_BLOCK_COUNT, MOCK_HEAD, FEE_HISTORY_PERCENTILES
+    )
+    assert estimate.block_number == MOCK_HEAD
+    assert estimate.base_fee_per_gas == 15
+    assert estimate.priority_fees == {25: 1, 50: 6, 75: 7}
+    assert estimate.max_priority_fee_per_gas() == 6
+
+
+def test_get_fee_estimate_cached_within_block(mock_web3):
+    """Test that fee history is fetched once per block."""
+    oracle = FeeOracle(mock_web3, ttl=0)
+
+    for _ in range(3):
+        oracle.get_fee_estimate()
+    mock_web3.eth.fee_history.assert_called_once()
+
+    mock_web3.eth.block_number = MOCK_HEAD + 1
+    assert oracle.get_fee_estimate().block_number == MOCK_HEAD + 1
+    assert mock_web3.eth.fee_history.call_count == 2
+
+
+def test_get_fee_estimate_reused_within_ttl():
+    """Test that the head is not checked again until the TTL has passed."""
+    web3 = Mock()
+    head = Mock(return_value=MOCK_HEAD)
+    type(web3.eth).block_number = property(lambda _: head())
+    web3.eth.fee_history.return_value = MOCK_FEE_HISTORY
+    oracle = FeeOracle(web3, ttl=1)
+
+    with patch("time.monotonic", return_value=10.0):
+        first_estimate = oracle.get_fee_estimate()
+        head.return_value = MOCK_HEAD + 1
+        assert oracle.get_fee_estimate() is first_estimate
+        assert oracle.current_estimate() is first_estimate
+
+    with patch("time.monotonic", return_value=11.0):
+        assert oracle.current_estimate() is None
+        assert oracle.get_fee_estimate().block_number == MOCK_HEAD + 1
+
+    assert head.call_count == 2
+
+
+def test_get_fee_estimate_without_rewards(mock_web3):
+    """Test that the default priority fee is used when no reward data is returned."""
+    mock_web3.eth.fee_history.return_value = {**MOCK_FEE_HISTORY, "reward": []}
+
+    estimate = FeeOracle(mock_web3).get_fee_estimate()
+
+    assert estimate.max_priority_fee_per_gas() == DEFAULT_MAX_PRIORITY_FEE_PER_GAS
+
+
+def test_get_fee_oracle_shared_per_chain_and_endpoints(mock_web3):
+    """Test that providers on the same chain and RPC endpoints share one oracle."""
+    oracle = get_fee_oracle("test-chain", mock_web3)
+    same_endpoints = Mock()
+    same_endpoints.provider = mock_web3.provider
+
+    assert get_fee_oracle("test-chain", same_endpoints) is oracle
+    assert get_fee_oracle("test-chain", Mock()) is not oracle
+    assert get_fee_oracle("other-test-chain", mock_web3) is not oracle
+
+
+def test_get_fee_oracle_shared_per_head_subscription(mock_web3):
+    """Test that providers following different head subscriptions do not share an oracle."""
+    subscription = Mock()
+    oracle = get_fee_oracle("test-chain", mock_web3, subscription)
+
+    assert get_fee_oracle("test-chain", mock_web3, subscription) is oracle
+    assert get_fee_oracle("test-chain", mock_web3, Mock()) is not oracle
+    assert get_fee_oracle("test-chain", mock_web3) is not oracle
+    assert oracle._head_subscription is subscription
+
+
+def test_async_get_fee_estimate_cached_within_block():
+    """Test that the async oracle fetches fee history once per block."""
+    web3 = AsyncMock()
+    web3.eth.fee_history.return_value = MOCK_FEE_HISTORY
+    head = AsyncMock(return_value=MOCK_HEAD)
+    type(web3.eth).block_number = property(lambda _: head())
+    oracle = AsyncFeeOracle(web3)
+
+    async def estimate_three_times():
+        return [await oracle.get_fee_estimate() for _ in range(3)]
+
+    estimates = asyncio.run(estimate_three_times())
+
+    web3.eth.fee_history.assert_awaited_once_with(
+        FEE_HISTORY_BLOCK_COUNT, MOCK_HEAD, FEE_HISTORY_PERCENTILES
+    )
+    assert estimates[0].base_fee_per_gas == 15
+    assert estimates[0].max_priority_fee_per_gas() == 6
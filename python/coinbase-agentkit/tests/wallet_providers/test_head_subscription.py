@@ -0,0 +1,244 @@
+"""Tests for the newHeads WebSocket subscription and the consumers it drives."""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from eth_account import Account
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+from websockets.sync.server import serve
+
+from coinbase_agentkit.wallet_providers import (
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+)
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmRpcConfig
+from coinbase_agentkit.wallet_providers.fee_oracle import FeeOracle
+from coinbase_agentkit.wallet_providers.head_subscription import HeadSubscription
+from coinbase_agentkit.wallet_providers.read_cache import ReadCache
+from coinbase_agentkit.wallet_providers.receipt_watcher import ReceiptWatcher
+
+SUBSCRIPTION_ID = "0x9cef478923ff08bf67fde6c64013158d"
+TX_HASH = "0x" + "ab" * 32
+FEE_HISTORY = {
+    "oldestBlock": hex(96),
+    "baseFeePerGas": ["0x64"] * 6,
+    "gasUsedRatio": [0.5] * 5,
+    "reward": [["0x1", "0xa", "0x14"]] * 5,
+}
+
+
+class WebSocketRpcServer:
+    """Local stand-in for a WebSocket JSON-RPC endpoint that supports newHeads."""
+
+    def __init__(self):
+        self.connections = []
+        self.requests: list[str] = []
+        self._server = serve(self._handle, "127.0.0.1", 0)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        """Get the server's WebSocket URL."""
+        return f"ws://127.0.0.1:{self._server.socket.getsockname()[1]}"
+
+    def push_head(self, block_number: int) -> None:
+        """Send a newHeads notification to every subscriber."""
+        notification = {
+            "jsonrpc": "2.0",
+            "method": "eth_subscription",
+            "params": {
+                "subscription": SUBSCRIPTION_ID,
+                "result": {
+                    "number": hex(block_number),
+                    "hash": "0x" + f"{block_number:064x}",
+                    "parentHash": "0x" + f"{block_number - 1:064x}",
+                },
+            },
+        }
+        for connection in list(self.connections):
+            connection.send(json.dumps(notification))
+
+    def disconnect(self) -> None:
+        """Drop every open connection."""
+        for connection in list(self.connections):
+            connection.close()
+
+    def shutdown(self) -> None:
+        """Stop the server."""
+        self.disconnect()
+        self._server.shutdown()
+
+    def _handle(self, connection):
+        """Answer eth_subscribe and record every request."""
+        for message in connection:
+            request = json.loads(message)
+            self.requests.append(request["method"])
+            if request["method"] == "eth_subscribe":
+                connection.send(
+                    json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": SUBSCRIPTION_ID})
+                )
+                self.connections.append(connection)
+        if connection in self.connections:
+            self.connections.remove(connection)
+
+
+class CountingRpcProvider(JSONBaseProvider):
+    """HTTP JSON-RPC stand-in that records the methods called."""
+
+    def __init__(self, results: dict[str, object]):
+        super().__init__()
+        self.results = results
+        self.methods: list[str] = []
+
+    def make_request(self, method, params):
+        """Serve a single request."""
+        self.methods.append(method)
+        result = self.results[method]
+        return {"jsonrpc": "2.0", "id": 0, "result": result(params) if callable(result) else result}
+
+    def make_batch_request(self, requests):
+        """Serve a batch request."""
+        return [self.make_request(method, params) for method, params in requests]
+
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    """Wait for a condition to become true."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def server():
+    """Start a WebSocket JSON-RPC stand-in."""
+    server = WebSocketRpcServer()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def subscription(server):
+    """Subscribe to new heads from the stand-in."""
+    subscription = HeadSubscription(server.url)
+    assert subscription.wait_until_subscribed(5)
+    assert wait_for(lambda: server.connections)
+    yield subscription
+    subscription.close()
+
+
+def test_heads_delivered_to_listeners(server, subscription):
+    """Test that new heads reach listeners once, in order, and old heads are ignored."""
+    heads = []
+    subscription.add_listener(heads.append)
+
+    for block_number in (100, 101, 101, 99, 102):
+        server.push_head(block_number)
+
+    assert wait_for(lambda: heads == [100, 101, 102])
+    assert subscription.live_head() == 102
+    assert server.requests == ["eth_subscribe"]
+
+
+def test_reconnects_after_disconnect(server, subscription):
+    """Test that the feed is not live while disconnected and resubscribes afterwards."""
+    server.push_head(100)
+    assert wait_for(lambda: subscription.live_head() == 100)
+
+    server.disconnect()
+    assert wait_for(lambda: subscription.live_head() is None)
+
+    assert subscription.wait_until_subscribed(5)
+    assert wait_for(lambda: server.connections)
+    server.push_head(101)
+    assert wait_for(lambda: subscription.live_head() == 101)
+    assert server.requests == ["eth_subscribe", "eth_subscribe"]
+
+
+def test_fee_oracle_uses_subscription_head(server, subscription):
+    """Test that fee estimates use the subscription's head instead of eth_blockNumber."""
+    rpc = CountingRpcProvider({"eth_feeHistory": FEE_HISTORY, "eth_blockNumber": hex(100)})
+    oracle = FeeOracle(Web3(rpc), subscription)
+
+    server.push_head(100)
+    assert wait_for(lambda: subscription.live_head() == 100)
+    oracle.get_fee_estimate()
+    oracle.get_fee_estimate()
+
+    assert rpc.methods == ["eth_feeHistory"]
+
+
+def test_receipts_resolved_on_new_head(server, subscription):
+    """Test that pending receipts are checked when a head arrives, without polling the head."""
+    receipt = {"transactionHash": TX_HASH, "blockNumber": hex(101), "status": "0x1"}
+    mined = threading.Event()
+    rpc = CountingRpcProvider(
+        {
+            "eth_blockNumber": hex(100),
+            "eth_getTransactionReceipt": lambda params: receipt if mined.is_set() else None,
+        }
+    )
+    watcher = ReceiptWatcher(Web3(rpc), block_time=60, head_subscription=subscription)
+
+    server.push_head(100)
+    assert wait_for(lambda: subscription.live_head() == 100)
+
+    def mine():
+        time.sleep(0.1)
+        mined.set()
+        server.push_head(101)
+
+    threading.Thread(target=mine).start()
+    result = watcher.wait_for_transaction_receipt(TX_HASH, timeout=5)
+
+    assert result["blockNumber"] == 101
+    assert "eth_blockNumber" not in rpc.methods
+    assert rpc.methods.count("eth_getTransactionReceipt") == 2
+
+
+def test_read_cache_invalidated_by_subscription(server, subscription):
+    """Test that cached reads are dropped when a head arrives, without fetching the head."""
+    cache = ReadCache(head_refresh_interval=0)
+    cache.follow(subscription)
+    reads = []
+
+    def read():
+        return cache.read(
+            "balanceOf", "key", "latest", lambda: reads.append(1) or len(reads), lambda: 0
+        )
+
+    server.push_head(100)
+    assert wait_for(lambda: cache.head == 100)
+    assert read() == 1
+    assert read() == 1
+
+    server.push_head(101)
+    assert wait_for(lambda: cache.head == 101)
+    assert read() == 2
+
+
+def test_provider_follows_configured_websocket(server):
+    """Test that a provider with a WebSocket endpoint drives its fee oracle and receipts from it."""
+    with patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+        provider = EthAccountWalletProvider(
+            EthAccountWalletProviderConfig(
+                account=Account.create(), chain_id="84532", rpc=EvmRpcConfig(ws_url=server.url)
+            )
+        )
+
+    subscription = provider._fee_oracle._head_subscription
+    try:
+        assert subscription.url == server.url
+        assert provider._receipt_watcher._head_subscription is subscription
+        assert subscription.wait_until_subscribed(5)
+    finally:
+        # The fee oracle and receipt watcher are shared by every provider on the chain
+        provider._fee_oracle._head_subscription = None
+        provider._receipt_watcher._head_subscription = None
+        subscription.close()
@@ -0,0 +1,240 @@
+"""Tests for the local nonce manager."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from web3.exceptions import Web3RPCError
+
+from coinbase_agentkit.wallet_providers.nonce_manager import (
+    AsyncNonceManager,
+    NonceManager,
+    is_already_known,
+    is_nonce_error,
+    is_rejected_before_broadcast,
+)
+from coinbase_agentkit.wallet_providers.rpc_batch import BroadcastError
+
+MOCK_CHAIN_NONCE = 7
+
+
+def test_next_nonce_syncs_once():
+    """Test that the nonce is fetched from chain once and then incremented locally."""
+    fetch_nonce = Mock(return_value=MOCK_CHAIN_NONCE)
+    manager = NonceManager(fetch_nonce)
+
+    assert [manager.next_nonce() for _ in range(3)] == [7, 8, 9]
+    fetch_nonce.assert_called_once()
+
+
+def test_next_nonce_concurrent_allocations_are_unique():
+    """Test that concurrent allocations never hand out the same nonce."""
+    manager = NonceManager(Mock(return_value=0))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        nonces = list(executor.map(lambda _: manager.next_nonce(), range(200)))
+
+    assert sorted(nonces) == list(range(200))
+
+
+def test_reset_resyncs_from_chain():
+    """Test that a reset causes the next allocation to resync from chain."""
+    fetch_nonce = Mock(side_effect=[MOCK_CHAIN_NONCE, 3])
+    manager = NonceManager(fetch_nonce)
+
+    manager.next_nonce()
+    manager.reset()
+
+    assert manager.next_nonce() == 3
+    assert fetch_nonce.call_count == 2
+
+
+def test_send_retries_once_on_nonce_error():
+    """Test that a nonce error resyncs the counter and retries the send."""
+    manager = NonceManager(Mock(side_effect=[MOCK_CHAIN_NONCE, 9]))
+    send_with_nonce = Mock(side_effect=[Exception("nonce too low: next nonce 9"), "0xhash"])
+
+    assert manager.send(send_with_nonce) == "0xhash"
+    assert [call.args[0] for call in send_with_nonce.call_args_list] == [7, 9]
+    assert manager.next_nonce() == 10
+
+
+def test_send_many_allocates_consecutive_nonces():
+    """Test that a batch send gets a block of consecutive nonces."""
+    manager = NonceManager(Mock(return_value=MOCK_CHAIN_NONCE))
+
+    assert manager.send_many(3, lambda nonces: nonces) == [7, 8, 9]
+    assert manager.next_nonce() == 10
+
+
+def test_send_many_resyncs_without_retry():
+    """Test that a batch send failing with a nonce error moves the counter forward without retrying."""
+    fetch_nonce = Mock(side_effect=[MOCK_CHAIN_NONCE, 8])
+    manager = NonceManager(fetch_nonce)
+    send_with_nonces = Mock(side_effect=Exception("nonce too low"))
+
+    with pytest.raises(Exception, match="nonce too low"):
+        manager.send_many(2, send_with_nonces)
+
+    send_with_nonces.assert_called_once_with([7, 8])
+    # The chain is behind the local counter, which never moves back
+    assert manager.next_nonce() == 9
+
+
+def test_send_many_partial_failure_keeps_broadcast_nonces():
+    """Test that a partial broadcast failure only hands out the failed nonces again."""
+    manager = NonceManager(Mock(return_value=MOCK_CHAIN_NONCE))
+    error = BroadcastError(
+        ["0xa", None, "0xc", None],
+        [None, Web3RPCError("underpriced"), None, Web3RPCError("underpriced")],
+    )
+
+    with pytest.raises(BroadcastError):
+        manager.send_many(4, Mock(side_effect=error))
+
+    # 8 fills the gap below the broadcast nonce 9, and 10 goes back to the counter
+    assert [manager.next_nonce() for _ in range(3)] == [8, 10, 11]
+
+
+def test_send_releases_nonce_on_other_errors():
+    """Test that rejected sends are raised without a retry and their nonce is reused."""
+    fetch_nonce = Mock(return_value=MOCK_CHAIN_NONCE)
+    manager = NonceManager(fetch_nonce)
+    send_with_nonce = Mock(side_effect=Web3RPCError("insufficient funds"))
+
+    with pytest.raises(Exception, match="insufficient funds"):
+        manager.send(send_with_nonce)
+
+    send_with_nonce.assert_called_once_with(MOCK_CHAIN_NONCE)
+    assert manager.next_nonce() == MOCK_CHAIN_NONCE
+    fetch_nonce.assert_called_once()
+
+
+def test_send_resyncs_after_transport_errors():
+    """Test that a send that may have been broadcast resyncs instead of reusing its nonce."""
+    fetch_nonce = Mock(side_effect=[MOCK_CHAIN_NONCE, MOCK_CHAIN_NONCE + 1])
+    manager = NonceManager(fetch_nonce)
+    send_with_nonce = Mock(side_effect=TimeoutError("read timed out"))
+
+    with pytest.raises(TimeoutError):
+        manager.send(send_with_nonce)
+
+    send_with_nonce.assert_called_once_with(MOCK_CHAIN_NONCE)
+    assert fetch_nonce.call_count == 2
+    assert manager.next_nonce() == MOCK_CHAIN_NONCE + 1
+
+
+def test_send_many_resyncs_after_transport_errors():
+    """Test that a batch keeps the nonces of broadcasts that may have reached the node."""
+    manager = NonceManager(Mock(side_effect=[MOCK_CHAIN_NONCE, MOCK_CHAIN_NONCE]))
+    error = BroadcastError(
+        [None, None, "0xc"], [ConnectionResetError("reset"), Web3RPCError("underpriced"), None]
+    )
+
+    with pytest.raises(BroadcastError):
+        manager.send_many(3, Mock(side_effect=error))
+
+    # Only the rejected nonce 8 is reused, 7 may still be mined
+    assert [manager.next_nonce() for _ in range(2)] == [8, 10]
+
+
+def test_failed_resync_keeps_send_error():
+    """Test that the send's own error is raised when the resync after it fails too."""
+    manager = NonceManager(Mock(side_effect=[MOCK_CHAIN_NONCE, ConnectionError("offline")]))
+
+    with pytest.raises(TimeoutError):
+        manager.send(Mock(side_effect=TimeoutError("read timed out")))
+
+    assert manager.next_nonce() == MOCK_CHAIN_NONCE + 1
+
+
+def test_failed_send_does_not_reuse_in_flight_nonces():
+    """Test that a failure below nonces still in flight fills the gap without reusing them."""
+    manager = NonceManager(Mock(return_value=MOCK_CHAIN_NONCE))
+    assert [manager.next_nonce() for _ in range(2)] == [7, 8]
+
+    manager.release([7])
+
+    assert [manager.next_nonce() for _ in range(2)] == [7, 9]
+
+
+def test_resync_never_moves_counter_back():
+    """Test that a resync only moves the counter forward and drops released nonces the chain counted."""
+    manager = NonceManager(Mock(side_effect=[MOCK_CHAIN_NONCE, 8, 12]))
+    nonces = [manager.next_nonce() for _ in range(4)]
+    manager.release(nonces[:2])
+
+    manager.resync()
+    assert manager.next_nonce() == 8
+    assert manager.next_nonce() == 11
+
+    manager.resync()
+    assert manager.next_nonce() == 12
+
+
+def test_is_nonce_error():
+    """Test detection of nonce errors from node error messages."""
+    assert is_nonce_error(Exception("{'code': -32000, 'message': 'nonce too low'}"))
+    assert not is_nonce_error(Exception("already known"))
+    assert not is_nonce_error(Exception("execution reverted"))
+    assert is_already_known(Exception("{'code': -32000, 'message': 'already known'}"))
+    assert not is_already_known(Exception("nonce too low"))
+
+
+def test_is_rejected_before_broadcast():
+    """Test that only signing, estimation and JSON-RPC errors count as rejected before the broadcast."""
+    assert is_rejected_before_broadcast(Web3RPCError("insufficient funds"))
+    assert is_rejected_before_broadcast(ValueError("invalid transaction"))
+    assert not is_rejected_before_broadcast(TimeoutError("read timed out"))
+    assert not is_rejected_before_broadcast(ConnectionResetError("reset"))
+    assert not is_rejected_before_broadcast(Exception("unknown"))
+
+
+def test_async_next_nonce_concurrent_allocations_are_unique():
+    """Test that concurrent async allocations sync once and never share a nonce."""
+    fetch_nonce = AsyncMock(return_value=MOCK_CHAIN_NONCE)
+    manager = AsyncNonceManager(fetch_nonce)
+
+    async def allocate():
+        return await asyncio.gather(*(manager.next_nonce() for _ in range(50)))
+
+    assert sorted(asyncio.run(allocate())) == list(range(7, 57))
+    fetch_nonce.assert_awaited_once()
+
+
+def test_async_send_retries_on_nonce_error():
+    """Test that an async send is retried with a resynced nonce after a nonce error."""
+    manager = AsyncNonceManager(AsyncMock(side_effect=[MOCK_CHAIN_NONCE, MOCK_CHAIN_NONCE + 1]))
+    send_with_nonce = AsyncMock(side_effect=[Exception("nonce too low"), "0xhash"])
+
+    assert asyncio.run(manager.send(send_with_nonce)) == "0xhash"
+    assert [call.args[0] for call in send_with_nonce.call_args_list] == [7, 8]
+
+
+def test_async_send_releases_nonce_on_other_errors():
+    """Test that a failed async send is not retried and its nonce is handed out again."""
+    manager = AsyncNonceManager(AsyncMock(return_value=MOCK_CHAIN_NONCE))
+    send_with_nonce = AsyncMock(side_effect=Web3RPCError("insufficient funds"))
+
+    async def send():
+        with pytest.raises(Exception, match="insufficient funds"):
+            await manager.send(send_with_nonce)
+        return await manager.next_nonce()
+
+    assert asyncio.run(send()) == MOCK_CHAIN_NONCE
+    send_with_nonce.assert_awaited_once_with(MOCK_CHAIN_NONCE)
+
+
+def test_async_send_resyncs_after_transport_errors():
+    """Test that an async send that may have been broadcast resyncs instead of reusing its nonce."""
+    fetch_nonce = AsyncMock(side_effect=[MOCK_CHAIN_NONCE, MOCK_CHAIN_NONCE + 1])
+    manager = AsyncNonceManager(fetch_nonce)
+
+    async def send():
+        with pytest.raises(TimeoutError):
+            await manager.send(AsyncMock(side_effect=TimeoutError("read timed out")))
+        return await manager.next_nonce()
+
+    assert asyncio.run(send()) == MOCK_CHAIN_NONCE + 1
+    assert fetch_nonce.await_count == 2
@@ -0,0 +1,192 @@
+"""Tests for the head-aware read cache."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmReadCacheConfig
+from coinbase_agentkit.wallet_providers.read_cache import ReadCache
+
+MOCK_TOKEN_ADDRESS = "0x1234567890123456789012345678901234567890"
+ERC20_ABI = [
+    {
+        "inputs": [{"name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"name": "", "type": "uint8"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+class Chain:
+    """Stand-in for a chain whose head and state can be moved forward."""
+
+    def __init__(self):
+        self.head = 100
+        self.head_fetches = 0
+        self.reads = 0
+
+    def fetch_head(self) -> int:
+        """Return the head block number."""
+        self.head_fetches += 1
+        return self.head
+
+    def fetch(self):
+        """Perform a read that returns the number of reads so far."""
+        self.reads += 1
+        return self.reads
+
+
+@pytest.fixture
+def chain():
+    """Create a fake chain."""
+    return Chain()
+
+
+def read(cache: ReadCache, chain: Chain, function_name: str = "balanceOf", block="latest"):
+    """Read through the cache from the fake chain."""
+    return cache.read(function_name, ("token", "data"), block, chain.fetch, chain.fetch_head)
+
+
+def test_latest_reads_cached_until_new_head(chain):
+    """Test that reads against latest are served from the cache until the head advances."""
+    cache = ReadCache(head_refresh_interval=60)
+
+    assert read(cache, chain) == 1
+    assert read(cache, chain) == 1
+    assert chain.head_fetches == 1
+
+    cache.observe_head(101)
+    assert read(cache, chain) == 2
+
+    # An older head from a lagging endpoint does not invalidate
+    cache.observe_head(100)
+    assert read(cache, chain) == 2
+
+
+def test_head_refreshed_after_interval(chain):
+    """Test that the head is fetched again once the refresh interval passes."""
+    cache = ReadCache(head_refresh_interval=0.05)
+
+    assert read(cache, chain) == 1
+    chain.head = 101
+    time.sleep(0.06)
+
+    assert read(cache, chain) == 2
+    assert chain.head_fetches == 2
+    assert cache.head == 101
+
+
+def test_immutable_functions_survive_new_heads(chain):
+    """Test that immutable functions are cached permanently without fetching the head."""
+    cache = ReadCache(head_refresh_interval=60)
+
+    assert read(cache, chain, "decimals") == 1
+    cache.observe_head(200)
+
+    assert read(cache, chain, "decimals") == 1
+    assert chain.head_fetches == 0
+
+
+def test_mutable_fee_not_cached_permanently(chain):
+    """Test that a fee function is read again at a new head unless it is listed as immutable."""
+    cache = ReadCache(head_refresh_interval=60)
+
+    assert read(cache, chain, "fee") == 1
+    cache.observe_head(200)
+    assert read(cache, chain, "fee") == 2
+
+    pool_cache = ReadCache(immutable_functions=["fee"], head_refresh_interval=60)
+    assert read(pool_cache, chain, "fee") == 3
+    pool_cache.observe_head(300)
+    assert read(pool_cache, chain, "fee") == 3
+
+
+def test_function_ttl_override(chain):
+    """Test that functions with a TTL are cached for that long regardless of the head."""
+    cache = ReadCache(function_ttls={"slot0": 0.05}, head_refresh_interval=60)
+
+    assert read(cache, chain, "slot0") == 1
+    cache.observe_head(200)
+    assert read(cache, chain, "slot0") == 1
+
+    time.sleep(0.06)
+    assert read(cache, chain, "slot0") == 2
+
+
+def test_block_tags(chain):
+    """Test that fixed block reads are cached per block and pending reads are not cached."""
+    cache = ReadCache(head_refresh_interval=60)
+
+    assert read(cache, chain, block=50) == 1
+    assert read(cache, chain, block=50) == 1
+    assert read(cache, chain, block=51) == 2
+    assert read(cache, chain, block="pending") == 3
+    assert read(cache, chain, block="pending") == 4
+
+
+def test_least_recently_used_read_evicted(chain):
+    """Test that the cache keeps at most max_entries reads."""
+    cache = ReadCache(max_entries=2)
+
+    for block in (1, 2, 1, 3):
+        cache.read("balanceOf", "key", block, chain.fetch, chain.fetch_head)
+
+    assert cache.read("balanceOf", "key", 1, chain.fetch, chain.fetch_head) == 1
+    assert cache.read("balanceOf", "key", 2, chain.fetch, chain.fetch_head) == 4
+
+
+@pytest.fixture
+def wallet_provider(create_eth_account_provider):
+    """Create an eth-account wallet provider with a read cache and a mocked web3 backend."""
+    provider = create_eth_account_provider(read_cache=EvmReadCacheConfig(head_refresh_interval=60))
+    provider.web3 = Mock()
+    provider.web3.eth.block_number = 100
+    provider.web3.eth.call.side_effect = lambda transaction, block_identifier: Web3().codec.encode(
+        ["uint256"], [18]
+    )
+    provider.web3.eth.get_balance.return_value = 10**18
+    return provider
+
+
+def test_provider_reads_cached(wallet_provider):
+    """Test that the provider serves repeated reads and balances from the cache."""
+    holder = wallet_provider.get_address()
+    for _ in range(3):
+        assert wallet_provider.read_contract(MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [holder])
+        assert wallet_provider.read_contract(MOCK_TOKEN_ADDRESS, ERC20_ABI, "decimals") == 18
+        assert wallet_provider.get_balance() == 10**18
+
+    assert wallet_provider.web3.eth.call.call_count == 2
+    assert wallet_provider.web3.eth.get_balance.call_count == 1
+
+
+def test_receipt_invalidates_provider_reads(wallet_provider):
+    """Test that reads after a confirmed transaction are fetched from its block onwards."""
+    wallet_provider._receipt_watcher = Mock()
+    wallet_provider._receipt_watcher.wait_for_transaction_receipt.return_value = {
+        "blockNumber": 101
+    }
+
+    wallet_provider.get_balance()
+    wallet_provider.wait_for_transaction_receipt("0x01")
+    wallet_provider.get_balance()
+
+    assert wallet_provider.web3.eth.get_balance.call_count == 2
+
+
+def test_read_cache_disabled_by_default(create_eth_account_provider):
+    """Test that providers do not cache reads unless configured to."""
+    provider = create_eth_account_provider()
+
+    assert provider._read_cache is None
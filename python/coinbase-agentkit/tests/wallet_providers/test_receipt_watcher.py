@@ -0,0 +1,164 @@
+"""Tests for the shared receipt watcher."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+from web3.exceptions import TimeExhausted, Web3RPCError
+
+from coinbase_agentkit.wallet_providers.receipt_watcher import ReceiptWatcher, get_receipt_watcher
+from coinbase_agentkit.wallet_providers.rpc_pool import get_rpc_endpoint_pool
+
+FAST_BLOCK_TIME = 1
+MOCK_HASHES = ["0x" + f"{index:064x}" for index in range(1, 4)]
+
+
+def mock_receipt(tx_hash: str) -> dict:
+    """Build a raw JSON-RPC receipt for a transaction hash."""
+    return {
+        "transactionHash": tx_hash,
+        "blockHash": "0x" + "22" * 32,
+        "blockNumber": "0x10",
+        "status": "0x1",
+        "gasUsed": "0x5208",
+        "cumulativeGasUsed": "0x5208",
+        "transactionIndex": "0x0",
+        "from": "0x" + "33" * 20,
+        "to": "0x" + "44" * 20,
+        "contractAddress": None,
+        "logs": [],
+        "logsBloom": "0x" + "00" * 256,
+        "type": "0x2",
+        "effectiveGasPrice": "0x1",
+    }
+
+
+class MockChain:
+    """A chain whose transactions are mined when asked and whose head advances on demand."""
+
+    def __init__(self):
+        self.block_number = 1
+        self.mined: set[str] = set()
+        self.errors: dict[str, dict] = {}
+        self.batches: list[list[str]] = []
+        self.lock = threading.Lock()
+
+        self.web3 = Mock()
+        type(self.web3.eth).block_number = property(lambda _: self.block_number)
+        self.web3.provider.make_batch_request.side_effect = self.make_batch_request
+
+    def make_batch_request(self, requests):
+        """Answer a batch of receipt requests, with null results for unmined transactions."""
+        with self.lock:
+            hashes = [params[0] for _, params in requests]
+            self.batches.append(hashes)
+            return [
+                {"jsonrpc": "2.0", "id": index, "error": self.errors[tx_hash]}
+                if tx_hash in self.errors
+                else {
+                    "jsonrpc": "2.0",
+                    "id": index,
+                    "result": mock_receipt(tx_hash) if tx_hash in self.mined else None,
+                }
+                for index, tx_hash in enumerate(hashes)
+            ]
+
+    def mine(self, *tx_hashes: str):
+        """Mine transactions in a new block."""
+        with self.lock:
+            self.mined.update(tx_hashes)
+            self.block_number += 1
+
+
+@pytest.fixture
+def chain():
+    """Create a mock chain."""
+    return MockChain()
+
+
+def test_resolves_concurrent_waiters_with_batched_requests(chain):
+    """Test that concurrent waiters are served by batched receipt requests."""
+    watcher = ReceiptWatcher(chain.web3, block_time=FAST_BLOCK_TIME)
+
+    with ThreadPoolExecutor(max_workers=len(MOCK_HASHES)) as executor:
+        futures = [
+            executor.submit(watcher.wait_for_transaction_receipt, tx_hash, 5)
+            for tx_hash in MOCK_HASHES
+        ]
+        threading.Event().wait(0.1)
+        chain.mine(*MOCK_HASHES)
+        receipts = [future.result() for future in futures]
+
+    assert [receipt["transactionHash"].to_0x_hex() for receipt in receipts] == MOCK_HASHES
+    assert receipts[0]["status"] == 1
+    assert any(len(batch) == len(MOCK_HASHES) for batch in chain.batches)
+
+
+def test_only_polls_pending_hashes_on_new_blocks(chain):
+    """Test that checked hashes are not re-requested until the head advances."""
+    watcher = ReceiptWatcher(chain.web3, block_time=FAST_BLOCK_TIME)
+
+    with pytest.raises(TimeExhausted):
+        watcher.wait_for_transaction_receipt(MOCK_HASHES[0], timeout=0.7)
+
+    assert chain.batches == [[MOCK_HASHES[0]]]
+
+
+def test_accepts_bytes_hashes(chain):
+    """Test that hashes given as bytes are matched to their receipts."""
+    watcher = ReceiptWatcher(chain.web3, block_time=FAST_BLOCK_TIME)
+    chain.mine(MOCK_HASHES[0])
+
+    receipt = watcher.wait_for_transaction_receipt(bytes.fromhex(MOCK_HASHES[0][2:]), timeout=5)
+
+    assert receipt["transactionHash"].to_0x_hex() == MOCK_HASHES[0]
+
+
+def test_per_hash_errors_raised_to_their_waiters(chain):
+    """Test that an error for one hash fails its waiters while not-found errors keep waiting."""
+    watcher = ReceiptWatcher(chain.web3, block_time=FAST_BLOCK_TIME)
+    chain.errors[MOCK_HASHES[0]] = {"code": -32000, "message": "header for hash not available"}
+    chain.errors[MOCK_HASHES[1]] = {"code": -32000, "message": "transaction not found"}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(watcher.wait_for_transaction_receipt, tx_hash, 5)
+            for tx_hash in MOCK_HASHES
+        ]
+        with pytest.raises(Web3RPCError, match="header for hash not available"):
+            futures[0].result()
+
+        del chain.errors[MOCK_HASHES[1]]
+        chain.mine(*MOCK_HASHES[1:])
+        receipts = [future.result() for future in futures[1:]]
+
+    assert [receipt["transactionHash"].to_0x_hex() for receipt in receipts] == MOCK_HASHES[1:]
+
+
+def test_get_receipt_watcher_shared_per_endpoints():
+    """Test that providers share a watcher only when they use the same RPC endpoints."""
+    default_urls = ["https://default.example"]
+    watcher = get_receipt_watcher(
+        "test-chain", Web3(get_rpc_endpoint_pool("test-chain", default_urls))
+    )
+
+    assert (
+        get_receipt_watcher("test-chain", Web3(get_rpc_endpoint_pool("test-chain", default_urls)))
+        is watcher
+    )
+    custom = Web3(get_rpc_endpoint_pool("test-chain", ["https://custom.example"]))
+    assert get_receipt_watcher("test-chain", custom) is not watcher
+    assert get_receipt_watcher("test-chain", custom)._web3 is custom
+
+
+def test_get_receipt_watcher_shared_per_head_subscription():
+    """Test that a watcher follows the head subscription it was created for."""
+    web3 = Web3(get_rpc_endpoint_pool("test-chain", ["https://default.example"]))
+    subscription = Mock()
+    watcher = get_receipt_watcher("test-chain", web3, head_subscription=subscription)
+
+    assert get_receipt_watcher("test-chain", web3, head_subscription=subscription) is watcher
+    assert get_receipt_watcher("test-chain", web3, head_subscription=Mock()) is not watcher
+    subscription.add_listener.assert_called_once_with(watcher._on_new_head)
@@ -0,0 +1,320 @@
+"""Tests for batched JSON-RPC requests and batch sends in the wallet providers."""
+
+from unittest.mock import Mock
+
+import pytest
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+from web3.providers import JSONBaseProvider
+
+from coinbase_agentkit.wallet_providers.fee_oracle import FeeOracle
+from coinbase_agentkit.wallet_providers.nonce_manager import NonceManager
+from coinbase_agentkit.wallet_providers.rpc_batch import (
+    BroadcastError,
+    batch_request,
+    fetch_send_preparation,
+)
+
+MOCK_TO_ADDRESS = "0x1234567890123456789012345678901234567890"
+HEAD = 1_000_000
+FEE_HISTORY = {
+    "oldestBlock": hex(HEAD - 1),
+    "baseFeePerGas": ["0x64", "0x64", "0x6e"],
+    "gasUsedRatio": [0.5, 0.5],
+    "reward": [["0x1", "0xa", "0x14"], ["0x1", "0xa", "0x14"]],
+}
+
+
+class FakeRpcProvider(JSONBaseProvider):
+    """JSON-RPC provider that records requests and serves canned results."""
+
+    def __init__(self, results: dict[str, object]):
+        super().__init__()
+        self.results = results
+        self.requests: list[object] = []
+
+    def make_request(self, method, params):
+        """Serve a single request."""
+        self.requests.append((method, params))
+        result = self.results[method]
+        if callable(result):
+            result = result(params)
+        if isinstance(result, dict) and "code" in result:
+            return {"jsonrpc": "2.0", "id": 0, "error": result}
+        return {"jsonrpc": "2.0", "id": 0, "result": result}
+
+    def make_batch_request(self, requests):
+        """Serve a batch request, failing calls whose canned result is an error."""
+        self.requests.append(list(requests))
+        responses = []
+        for request_id, (method, _) in enumerate(requests):
+            result = self.results[method]
+            if isinstance(result, dict) and "code" in result:
+                responses.append({"jsonrpc": "2.0", "id": request_id, "error": result})
+            else:
+                responses.append({"jsonrpc": "2.0", "id": request_id, "result": result})
+        return responses
+
+
+def decode_transaction(raw_transaction: str) -> dict:
+    """Decode a raw signed transaction."""
+    return TypedTransaction.from_bytes(HexBytes(raw_transaction)).as_dict()
+
+
+def sent_raw_transactions(rpc: FakeRpcProvider) -> list[str]:
+    """Get the raw transactions broadcast through the fake RPC, in nonce order."""
+    raw_transactions = [
+        request[1][0]
+        for request in rpc.requests
+        if isinstance(request, tuple) and request[0] == "eth_sendRawTransaction"
+    ]
+    return sorted(raw_transactions, key=lambda raw: decode_transaction(raw)["nonce"])
+
+
+@pytest.fixture
+def rpc():
+    """Create a fake RPC with results for the send path."""
+    return FakeRpcProvider(
+        {
+            "eth_chainId": hex(84532),
+            "eth_feeHistory": FEE_HISTORY,
+            "eth_estimateGas": hex(21000),
+            "eth_getTransactionCount": "0x7",
+            "eth_sendRawTransaction": lambda params: Web3.to_hex(Web3.keccak(hexstr=params[0])),
+        }
+    )
+
+
+@pytest.fixture
+def wallet_provider(create_eth_account_provider, rpc):
+    """Create an eth-account wallet provider on the fake RPC."""
+    provider = create_eth_account_provider()
+    provider.web3.provider = rpc
+    # The shared fee oracle may hold an estimate from another test
+    provider._fee_oracle = FeeOracle(provider.web3)
+    return provider
+
+
+def test_batch_request_formats_params_and_results(rpc):
+    """Test that calls are sent as one batch with web3's request and result formatting."""
+    web3 = Web3(rpc)
+
+    results = batch_request(
+        web3,
+        [
+            ("eth_getTransactionCount", (MOCK_TO_ADDRESS, "pending")),
+            ("eth_estimateGas", ({"to": MOCK_TO_ADDRESS, "value": 10, "data": b"\x01"},)),
+        ],
+    )
+
+    assert results == [7, 21000]
+    assert rpc.requests == [
+        [
+            ("eth_getTransactionCount", [MOCK_TO_ADDRESS, "pending"]),
+            ("eth_estimateGas", ({"to": MOCK_TO_ADDRESS, "value": "0xa", "data": "0x01"},)),
+        ]
+    ]
+
+
+def test_batch_request_raises_call_errors(rpc):
+    """Test that a failed call raises the same error as an individual request."""
+    rpc.results["eth_estimateGas"] = {"code": 3, "message": "execution reverted", "data": "0x"}
+
+    with pytest.raises(ContractLogicError):
+        batch_request(Web3(rpc), [("eth_estimateGas", ({"to": MOCK_TO_ADDRESS},))])
+
+
+def test_batch_request_falls_back_without_batch_support():
+    """Test that providers without batch support get one request per call."""
+    web3 = Mock()
+    web3.provider.make_batch_request.side_effect = NotImplementedError
+    web3.manager.request_blocking.side_effect = [1, 2]
+
+    assert batch_request(web3, [("eth_blockNumber", ()), ("eth_chainId", ())]) == [1, 2]
+
+
+def test_fetch_send_preparation_syncs_nonce_once(rpc):
+    """Test that the transaction count is only batched until the nonce manager is synced."""
+    web3 = Web3(rpc)
+    fee_oracle = FeeOracle(web3)
+    nonce_manager = NonceManager(Mock(side_effect=AssertionError("nonce fetched separately")))
+
+    fee_estimate, gas_estimates = fetch_send_preparation(
+        web3, [{"to": MOCK_TO_ADDRESS}], fee_oracle, nonce_manager, MOCK_TO_ADDRESS
+    )
+    fetch_send_preparation(
+        web3, [{"to": MOCK_TO_ADDRESS}], fee_oracle, nonce_manager, MOCK_TO_ADDRESS
+    )
+
+    assert gas_estimates == [21000]
+    assert fee_estimate.block_number == HEAD
+    assert fee_estimate.base_fee_per_gas == 110
+    assert fee_estimate.max_priority_fee_per_gas() == 10
+    # The second batch only estimates gas, the fees are reused within the oracle's TTL
+    assert [len(batch) for batch in rpc.requests] == [3, 1]
+    assert nonce_manager.next_nonce() == 7
+
+
+def test_fetch_send_preparation_refetches_stale_fees(rpc):
+    """Test that fee history is batched again once the oracle's estimate may be out of date."""
+    web3 = Web3(rpc)
+    fee_oracle = FeeOracle(web3, ttl=0)
+    nonce_manager = NonceManager(Mock())
+    nonce_manager.sync(0)
+
+    for _ in range(2):
+        fetch_send_preparation(
+            web3, [{"to": MOCK_TO_ADDRESS}], fee_oracle, nonce_manager, MOCK_TO_ADDRESS
+        )
+
+    assert [[method for method, _ in batch] for batch in rpc.requests] == [
+        ["eth_feeHistory", "eth_estimateGas"],
+        ["eth_feeHistory", "eth_estimateGas"],
+    ]
+
+
+def test_fetch_send_preparation_reuses_fees_for_live_head(rpc):
+    """Test that fee history is left out of the batch while the oracle has fees for the head."""
+    web3 = Web3(rpc)
+    head_subscription = Mock()
+    head_subscription.live_head.return_value = HEAD
+    fee_oracle = FeeOracle(web3, head_subscription)
+    nonce_manager = NonceManager(Mock())
+    nonce_manager.sync(0)
+
+    first_estimate, _ = fetch_send_preparation(
+        web3, [{"to": MOCK_TO_ADDRESS}], fee_oracle, nonce_manager, MOCK_TO_ADDRESS
+    )
+    fee_estimate, gas_estimates = fetch_send_preparation(
+        web3, [{"to": MOCK_TO_ADDRESS}], fee_oracle, nonce_manager, MOCK_TO_ADDRESS
+    )
+
+    assert fee_estimate is first_estimate
+    assert gas_estimates == [21000]
+    assert [[method for method, _ in batch] for batch in rpc.requests] == [
+        ["eth_feeHistory", "eth_estimateGas"],
+        ["eth_estimateGas"],
+    ]
+
+
+def test_send_transaction_prepares_in_one_batch(wallet_provider, rpc):
+    """Test that a send makes one batch request for preparation, then broadcasts."""
+    tx_hash = wallet_provider.send_transaction({"to": MOCK_TO_ADDRESS, "value": 1})
+
+    assert tx_hash == Web3.to_hex(Web3.keccak(hexstr=sent_raw_transactions(rpc)[0]))
+
+    batches = [request for request in rpc.requests if isinstance(request, list)]
+    assert len(batches) == 1
+    assert [method for method, _ in batches[0]] == [
+        "eth_feeHistory",
+        "eth_estimateGas",
+        "eth_getTransactionCount",
+    ]
+    single_methods = [request[0] for request in rpc.requests if isinstance(request, tuple)]
+    assert single_methods == ["eth_sendRawTransaction"]
+
+
+def test_fetch_send_preparation_skips_transactions_with_gas(rpc):
+    """Test that transactions that set their own gas limit are not estimated."""
+    web3 = Web3(rpc)
+    nonce_manager = NonceManager(Mock())
+    nonce_manager.sync(0)
+
+    _, gas_estimates = fetch_send_preparation(
+        web3,
+        [{"to": MOCK_TO_ADDRESS}, {"to": MOCK_TO_ADDRESS, "gas": 50000}, {"to": MOCK_TO_ADDRESS}],
+        FeeOracle(web3),
+        nonce_manager,
+        MOCK_TO_ADDRESS,
+    )
+
+    assert gas_estimates == [21000, None, 21000]
+    assert [method for method, _ in rpc.requests[0]] == [
+        "eth_feeHistory",
+        "eth_estimateGas",
+        "eth_estimateGas",
+    ]
+
+
+def test_send_transactions(wallet_provider, rpc):
+    """Test that several transactions are prepared in one batch and get consecutive nonces."""
+    tx_hashes = wallet_provider.send_transactions(
+        [
+            {"to": MOCK_TO_ADDRESS, "value": 1},
+            {"to": MOCK_TO_ADDRESS, "value": 2, "gas": 90000},
+            {"to": MOCK_TO_ADDRESS, "value": 3},
+        ]
+    )
+
+    batches = [request for request in rpc.requests if isinstance(request, list)]
+    assert len(batches) == 1
+    assert [method for method, _ in batches[0]] == [
+        "eth_feeHistory",
+        "eth_estimateGas",
+        "eth_estimateGas",
+        "eth_getTransactionCount",
+    ]
+
+    raw_transactions = sent_raw_transactions(rpc)
+    transactions = [decode_transaction(raw) for raw in raw_transactions]
+    assert [tx["nonce"] for tx in transactions] == [7, 8, 9]
+    assert [tx["value"] for tx in transactions] == [1, 2, 3]
+    assert [tx["gas"] for tx in transactions] == [int(21000 * 1.2), 90000, int(21000 * 1.2)]
+    assert {tx["maxFeePerGas"] for tx in transactions} == {120}
+    assert tx_hashes == [Web3.to_hex(Web3.keccak(hexstr=raw)) for raw in raw_transactions]
+
+
+def test_send_transactions_failure_releases_nonces(wallet_provider, rpc):
+    """Test that a failed broadcast raises and its nonces are reused by the next send."""
+    rpc.results["eth_sendRawTransaction"] = {"code": -32000, "message": "insufficient funds"}
+
+    with pytest.raises(Exception, match=r"Failed to send transaction 0: .*insufficient funds"):
+        wallet_provider.send_transactions([{"to": MOCK_TO_ADDRESS}, {"to": MOCK_TO_ADDRESS}])
+
+    assert wallet_provider._nonce_manager.next_nonce() == 7
+
+
+def test_send_transactions_partial_failure(wallet_provider, rpc):
+    """Test that a partial failure keeps the broadcast hashes and refills the failed nonce."""
+    broadcast = rpc.results["eth_sendRawTransaction"]
+
+    def fail_nonce_8(params):
+        if decode_transaction(params[0])["nonce"] == 8:
+            return {"code": -32000, "message": "insufficient funds"}
+        return broadcast(params)
+
+    rpc.results["eth_sendRawTransaction"] = fail_nonce_8
+
+    with pytest.raises(BroadcastError, match="Failed to send transaction 1") as exc_info:
+        wallet_provider.send_transactions([{"to": MOCK_TO_ADDRESS, "value": v} for v in range(3)])
+
+    raw_transactions = sent_raw_transactions(rpc)
+    broadcast_hashes = [
+        Web3.to_hex(Web3.keccak(hexstr=raw))
+        for raw in raw_transactions
+        if decode_transaction(raw)["nonce"] != 8
+    ]
+    assert exc_info.value.tx_hashes == [broadcast_hashes[0], None, broadcast_hashes[1]]
+    assert [error is not None for error in exc_info.value.errors] == [False, True, False]
+    assert [wallet_provider._nonce_manager.next_nonce() for _ in range(2)] == [8, 10]
+
+
+def test_send_transaction_already_known(wallet_provider, rpc):
+    """Test that a transaction the node already has returns its hash without being signed again."""
+    rpc.results["eth_sendRawTransaction"] = Mock(
+        side_effect=Exception("{'code': -32000, 'message': 'already known'}")
+    )
+
+    tx_hash = wallet_provider.send_transaction({"to": MOCK_TO_ADDRESS})
+
+    (raw_transaction,) = sent_raw_transactions(rpc)
+    assert tx_hash == Web3.to_hex(Web3.keccak(hexstr=raw_transaction))
+    assert wallet_provider._nonce_manager.next_nonce() == 8
+
+
+def test_send_transactions_empty(wallet_provider, rpc):
+    """Test that sending no transactions makes no requests."""
+    assert wallet_provider.send_transactions([]) == []
+    assert rpc.requests == []
@@ -0,0 +1,175 @@
+"""Tests for the RPC endpoint pool."""
+
+import threading
+import time
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from coinbase_agentkit.wallet_providers.rpc_pool import (
+    MAX_HEDGED_READS,
+    MIN_LATENCY_SAMPLES,
+    RpcEndpointPool,
+    get_rpc_endpoint_pool,
+)
+
+
+class FakeEndpointProvider:
+    """Stand-in for an HTTP provider with configurable latency and failures."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.delay = 0.0
+        self.fail = False
+        self.calls: list[str] = []
+        self.release = threading.Event()
+
+    def make_request(self, method, params):
+        """Answer a request with the endpoint's name."""
+        self.calls.append(method)
+        if self.delay:
+            self.release.wait(self.delay)
+        if self.fail:
+            raise RequestsConnectionError(f"{self.name} is down")
+        return {"jsonrpc": "2.0", "id": 0, "result": self.name}
+
+    def make_batch_request(self, requests):
+        """Answer each request in a batch with the endpoint's name."""
+        return [self.make_request(method, params) for method, params in requests]
+
+
+def create_pool(**kwargs) -> tuple[RpcEndpointPool, FakeEndpointProvider, FakeEndpointProvider]:
+    """Create a pool of two fake endpoints, with the first one measured as faster."""
+    pool = RpcEndpointPool(["https://a.example", "https://b.example"], **kwargs)
+    primary, secondary = FakeEndpointProvider("a"), FakeEndpointProvider("b")
+    pool.endpoints[0].provider = primary
+    pool.endpoints[1].provider = secondary
+
+    for _ in range(MIN_LATENCY_SAMPLES):
+        pool.endpoints[0].record_success(0.01)
+        pool.endpoints[1].record_success(0.05)
+
+    return pool, primary, secondary
+
+
+def test_reads_go_to_fastest_endpoint():
+    """Test that reads are routed to the endpoint with the lowest latency."""
+    pool, _primary, secondary = create_pool()
+
+    assert pool.make_request("eth_blockNumber", [])["result"] == "a"
+    assert secondary.calls == []
+
+
+def test_slow_read_is_hedged():
+    """Test that a read slower than the endpoint's p95 is also sent to the next endpoint."""
+    pool, primary, _secondary = create_pool()
+    primary.delay = 5
+
+    started = time.monotonic()
+    response = pool.make_request("eth_call", [])
+    primary.release.set()
+
+    assert response["result"] == "b"
+    assert time.monotonic() - started < 1
+
+
+def test_hedging_disabled():
+    """Test that slow reads wait for the first endpoint when hedging is off."""
+    pool, primary, secondary = create_pool(hedge_requests=False)
+    primary.delay = 0.2
+
+    assert pool.make_request("eth_call", [])["result"] == "a"
+    assert secondary.calls == []
+    assert pool._executor is None
+
+
+def test_unhedged_reads_sent_from_calling_thread():
+    """Test that reads are sent inline when there is one endpoint or every hedging slot is taken."""
+    pool = RpcEndpointPool(["https://a.example"])
+    only = FakeEndpointProvider("a")
+    pool.endpoints[0].provider = only
+
+    assert pool.make_request("eth_call", [])["result"] == "a"
+    assert pool._executor is None
+
+    pool, primary, secondary = create_pool()
+    primary.delay = 0.2
+    pool._hedged_reads = MAX_HEDGED_READS
+
+    assert pool.make_request("eth_call", [])["result"] == "a"
+    assert secondary.calls == []
+    assert pool._executor is None
+
+
+def test_failed_read_fails_over():
+    """Test that a failed read is retried on the next endpoint."""
+    pool, primary, _secondary = create_pool()
+    primary.fail = True
+
+    assert pool.make_request("eth_call", [])["result"] == "b"
+    assert pool.endpoints[0].consecutive_failures == 1
+
+
+def test_all_endpoints_failing_raises():
+    """Test that the last error is raised when every endpoint fails."""
+    pool, primary, secondary = create_pool()
+    primary.fail = secondary.fail = True
+
+    with pytest.raises(RequestsConnectionError, match="is down"):
+        pool.make_request("eth_call", [])
+
+
+def test_circuit_opens_and_recovers():
+    """Test that a failing endpoint leaves rotation and returns after a successful trial."""
+    pool, primary, _secondary = create_pool(failure_threshold=2, recovery_timeout=60)
+    primary.fail = True
+    pool.make_request("eth_call", [])
+    pool.make_request("eth_call", [])
+
+    assert pool.endpoints[0].is_open
+    calls = len(primary.calls)
+    assert pool.make_request("eth_call", [])["result"] == "b"
+    assert len(primary.calls) == calls
+
+    primary.fail = False
+    pool.endpoints[0]._opened_at -= 61
+
+    assert pool.make_request("eth_call", [])["result"] == "a"
+    assert not pool.endpoints[0].is_open
+
+
+def test_send_path_is_sticky():
+    """Test that send path requests stay on one endpoint until its circuit opens."""
+    pool, primary, secondary = create_pool(failure_threshold=1)
+
+    assert pool.make_request("eth_getTransactionCount", [])["result"] == "a"
+
+    # The second endpoint becomes faster, reads follow it but the send path does not
+    for _ in range(MIN_LATENCY_SAMPLES):
+        pool.endpoints[1].record_success(0.001)
+    assert pool.make_request("eth_call", [])["result"] == "b"
+    assert pool.make_request("eth_sendRawTransaction", [])["result"] == "a"
+    assert pool.make_batch_request([("eth_getTransactionCount", [])])[0]["result"] == "a"
+
+    primary.fail = True
+    with pytest.raises(RequestsConnectionError):
+        pool.make_request("eth_sendRawTransaction", [])
+    assert secondary.calls.count("eth_sendRawTransaction") == 0
+
+    assert pool.make_request("eth_sendRawTransaction", [])["result"] == "b"
+
+
+def test_get_rpc_endpoint_pool_shared():
+    """Test that pools are shared per chain and settings."""
+    urls = ["https://a.example"]
+    pool = get_rpc_endpoint_pool("test-chain", urls)
+
+    assert get_rpc_endpoint_pool("test-chain", urls) is pool
+    assert get_rpc_endpoint_pool("test-chain", urls, hedge_requests=False) is not pool
+    assert get_rpc_endpoint_pool("other-test-chain", urls) is not pool
+
+
+def test_requires_urls():
+    """Test that a pool needs at least one endpoint."""
+    with pytest.raises(ValueError, match="At least one RPC URL is required"):
+        RpcEndpointPool([])
@@ -0,0 +1,123 @@
+"""Tests for coalescing identical concurrent reads."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.wallet_providers.single_flight import AsyncSingleFlight, SingleFlight
+
+MOCK_TOKEN_ADDRESS = "0x1234567890123456789012345678901234567890"
+ERC20_ABI = [
+    {
+        "inputs": [{"name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    }
+]
+
+
+def test_concurrent_calls_share_one_call():
+    """Test that callers arriving while a call is in flight receive its result."""
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    def do():
+        return group.do("key", fn)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(do) for _ in range(4)]
+        threading.Timer(0.1, release.set).start()
+        results = [future.result(5) for future in futures]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+
+
+def test_errors_are_shared_and_keys_released():
+    """Test that followers receive the leader's error and later calls run again."""
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fail():
+        release.wait(5)
+        raise Exception("execution reverted")
+
+    def do():
+        try:
+            return group.do("key", fail)
+        except Exception as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(do) for _ in range(3)]
+        threading.Timer(0.1, release.set).start()
+        assert [future.result(5) for future in futures] == ["execution reverted"] * 3
+
+    assert group.do("key", lambda: "fresh") == "fresh"
+    assert group.do("other", lambda: "other") == "other"
+
+
+def test_async_concurrent_calls_share_one_call():
+    """Test that concurrent coroutines share one call and cancelling one does not cancel it."""
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        cancelled = asyncio.ensure_future(group.do("key", fn))
+        others = [asyncio.ensure_future(group.do("key", fn)) for _ in range(3)]
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await asyncio.gather(*others)
+
+    assert asyncio.run(main()) == ["result"] * 3
+    assert len(calls) == 1
+
+
+@pytest.fixture
+def wallet_provider(create_eth_account_provider):
+    """Create an eth-account wallet provider with a mocked web3 backend."""
+    provider = create_eth_account_provider()
+    provider.web3 = Mock()
+    return provider
+
+
+def test_read_contract_coalesces_identical_reads(wallet_provider):
+    """Test that identical concurrent reads share one eth_call and different args do not."""
+    release = threading.Event()
+
+    def call(transaction, block_identifier):
+        release.wait(5)
+        return Web3().codec.encode(["uint256"], [42])
+
+    wallet_provider.web3.eth.call.side_effect = call
+
+    def read(holder: str):
+        return lambda: wallet_provider.read_contract(
+            MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [holder]
+        )
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(read("0x" + "1" * 40)) for _ in range(4)]
+        futures.append(executor.submit(read("0x" + "2" * 40)))
+        threading.Timer(0.1, release.set).start()
+        results = [future.result(5) for future in futures]
+
+    assert results == [42] * 5
+    assert wallet_provider.web3.eth.call.call_count == 2
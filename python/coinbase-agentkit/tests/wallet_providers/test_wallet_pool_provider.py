@@ -0,0 +1,274 @@
+"""Tests for the wallet pool provider."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from coinbase_agentkit import ActionProvider, create_action
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider, WalletPoolProvider, sender_scope
+
+MOCK_TO_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def make_lane(index: int, network_id: str = "base-sepolia") -> Mock:
+    """Create a mock account provider whose sends return hashes naming the account."""
+    lane = Mock(spec=EvmWalletProvider)
+    address = f"0x{index + 1:040x}"
+    lane.get_address.return_value = address
+    lane.get_network.return_value = Network(
+        protocol_family="evm", network_id=network_id, chain_id="84532"
+    )
+    lane.get_balance.return_value = Decimal(10**18)
+    lane.get_wallet_metadata.side_effect = lambda: {
+        "wallet_provider": "eth_account_wallet_provider",
+        "wallet_address": address,
+        "network_id": network_id,
+        "chain_id": "84532",
+        "protocol_family": "evm",
+    }
+    lane.send_transaction.side_effect = lambda transaction: f"{address}:{transaction['value']}"
+    lane.send_transactions.side_effect = lambda transactions: [
+        f"{address}:{transaction['value']}" for transaction in transactions
+    ]
+    return lane
+
+
+def make_pool(lanes: list[Mock]) -> WalletPoolProvider:
+    """Create a pool over mock account providers."""
+    with patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"):
+        return WalletPoolProvider(lanes)
+
+
+@pytest.fixture
+def lanes():
+    """Create three mock account providers."""
+    return [make_lane(index) for index in range(3)]
+
+
+@pytest.fixture
+def pool(lanes):
+    """Create a pool over the mock account providers."""
+    return make_pool(lanes)
+
+
+def test_invalid_pools_rejected():
+    """Test that empty pools and pools spanning networks are rejected."""
+    with pytest.raises(ValueError, match="At least one"):
+        make_pool([])
+
+    with pytest.raises(ValueError, match="same network"):
+        make_pool([make_lane(0), make_lane(1, network_id="base-mainnet")])
+
+
+class EmptySchema(BaseModel):
+    """Schema for test actions."""
+
+
+class DepositActionProvider(ActionProvider):
+    """Action provider with an action that sends two dependent transactions."""
+
+    def __init__(self):
+        super().__init__("deposit", [])
+
+    @create_action(name="deposit", description="Approve and deposit", schema=EmptySchema)
+    def deposit(self, wallet_provider: EvmWalletProvider, args: dict) -> list[str]:
+        """Send an approval and a deposit, and report the address that sent them."""
+        return [
+            wallet_provider.get_address(),
+            wallet_provider.send_transaction({"to": MOCK_TO_ADDRESS, "value": 1}),
+            wallet_provider.send_transaction({"to": MOCK_TO_ADDRESS, "value": 2}),
+        ]
+
+    def supports_network(self, network: Network) -> bool:
+        """Support every network."""
+        return True
+
+
+def test_sends_outside_scope_use_reported_address(pool, lanes):
+    """Test that sends without a sender key or scope come from the address the pool reports."""
+    address = pool.get_address()
+
+    assert address == lanes[0].get_address()
+    assert pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": 1}) == f"{address}:1"
+    assert pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": 2}) == f"{address}:2"
+
+
+def test_scope_acts_as_one_account(pool, lanes):
+    """Test that inside a sender scope the address, balance and every send use one account."""
+    pool._lanes[0].in_flight = 1
+
+    with sender_scope():
+        address = pool.get_address()
+        assert address == lanes[1].get_address()
+        assert pool.get_balance() == Decimal(10**18)
+        assert pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": 1}) == f"{address}:1"
+        assert pool.send_transactions(
+            [{"to": MOCK_TO_ADDRESS, "value": 2}, {"to": MOCK_TO_ADDRESS, "value": 3}]
+        ) == [f"{address}:2", f"{address}:3"]
+        pool.sign_message("hello")
+
+    lanes[1].sign_message.assert_called_once_with("hello")
+    assert pool.get_address() == lanes[0].get_address()
+
+
+def test_action_sends_from_one_account(pool, lanes):
+    """Test that the transactions of one action come from the address the action sees."""
+    action = DepositActionProvider().get_actions(pool)[0]
+    pool._lanes[0].in_flight = 1
+
+    address, *tx_hashes = action.invoke({})
+
+    assert address == lanes[1].get_address()
+    assert tx_hashes == [f"{address}:1", f"{address}:2"]
+    assert not pool._scope_lanes
+
+
+def test_scopes_pinned_to_least_busy_account(pool, lanes):
+    """Test that a new sender scope gets an idle account while the others are busy."""
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def block(transaction):
+        started.release()
+        release.wait(5)
+        return "0xblocked"
+
+    lanes[0].send_transaction.side_effect = block
+    lanes[1].send_transaction.side_effect = block
+
+    def send_in_scope(value: int) -> None:
+        with sender_scope():
+            pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": value})
+
+    threads = [threading.Thread(target=send_in_scope, args=(value,)) for value in range(2)]
+    for thread in threads:
+        thread.start()
+    assert started.acquire(timeout=5)
+    assert started.acquire(timeout=5)
+
+    try:
+        with sender_scope():
+            assert (
+                pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": 7})
+                == f"{lanes[2].get_address()}:7"
+            )
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert all(lane.in_flight == 0 for lane in pool._lanes)
+
+
+def test_sender_pinned_to_one_account(pool, lanes):
+    """Test that every send for a sender key comes from the same account."""
+    pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": 1}, sender="strategy-a")
+    pool.send_transactions(
+        [{"to": MOCK_TO_ADDRESS, "value": 2}, {"to": MOCK_TO_ADDRESS, "value": 3}],
+        sender="strategy-a",
+    )
+
+    senders = [
+        lane for lane in lanes if lane.send_transaction.called or lane.send_transactions.called
+    ]
+    assert len(senders) == 1
+    assert pool.for_sender("strategy-a") is senders[0]
+
+
+def test_concurrent_scopes_spread_before_sending(pool, lanes):
+    """Test that scopes looking up the address before their first send get different accounts."""
+    looked_up = threading.Barrier(len(lanes))
+
+    def act(value: int) -> tuple[str, str]:
+        with sender_scope():
+            address = pool.get_address()
+            looked_up.wait(5)
+            return address, pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": value})
+
+    with ThreadPoolExecutor(max_workers=len(lanes)) as executor:
+        results = list(executor.map(act, range(len(lanes))))
+
+    assert sorted(address for address, _ in results) == [lane.get_address() for lane in lanes]
+    assert all(tx_hash == f"{address}:{value}" for value, (address, tx_hash) in enumerate(results))
+    assert not pool._scope_lanes
+
+
+def test_sender_keys_bounded(pool):
+    """Test that the pool only remembers the most recently used sender keys."""
+    with patch("coinbase_agentkit.wallet_providers.wallet_pool_provider.MAX_SENDER_KEYS", 2):
+        for key in ["a", "b", "a", "c"]:
+            pool.send_transaction({"to": MOCK_TO_ADDRESS, "value": 1}, sender=key)
+
+    assert list(pool._sender_lanes) == ["a", "c"]
+
+
+def test_addresses_resolved_lazily(lanes):
+    """Test that building a pool does not wait for accounts whose wallets load lazily."""
+    loaded = Future()
+    for lane in lanes:
+        lane.load_wallet = Mock(return_value=loaded)
+
+    with patch(
+        "coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"
+    ) as mock_send_analytics_event:
+        pool = WalletPoolProvider(lanes)
+        for lane in lanes:
+            lane.get_address.assert_not_called()
+        mock_send_analytics_event.assert_not_called()
+
+        loaded.set_result(Mock())
+        assert mock_send_analytics_event.call_args.args[0]["wallet_address"] == (
+            lanes[0].get_address()
+        )
+
+    pool.send_transaction({"from": lanes[1].get_address(), "value": 1})
+    lanes[1].send_transaction.assert_called_once()
+
+
+def test_from_address_selects_account(pool, lanes):
+    """Test that a transaction naming a pool account in "from" is sent by that account."""
+    address = lanes[2].get_address()
+
+    assert pool.send_transaction({"from": address.upper(), "value": 1}) == f"{address}:1"
+
+    pool.sign_transaction({"from": address, "value": 1})
+    lanes[2].sign_transaction.assert_called_once()
+
+
+def test_batch_split_across_accounts_in_order(pool, lanes):
+    """Test that a batch is spread over every account and hashes come back in order."""
+    transactions = [{"to": MOCK_TO_ADDRESS, "value": value} for value in range(6)]
+
+    tx_hashes = pool.send_transactions(transactions)
+
+    assert [tx_hash.split(":")[1] for tx_hash in tx_hashes] == [str(v) for v in range(6)]
+    for lane in lanes:
+        assert len(lane.send_transactions.call_args.args[0]) == 2
+
+
+def test_balances_combined(pool, lanes):
+    """Test that the pool's balance is the sum of its accounts' balances."""
+    lanes[1].get_balance.return_value = Decimal(5)
+
+    assert pool.get_balance() == Decimal(2 * 10**18 + 5)
+    assert pool.get_addresses() == [lane.get_address() for lane in lanes]
+    assert pool.get_address() == lanes[0].get_address()
+    assert pool.get_name() == "wallet_pool_provider"
+
+
+def test_wallet_metadata_follows_scope(pool, lanes):
+    """Test that analytics metadata reports the account of the current sender scope."""
+    assert pool.get_wallet_metadata()["wallet_address"] == lanes[0].get_address()
+    pool._lanes[0].in_flight = 1
+
+    with sender_scope():
+        metadata = pool.get_wallet_metadata()
+        assert metadata["wallet_address"] == lanes[1].get_address()
+        assert metadata["wallet_provider"] == "wallet_pool_provider"
+
+    assert pool.get_wallet_metadata()["wallet_address"] == lanes[0].get_address()